@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+from series_schema import GENESIS_DATE
+from utils import fit_power_law, calculate_daily_power_law
+from chart_pyramid import build_pyramid, AGG_LEVELS
+
+# ===== DERIVED ANALYTICS =====
+# Everything the pages show that is computed from the series rather than read
+# from them. The registry computes these on first use per data version; the
+# precompute job runs the same functions ahead of time (see precompute.py).
+
+# Power-law fits the pages use, as (dataset, y_col, x_col)
+FIT_SPECS = [
+    ('price', 'Price', None),
+    ('hashrate', 'Hashrate_PH', None),
+    ('marketcap', 'MarketCap_B', None),
+    ('volume', 'Volume_USD', None),
+    ('volume', 'Price', 'Volume_USD'),
+    ('price_hashrate', 'Price', 'Hashrate_PH'),
+    ('price_hashrate', 'Price_Hashrate_Ratio', 'Days_Since_Genesis'),
+]
+
+# Expanding-window slope histories, as (dataset, y_col)
+DAILY_POWER_LAW_SPECS = [
+    ('volume', 'Volume_USD'),
+]
+
+# Deviation band multipliers drawn around each fit: -60%/+120% unless listed
+DEFAULT_FIT_BANDS = (0.4, 2.2)
+FIT_BANDS = {
+    ('volume', 'Price', 'Volume_USD'): (0.5, 1.5),
+}
+
+DEVIATION_WINDOW = 30
+
+def fit_key(dataset, y_col, x_col=None):
+    return f"{dataset}:{y_col}:{x_col or 'days_from_genesis'}"
+
+def merge_price_hashrate(hashrate_df, price_df):
+    """
+    Daily hashrate left-joined with price on the normalized date, plus
+    Price_Hashrate_Ratio and Days_Since_Genesis. Price is NaN on days without
+    a price.
+    """
+    df = hashrate_df.copy(deep=False)
+    df['Date'] = pd.to_datetime(df['Date']).dt.normalize()
+    price_df = price_df[['Date', 'Price']].copy()
+    price_df['Date'] = pd.to_datetime(price_df['Date']).dt.normalize()
+    price_df = price_df.drop_duplicates('Date', keep='last')
+
+    merged_df = pd.merge(df, price_df, on='Date', how='left')
+    merged_df['Price_Hashrate_Ratio'] = merged_df['Price'] / merged_df['Hashrate_PH']
+    merged_df['Days_Since_Genesis'] = (merged_df['Date'] - GENESIS_DATE).dt.days + 1  # +1 to avoid log(0)
+    return merged_df
+
+def positive_marketcap(marketcap_df):
+    """The market cap page leaves out days recorded as 0"""
+    return marketcap_df[marketcap_df['MarketCap_B'] > 0].reset_index(drop=True)
+
+def daily_power_law(df, y_col):
+    df = df.copy(deep=False)
+    df['Date'] = pd.to_datetime(df['Date']).dt.normalize()
+    return calculate_daily_power_law(df, y_col=y_col)
+
+def ratio_deviation(merged_df, a, b, window=DEVIATION_WINDOW):
+    """
+    Days with both hashrate and price, with the price/hashrate ratio's
+    percentage deviation from its power-law trend a*days^b (Ratio_Deviation_Pct)
+    and a rolling mean +/- 2 standard deviation band around it
+    """
+    df = merged_df.dropna(subset=['Hashrate_PH', 'Price']).reset_index(drop=True)
+    df['Expected_Ratio'] = a * np.power(df['Days_Since_Genesis'], b)
+    df['Ratio_Deviation_Pct'] = (df['Price_Hashrate_Ratio'] - df['Expected_Ratio']) / df['Expected_Ratio'] * 100
+
+    window = min(window, len(df))
+    df['Deviation_MA'] = df['Ratio_Deviation_Pct'].rolling(window).mean()
+    df['Deviation_Std'] = df['Ratio_Deviation_Pct'].rolling(window).std()
+    df['Upper_Band'] = df['Deviation_MA'] + 2 * df['Deviation_Std']
+    df['Lower_Band'] = df['Deviation_MA'] - 2 * df['Deviation_Std']
+    return df
+
+def price_residuals(merged_df, a, b):
+    """Days with both hashrate and price, with price's percentage deviation from the a*hashrate^b fit"""
+    df = merged_df.dropna(subset=['Hashrate_PH', 'Price']).reset_index(drop=True)
+    df['Expected_Price'] = a * np.power(df['Hashrate_PH'], b)
+    df['Price_Deviation_Pct'] = (df['Price'] - df['Expected_Price']) / df['Expected_Price'] * 100
+    return df
+
+# ===== BATCH =====
+def build_datasets(series):
+    """Every registry dataset from the four series frames, as the registry builds them"""
+    datasets = dict(series)
+    datasets['price_hashrate'] = merge_price_hashrate(series['hashrate'], series['price'])
+    datasets['marketcap_positive'] = positive_marketcap(series['marketcap'])
+    return datasets
+
+def build_artifacts(series):
+    """
+    (frames, fits) with every derived analytic the pages use, computed from
+    the series frames: frames maps artifact names to DataFrames and fits maps
+    fit_key names to (a, b, r2)
+    """
+    datasets = build_datasets(series)
+    frames = {'price_hashrate': datasets['price_hashrate']}
+    fits = {fit_key(*spec): tuple(float(v) for v in fit_power_law(datasets[spec[0]], y_col=spec[1], x_col=spec[2]))
+            for spec in FIT_SPECS}
+
+    for dataset, y_col in DAILY_POWER_LAW_SPECS:
+        frames[f'daily_power_law:{dataset}:{y_col}'] = daily_power_law(datasets[dataset], y_col)
+
+    a, b, _ = fits[fit_key('price_hashrate', 'Price_Hashrate_Ratio', 'Days_Since_Genesis')]
+    frames['ratio_deviation'] = ratio_deviation(datasets['price_hashrate'], a, b)
+    a, b, _ = fits[fit_key('price_hashrate', 'Price', 'Hashrate_PH')]
+    frames['price_residuals'] = price_residuals(datasets['price_hashrate'], a, b)
+
+    for dataset, df in datasets.items():
+        pyramid = build_pyramid(df)
+        for level in AGG_LEVELS:
+            frames[f'pyramid:{dataset}:{level}'] = pyramid.levels[level]
+    return frames, fits
@@ -0,0 +1,265 @@
+"""
+Read-only analytics API: the dashboard's series, fits, bands and oscillators over HTTP
+
+Runs as its own process next to the Streamlit server and reads everything
+through the data registry, so it shares the pages' refresher, series store and
+precomputed artifacts (point both at the same KASPA_SERIES_DIR and
+KASPA_ARTIFACT_DIR):
+
+    python api.py --port 8600
+    uvicorn api:app --port 8600 --workers 2
+
+Endpoints (all GET):
+
+    /datasets                       datasets with their columns, rows and date span
+    /series/{dataset}               rows; level=raw|daily|weekly|monthly, columns=a,b
+    /fits                           a, b, r2 and band multipliers of every fit the pages draw
+    /bands/{dataset}/{y_col}        fit curve samples with its deviation bands; x_col, points, log_x
+    /oscillators/{name}             ratio_deviation, price_residuals or daily_power_law
+
+Date-indexed frames take start and end (ISO dates, inclusive, UTC unless
+given) to return only that range. Frames come as JSON in pandas' split
+orientation, or as an Arrow IPC stream with format=arrow or
+Accept: application/vnd.apache.arrow.stream. Every response carries an ETag
+derived from the source series' change-probe signatures and the request, so
+If-None-Match revalidations return 304 without touching the data.
+"""
+import argparse
+import hashlib
+import json
+import os
+
+import numpy as np
+import pandas as pd
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+import data_registry
+from analytics import FIT_SPECS, FIT_BANDS, DEFAULT_FIT_BANDS, fit_key
+from chart_pyramid import AGG_LEVELS, level_slice
+from utils import power_law_curve, days_to_dates, FIT_CURVE_POINTS
+
+API_PORT = int(os.environ.get("KASPA_API_PORT", 8600))
+ARROW_STREAM = 'application/vnd.apache.arrow.stream'
+MAX_CURVE_POINTS = 5000
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+# ===== RESOURCES =====
+# Oscillators as (source dataset, getter); all are sorted by Date
+OSCILLATORS = {
+    'ratio_deviation': ('price_hashrate', data_registry.get_ratio_deviation),
+    'price_residuals': ('price_hashrate', data_registry.get_price_residuals),
+    'daily_power_law': ('volume', lambda: data_registry.get_daily_power_law('volume', 'Volume_USD')),
+}
+
+def _dataset(name):
+    if name not in data_registry.DATASETS:
+        raise ApiError(404, f"unknown dataset {name!r}; one of {', '.join(data_registry.DATASETS)}")
+    return name
+
+def _fit_spec(dataset, y_col, x_col):
+    spec = (dataset, y_col, x_col)
+    if spec not in FIT_SPECS:
+        raise ApiError(404, f"no fit for {fit_key(*spec)}; see /fits")
+    return spec
+
+def _bands(spec):
+    lower, upper = FIT_BANDS.get(spec, DEFAULT_FIT_BANDS)
+    return {'lower': lower, 'upper': upper}
+
+# ===== REQUEST PARSING =====
+def _date(request, name):
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    try:
+        date = pd.Timestamp(value)
+    except ValueError:
+        raise ApiError(400, f"{name}={value!r} is not a date")
+    return date.tz_localize('UTC') if date.tz is None else date
+
+def _int(request, name, default, lo, hi):
+    value = request.query_params.get(name)
+    try:
+        value = default if value is None else int(value)
+    except ValueError:
+        raise ApiError(400, f"{name} must be an integer")
+    if not lo <= value <= hi:
+        raise ApiError(400, f"{name} must be between {lo} and {hi}")
+    return value
+
+def _columns(request, df):
+    value = request.query_params.get('columns')
+    if not value:
+        return df
+    columns = [c for c in value.split(',') if c]
+    missing = [c for c in columns if c not in df.columns]
+    if missing:
+        raise ApiError(404, f"unknown columns {', '.join(missing)}")
+    # Date always leads, so ranges and joins keep working
+    return df[['Date'] + [c for c in columns if c != 'Date']] if 'Date' in df.columns else df[columns]
+
+def _date_range(df, start, end):
+    dates = df['Date']
+    lo = dates.searchsorted(start, side='left') if start is not None else 0
+    hi = dates.searchsorted(end, side='right') if end is not None else len(df)
+    return df.iloc[lo:hi]
+
+def _wants_arrow(request):
+    fmt = request.query_params.get('format')
+    if fmt is not None:
+        if fmt not in ('json', 'arrow'):
+            raise ApiError(400, "format must be json or arrow")
+        return fmt == 'arrow'
+    return ARROW_STREAM in request.headers.get('accept', '')
+
+# ===== RESPONSES =====
+def _etag(request, datasets, arrow):
+    """
+    Strong ETag over the datasets' probe signatures (their process-local
+    version where a source has no probe) and the request
+    """
+    state = []
+    for dataset in sorted(set(datasets)):
+        signatures = data_registry.source_signatures(dataset)
+        if any(signature is None for signature in signatures.values()):
+            signatures = {'version': data_registry.dataset_version(dataset)}
+        state.append([dataset, signatures])
+    query = sorted((k, v) for k, v in request.query_params.multi_items() if k != 'format')
+    key = json.dumps([state, request.url.path, query, arrow], default=str)
+    return '"' + hashlib.sha1(key.encode()).hexdigest()[:24] + '"'
+
+def _not_modified(request, etag):
+    matches = request.headers.get('if-none-match', '')
+    return etag in [tag.strip().removeprefix('W/') for tag in matches.split(',')] or matches.strip() == '*'
+
+def _frame_body(df, arrow):
+    if arrow:
+        import pyarrow as pa
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes(), ARROW_STREAM
+    return df.to_json(orient='split', index=False, date_format='iso', date_unit='s',
+                      double_precision=15).encode(), 'application/json'
+
+def _respond(request, datasets, build, frame=True):
+    """
+    Runs build() and returns its frame (or, with frame=False, its JSON-able
+    value), unless the client already holds this version
+    """
+    arrow = frame and _wants_arrow(request)
+    etag = _etag(request, datasets, arrow)
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept'}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    if not frame:
+        return JSONResponse(build(), headers=headers)
+    body, media_type = _frame_body(build(), arrow)
+    return Response(body, media_type=media_type, headers=headers)
+
+def _handler(endpoint):
+    # Sync endpoints, run in Starlette's thread pool like the registry's other callers
+    def handle(request):
+        try:
+            return endpoint(request)
+        except ApiError as e:
+            return JSONResponse({'error': str(e)}, status_code=e.status)
+    return handle
+
+# ===== ENDPOINTS =====
+def datasets(request):
+    def build():
+        result = {}
+        for name, get in data_registry.DATASETS.items():
+            df = get()
+            result[name] = {
+                'rows': len(df),
+                'start': df['Date'].iloc[0].isoformat() if len(df) else None,
+                'end': df['Date'].iloc[-1].isoformat() if len(df) else None,
+                'columns': {c: str(df[c].dtype) for c in df.columns},
+                'levels': ['raw'] + list(AGG_LEVELS),
+            }
+        return result
+    return _respond(request, data_registry.DATASETS, build, frame=False)
+
+def series(request):
+    dataset = _dataset(request.path_params['dataset'])
+    level = request.query_params.get('level', 'raw')
+    if level != 'raw' and level not in AGG_LEVELS:
+        raise ApiError(400, f"level must be raw or one of {', '.join(AGG_LEVELS)}")
+    start, end = _date(request, 'start'), _date(request, 'end')
+
+    def build():
+        df = level_slice(data_registry.get_pyramid(dataset), level, start, end)
+        return _columns(request, df)
+    return _respond(request, [dataset], build)
+
+def fits(request):
+    def build():
+        result = []
+        for spec in FIT_SPECS:
+            a, b, r2 = data_registry.get_power_law_fit(*spec)
+            result.append({'key': fit_key(*spec), 'dataset': spec[0], 'y_col': spec[1],
+                           'x_col': spec[2] or 'days_from_genesis',
+                           'a': float(a), 'b': float(b), 'r2': float(r2), 'bands': _bands(spec)})
+        return result
+    return _respond(request, {spec[0] for spec in FIT_SPECS}, build, frame=False)
+
+def bands(request):
+    x_col = request.query_params.get('x_col') or None
+    if x_col == 'days_from_genesis':
+        x_col = None
+    spec = _fit_spec(request.path_params['dataset'], request.path_params['y_col'], x_col)
+    points = _int(request, 'points', FIT_CURVE_POINTS, 2, MAX_CURVE_POINTS)
+    log_x = request.query_params.get('log_x', 'false').lower() in ('1', 'true', 'yes')
+
+    def build():
+        dataset, y_col, x_col = spec
+        a, b, _ = data_registry.get_power_law_fit(*spec)
+        x = data_registry.DATASETS[dataset]()[x_col or 'days_from_genesis']
+        x = x[x > 0]
+        x_fit, y_fit = power_law_curve(a, b, x.min(), x.max(), log_x=log_x, max_points=points)
+        multipliers = _bands(spec)
+        df = pd.DataFrame({'x': x_fit, 'fit': y_fit,
+                           'lower': y_fit * multipliers['lower'], 'upper': y_fit * multipliers['upper']})
+        if x_col is None:
+            df.insert(0, 'Date', days_to_dates(x_fit).to_numpy())
+        return df
+    return _respond(request, [spec[0]], build)
+
+def oscillators(request):
+    name = request.path_params['name']
+    if name not in OSCILLATORS:
+        raise ApiError(404, f"unknown oscillator {name!r}; one of {', '.join(OSCILLATORS)}")
+    dataset, get = OSCILLATORS[name]
+    start, end = _date(request, 'start'), _date(request, 'end')
+
+    def build():
+        df = get()
+        df = df.replace([np.inf, -np.inf], np.nan)
+        return _columns(request, _date_range(df, start, end))
+    return _respond(request, [dataset], build)
+
+app = Starlette(routes=[
+    Route('/datasets', _handler(datasets)),
+    Route('/series/{dataset}', _handler(series)),
+    Route('/fits', _handler(fits)),
+    Route('/bands/{dataset}/{y_col}', _handler(bands)),
+    Route('/oscillators/{name}', _handler(oscillators)),
+])
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=API_PORT)
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args()
+    import uvicorn
+    uvicorn.run('api:app' if args.workers > 1 else app, host=args.host, port=args.port, workers=args.workers)
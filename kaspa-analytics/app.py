@@ -1,5 +1,11 @@
 import streamlit as st
-from utils import load_data
+from data_registry import get_hashrate_data, get_refresher, registry_memory_usage, process_rss_bytes
+from data_sources import get_data_source
+from series_schema import ingest_reports
+from series_store import store_usage
+from figure_cache import get_figure_cache
+from theme import use_stylesheet
+from timing import start_rerun, timing_panel
 from datetime import datetime
 import plotly.graph_objects as go
 import numpy as np
@@ -10,389 +16,18 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded"
 )
+start_rerun('home')
 
 # Force dark mode on first visit
 if 'dark_mode' not in st.session_state:
     st.session_state.dark_mode = True
 
 # Enhanced Custom CSS with Modern Design matching Price6 page
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
-    
-    /* Global Reset and Base Styles */
-    * {
-        margin: 0;
-        padding: 0;
-        box-sizing: border-box;
-    }
-    
-    html, body, .stApp {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-        background: linear-gradient(135deg, #0a0e1a 0%, #1a1f2e 50%, #0f1419 100%);
-        color: #e2e8f0;
-        overflow-x: hidden;
-    }
-    
-    .stApp {
-        background-attachment: fixed;
-    }
-    
-    /* Remove Streamlit defaults */
-    .main .block-container {
-        padding: 2rem 1rem !important;
-        max-width: 100% !important;
-    }
-    
-    /* Animated Background Pattern */
-    .stApp::before {
-        content: '';
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background-image: 
-            radial-gradient(circle at 20% 80%, rgba(120, 119, 198, 0.15) 0%, transparent 50%),
-            radial-gradient(circle at 80% 20%, rgba(255, 119, 198, 0.15) 0%, transparent 50%),
-            radial-gradient(circle at 40% 40%, rgba(120, 219, 255, 0.15) 0%, transparent 50%);
-        pointer-events: none;
-        z-index: -1;
-        animation: backgroundShift 20s ease-in-out infinite;
-    }
-    
-    @keyframes backgroundShift {
-        0%, 100% { opacity: 1; transform: translateX(0px) translateY(0px); }
-        50% { opacity: 0.8; transform: translateX(20px) translateY(-20px); }
-    }
-    
-    /* Hide default Streamlit title */
-    h1[data-testid="stAppViewBlockContainer"] h1 {
-        display: none;
-    }
-    
-    /* Custom Hero Section */
-    .hero-container {
-        background: rgba(15, 20, 25, 0.9);
-        backdrop-filter: blur(25px);
-        border: 1px solid rgba(0, 212, 255, 0.2);
-        border-radius: 24px;
-        padding: 60px 40px;
-        margin: 20px 0 40px 0;
-        text-align: center;
-        position: relative;
-        overflow: hidden;
-        box-shadow: 0 16px 64px rgba(0, 0, 0, 0.4);
-    }
-    
-    .hero-container::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 1px;
-        background: linear-gradient(90deg, transparent, #00d4ff, #ff00a8, transparent);
-        opacity: 0.6;
-    }
-    
-    .hero-title {
-        font-size: 64px;
-        font-weight: 900;
-        background: linear-gradient(135deg, #00d4ff 0%, #ff00a8 50%, #00ff88 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin-bottom: 20px;
-        text-shadow: 0 0 40px rgba(0, 212, 255, 0.3);
-        line-height: 1.1;
-    }
-    
-    .hero-subtitle {
-        font-size: 24px;
-        color: #cbd5e1;
-        font-weight: 600;
-        margin-bottom: 16px;
-        opacity: 0.9;
-    }
-    
-    .hero-description {
-        font-size: 16px;
-        color: #64748b;
-        max-width: 600px;
-        margin: 0 auto 40px auto;
-        line-height: 1.6;
-    }
-    
-    .hero-stats {
-        display: flex;
-        justify-content: center;
-        gap: 60px;
-        margin-top: 40px;
-        flex-wrap: wrap;
-    }
-    
-    .hero-stat {
-        text-align: center;
-        position: relative;
-    }
-    
-    .hero-stat::after {
-        content: '';
-        position: absolute;
-        bottom: -10px;
-        left: 50%;
-        transform: translateX(-50%);
-        width: 0;
-        height: 2px;
-        background: linear-gradient(90deg, #00d4ff, #ff00a8);
-        transition: width 0.3s ease;
-    }
-    
-    .hero-stat:hover::after {
-        width: 100%;
-    }
-    
-    .hero-stat-value {
-        font-size: 32px;
-        font-weight: 800;
-        color: #00d4ff;
-        display: block;
-        text-shadow: 0 0 20px rgba(0, 212, 255, 0.4);
-    }
-    
-    .hero-stat-label {
-        font-size: 12px;
-        color: #64748b;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        margin-top: 8px;
-    }
-    
-    /* Navigation Cards */
-    .nav-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(350px, 1fr));
-        gap: 32px;
-        margin: 40px 0;
-    }
-    
-    .nav-card {
-        background: rgba(15, 20, 25, 0.7);
-        backdrop-filter: blur(25px);
-        border: 1px solid rgba(255, 255, 255, 0.1);
-        border-radius: 24px;
-        padding: 40px;
-        position: relative;
-        overflow: hidden;
-        transition: all 0.5s cubic-bezier(0.4, 0, 0.2, 1);
-        cursor: pointer;
-        text-decoration: none;
-        color: inherit;
-    }
-    
-    .nav-card::before {
-        content: '';
-        position: absolute;
-        top: -2px;
-        left: -2px;
-        right: -2px;
-        bottom: -2px;
-        background: linear-gradient(135deg, #00d4ff, #ff00a8, #00ff88, #00d4ff);
-        border-radius: 26px;
-        opacity: 0;
-        z-index: -1;
-        transition: opacity 0.3s ease;
-    }
-    
-    .nav-card::after {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background: rgba(15, 20, 25, 0.9);
-        border-radius: 24px;
-        z-index: -1;
-    }
-    
-    .nav-card:hover {
-        transform: translateY(-12px) scale(1.03);
-        box-shadow: 0 30px 100px rgba(0, 0, 0, 0.6);
-        text-decoration: none;
-        color: inherit;
-    }
-    
-    .nav-card:hover::before {
-        opacity: 1;
-    }
-    
-    .nav-card-icon {
-        font-size: 48px;
-        margin-bottom: 24px;
-        display: block;
-        position: relative;
-        z-index: 1;
-    }
-    
-    .nav-card-title {
-        font-size: 24px;
-        font-weight: 700;
-        color: #f1f5f9;
-        margin-bottom: 16px;
-        position: relative;
-        z-index: 1;
-    }
-    
-    .nav-card-description {
-        font-size: 14px;
-        color: #64748b;
-        line-height: 1.6;
-        margin-bottom: 20px;
-        position: relative;
-        z-index: 1;
-    }
-    
-    .nav-card-features {
-        list-style: none;
-        padding: 0;
-        position: relative;
-        z-index: 1;
-    }
-    
-    .nav-card-features li {
-        font-size: 13px;
-        color: #94a3b8;
-        margin-bottom: 8px;
-        padding-left: 16px;
-        position: relative;
-    }
-    
-    .nav-card-features li::before {
-        content: '→';
-        position: absolute;
-        left: 0;
-        color: #00d4ff;
-        font-weight: bold;
-    }
-    
-    /* Sidebar Styling */
-    .css-1d391kg {
-        background: rgba(15, 20, 25, 0.95) !important;
-        backdrop-filter: blur(20px) !important;
-    }
-    
-    .css-1d391kg .stMarkdown {
-        color: #e2e8f0 !important;
-    }
-    
-    /* Status Section */
-    .status-section {
-        background: rgba(15, 20, 25, 0.6);
-        backdrop-filter: blur(25px);
-        border: 1px solid rgba(255, 255, 255, 0.1);
-        border-radius: 20px;
-        padding: 32px;
-        margin: 40px 0;
-        text-align: center;
-    }
-    
-    .status-title {
-        font-size: 20px;
-        font-weight: 700;
-        color: #f1f5f9;
-        margin-bottom: 16px;
-    }
-    
-    .status-indicator {
-        display: inline-flex;
-        align-items: center;
-        gap: 8px;
-        background: rgba(0, 255, 136, 0.1);
-        border: 1px solid rgba(0, 255, 136, 0.3);
-        border-radius: 25px;
-        padding: 8px 20px;
-        font-size: 14px;
-        font-weight: 600;
-        color: #00ff88;
-        margin-bottom: 20px;
-    }
-    
-    .status-dot {
-        width: 8px;
-        height: 8px;
-        background: #00ff88;
-        border-radius: 50%;
-        animation: pulse 2s infinite;
-        box-shadow: 0 0 10px #00ff88;
-    }
-    
-    @keyframes pulse {
-        0%, 100% { opacity: 1; transform: scale(1); }
-        50% { opacity: 0.7; transform: scale(1.05); }
-    }
-    
-    /* Custom scrollbar */
-    ::-webkit-scrollbar {
-        width: 10px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: rgba(30, 41, 59, 0.4);
-        border-radius: 5px;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: linear-gradient(135deg, #00d4ff, #ff00a8);
-        border-radius: 5px;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: linear-gradient(135deg, #ff00a8, #00d4ff);
-    }
-    
-    /* Responsive Design */
-    @media (max-width: 768px) {
-        .hero-title {
-            font-size: 48px;
-        }
-        
-        .hero-subtitle {
-            font-size: 20px;
-        }
-        
-        .hero-stats {
-            gap: 30px;
-        }
-        
-        .nav-grid {
-            grid-template-columns: 1fr;
-            gap: 24px;
-        }
-        
-        .nav-card {
-            padding: 32px;
-        }
-    }
-    
-    /* Hide Streamlit Elements */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    .stDeployButton {display: none;}
-    
-    /* Fix Streamlit title hiding */
-    .main h1 {
-        display: none !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+use_stylesheet('home')
 
-# Load data (will be cached and shared across pages)
+# Load data (held once in the shared registry, not copied into each session)
 try:
-    df, genesis_date = load_data()
-    st.session_state.df = df
-    st.session_state.genesis_date = genesis_date
+    df, genesis_date = get_hashrate_data()
     data_loaded = True
 except Exception as e:
     data_loaded = False
@@ -563,6 +198,74 @@ st.markdown(f"""
 </div>
 """, unsafe_allow_html=True)
 
+# Shared data registry memory and refresh readout
+with st.expander("Data registry"):
+    st.caption(f"Data source: {get_data_source().name}")
+    registry_usage = registry_memory_usage()
+    mem_col1, mem_col2, mem_col3 = st.columns(3)
+    mem_col1.metric("Shared datasets", f"{registry_usage['bytes'].sum() / 1e6:,.2f} MB")
+    mem_col2.metric("Memory-mapped", f"{registry_usage['mapped_bytes'].sum() / 1e6:,.2f} MB")
+    mem_col3.metric("Process RSS", f"{process_rss_bytes() / 1e6:,.1f} MB")
+    st.dataframe(
+        registry_usage,
+        column_config={
+            "dataset": "Dataset",
+            "rows": "Rows",
+            "bytes": st.column_config.NumberColumn("Bytes", format="%d"),
+            "mapped_bytes": st.column_config.NumberColumn("Mapped Bytes", format="%d")
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+    st.caption("One copy per server process, shared read-only by every session; "
+               "mapped bytes are shared between processes through the OS page cache")
+    st.dataframe(
+        get_refresher().status(),
+        column_config={
+            "series": "Series",
+            "version": "Version",
+            "age_s": st.column_config.NumberColumn("Age", format="%d s"),
+            "latency_s": st.column_config.NumberColumn("Fetch Latency", format="%.3f s"),
+            "checked_s_ago": st.column_config.NumberColumn("Last Check", format="%d s ago"),
+            "probed": "Change Probe",
+            "next_refresh_s": st.column_config.NumberColumn("Next Check", format="%d s"),
+            "failures": "Failures",
+            "last_error": "Last Error"
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+    st.caption("Last parse of each series; rows with an unparseable or empty date or value are dropped")
+    st.dataframe(
+        ingest_reports(),
+        column_config={
+            "series": "Series",
+            "rows_read": "Rows Read",
+            "rows_kept": "Rows Kept",
+            "invalid": "Invalid Cells",
+            "missing": "Empty Cells",
+            "before_genesis": "Before Genesis",
+            "parse_s": st.column_config.NumberColumn("Parse Time", format="%.3f s")
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+    st.caption("Memory-mapped series store on disk")
+    st.dataframe(
+        store_usage(),
+        column_config={
+            "series": "Series",
+            "rows": "Rows",
+            "bytes": st.column_config.NumberColumn("Bytes", format="%d"),
+            "age_s": st.column_config.NumberColumn("Written", format="%d s ago")
+        },
+        hide_index=True,
+        use_container_width=True
+    )
+    figure_stats = get_figure_cache().stats()
+    st.caption(f"Figure cache: {figure_stats['entries']} charts, {figure_stats['bytes'] / 1e6:,.2f} MB, "
+               f"{figure_stats['hits']} hits, {figure_stats['misses']} misses")
+
 # Footer
 st.markdown(f"""
 <div style="text-align: center; padding: 40px 20px; margin-top: 60px; 
@@ -579,3 +282,5 @@ st.markdown(f"""
     </div>
 </div>
 """, unsafe_allow_html=True)
+
+timing_panel()
@@ -0,0 +1,139 @@
+import json
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+import numpy as np
+import pandas as pd
+
+# ===== ANALYTICS ARTIFACT STORE =====
+# The precompute job's output: one generation directory per run holding every
+# artifact frame as one .npy file per column (dates as int64 UTC nanoseconds),
+# opened memory-mapped like the series store. manifest.json names the current
+# generation and records the fits, plus the change-probe signature of each
+# series the generation was computed from; readers only use a generation whose
+# signatures match the series versions they are serving.
+#
+# <dir>/manifest.json -> <dir>/<generation>/<frame>/<column index>.npy
+
+ARTIFACT_DIR = Path(os.environ.get("KASPA_ARTIFACT_DIR", Path(__file__).parent / ".cache" / "artifacts"))
+KEEP_GENERATIONS = 2
+
+def _signature_key(signature):
+    return json.dumps(signature, default=str)
+
+def _column_arrays(df):
+    """(column spec, array) per column; specs are [name, kind, tz]"""
+    for name in df.columns:
+        values = df[name]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            tz = str(values.dt.tz) if values.dt.tz is not None else None
+            utc = values.dt.tz_convert('UTC').dt.tz_localize(None) if tz else values
+            yield [name, 'datetime', tz], utc.to_numpy('datetime64[ns]').view('int64')
+        elif pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+            yield [name, 'values', None], values.to_numpy()
+        else:
+            raise TypeError(f"column {name!r} of dtype {values.dtype} can't be stored as an artifact")
+
+def write_artifacts(frames, fits, sources, directory=ARTIFACT_DIR):
+    """
+    Writes a new generation and makes it current
+
+    frames maps names to DataFrames, fits maps names to (a, b, r2) and sources
+    maps each series name to the probe signature its data was loaded under.
+    """
+    directory = Path(directory)
+    generation = f"{int(time.time())}-{uuid.uuid4().hex[:8]}"
+    tmp_dir = directory / f".{generation}.tmp"
+    tmp_dir.mkdir(parents=True)
+    frame_specs = {}
+    for index, (name, df) in enumerate(frames.items()):
+        frame_dir = tmp_dir / str(index)
+        frame_dir.mkdir()
+        columns = []
+        for i, (spec, values) in enumerate(_column_arrays(df)):
+            np.save(frame_dir / f"{i}.npy", values)
+            columns.append(spec)
+        frame_specs[name] = {'dir': str(index), 'rows': len(df), 'columns': columns}
+    os.replace(tmp_dir, directory / generation)
+
+    manifest = {
+        'generation': generation,
+        'written_at': time.time(),
+        'sources': {series: _signature_key(signature) for series, signature in sources.items()},
+        'fits': {name: list(fit) for name, fit in fits.items()},
+        'frames': frame_specs,
+    }
+    manifest_tmp = directory / "manifest.json.tmp"
+    manifest_tmp.write_text(json.dumps(manifest))
+    os.replace(manifest_tmp, directory / "manifest.json")
+    _prune(directory, generation)
+    return manifest
+
+def _prune(directory, current):
+    # Files still mapped by readers stay readable after unlinking
+    generations = sorted(p for p in directory.iterdir() if p.is_dir() and not p.name.startswith('.'))
+    for path in generations:
+        if path.name != current and generations.index(path) < len(generations) - KEEP_GENERATIONS:
+            shutil.rmtree(path, ignore_errors=True)
+
+def read_manifest(directory=ARTIFACT_DIR):
+    path = Path(directory) / "manifest.json"
+    try:
+        return json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+def matching_manifest(sources, directory=ARTIFACT_DIR):
+    """The current manifest if it was computed from exactly these series signatures"""
+    manifest = read_manifest(directory)
+    if manifest is None:
+        return None
+    for series, signature in sources.items():
+        if signature is None or manifest['sources'].get(series) != _signature_key(signature):
+            return None
+    return manifest
+
+def stored_fit(name, sources, directory=ARTIFACT_DIR):
+    """(a, b, r2) of a stored fit computed from these series signatures, else None"""
+    manifest = matching_manifest(sources, directory)
+    fit = manifest['fits'].get(name) if manifest else None
+    return tuple(fit) if fit else None
+
+def open_frame(name, sources, directory=ARTIFACT_DIR):
+    """
+    Read-only DataFrame over a stored artifact computed from these series
+    signatures, or None; value columns are the memory-mapped arrays
+    """
+    manifest = matching_manifest(sources, directory)
+    spec = manifest['frames'].get(name) if manifest else None
+    if spec is None:
+        return None
+    frame_dir = Path(directory) / manifest['generation'] / spec['dir']
+    data = {}
+    try:
+        for i, (column, kind, tz) in enumerate(spec['columns']):
+            values = np.load(frame_dir / f"{i}.npy", mmap_mode='r').view(np.ndarray)
+            if kind == 'datetime':
+                dates = pd.DatetimeIndex(values.view('datetime64[ns]'))
+                values = dates.tz_localize('UTC').tz_convert(tz) if tz else dates
+            data[column] = values
+    except FileNotFoundError:
+        return None  # pruned between reading the manifest and opening
+    return pd.DataFrame(data, copy=False)
+
+def artifact_usage(directory=ARTIFACT_DIR):
+    """Generation, age, source signatures and on-disk bytes of the current artifacts"""
+    manifest = read_manifest(directory)
+    if manifest is None:
+        return None
+    generation_dir = Path(directory) / manifest['generation']
+    return {
+        'generation': manifest['generation'],
+        'age_s': round(time.time() - manifest['written_at']),
+        'frames': len(manifest['frames']),
+        'fits': len(manifest['fits']),
+        'bytes': sum(p.stat().st_size for p in generation_dir.rglob("*.npy")) if generation_dir.exists() else 0,
+        'sources': manifest['sources'],
+    }
@@ -0,0 +1,74 @@
+"""
+Price chart payload per chart backend: Plotly figure JSON vs lightweight-charts series
+
+Builds the 1_Price chart (price line, power-law fit, two deviation bands) from
+synthetic daily history with every row, once as the Plotly figure the page
+serializes (auto render mode) and once as the lightweight-charts arguments
+Streamlit sends to the component. Reports build plus serialization time and
+payload size, and for lightweight-charts the cost of refreshing the points
+after one more day arrives, reusing the previous conversion versus redoing it.
+
+Interaction latency (pan/zoom/hover) happens in the browser and isn't covered
+here; compare it with ?chart=plotly and ?chart=lightweight on the same page.
+
+    python benchmarks/chart_backend_benchmark.py --scales 1 10 100
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd
+import plotly.io as pio
+from series_schema import ingest
+from synthetic_history import synthetic_series
+from utils import fit_power_law
+from chart_render import apply_render_mode
+from lightweight_render import (LevelPoints, chart_options, fit_series, line_series,
+                                _epoch_seconds, _extend, _to_points)
+from render_benchmark import price_figure, best_of
+
+def lightweight_args(df, a, b, r2):
+    points = _to_points(_epoch_seconds(df['Date']), df['Price'].to_numpy(dtype='float64'))
+    series = [line_series(points, 'Price (USD)', '#00FFCC', width=2.5)] + fit_series(a, b, r2, points)
+    return [{'chart': chart_options(log_y=True), 'series': series}]
+
+def refresh_costs(df, repeat):
+    """(full, incremental) seconds to convert the price points after one more row"""
+    times = _epoch_seconds(df['Date'])
+    values = df['Price'].to_numpy(dtype='float64')
+    previous = LevelPoints(0, times[:-1], values[:-1], _to_points(times[:-1], values[:-1]), None)
+    full_s, _ = best_of(lambda: _to_points(times, values), repeat)
+    incremental_s, _ = best_of(lambda: _extend(previous, times, values), repeat)
+    return full_s, incremental_s
+
+def run(scales, repeat):
+    rows = []
+    for scale in scales:
+        sheet = synthetic_series(scale)['price']
+        df, _ = ingest('price', [list(sheet.columns)] + sheet.to_numpy().tolist())
+        a, b, r2 = fit_power_law(df, y_col='Price')
+
+        build_s, fig = best_of(lambda: apply_render_mode(price_figure(df, a, b, sampled=False)), repeat)
+        json_s, payload = best_of(lambda: pio.to_json(fig, validate=False), repeat)
+        rows.append({'scale': scale, 'rows': len(df), 'backend': 'plotly',
+                     'build_s': round(build_s, 4), 'to_json_s': round(json_s, 4),
+                     'json_kb': round(len(payload) / 1024, 1), 'refresh_s': '-'})
+
+        build_s, args = best_of(lambda: lightweight_args(df, a, b, r2), repeat)
+        json_s, payload = best_of(lambda: json.dumps(args), repeat)
+        full_s, incremental_s = refresh_costs(df, repeat)
+        rows.append({'scale': scale, 'rows': len(df), 'backend': 'lightweight',
+                     'build_s': round(build_s, 4), 'to_json_s': round(json_s, 4),
+                     'json_kb': round(len(payload) / 1024, 1),
+                     'refresh_s': f"{incremental_s:.5f} (full {full_s:.4f})"})
+    return pd.DataFrame(rows)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    print(run(args.scales, args.repeat).to_string(index=False))
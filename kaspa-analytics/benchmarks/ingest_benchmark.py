@@ -0,0 +1,100 @@
+"""
+Sheet parsing: the pre-schema loader code vs series_schema.ingest
+
+Parses in-memory synthetic sheets (no I/O) at several scales and reports the
+best of --repeat runs per series.
+
+    python benchmarks/ingest_benchmark.py --scales 1 10 100 1000
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pandas as pd
+from series_schema import ingest
+from synthetic_history import synthetic_series
+
+# ===== PREVIOUS PARSING =====
+# The loader bodies as they were before the schema, minus the sheet read
+def legacy_hashrate(data):
+    df = pd.DataFrame(data[1:], columns=data[0])
+    df = df[['Date', 'Hashrate (H/s)']]
+    df['Date'] = pd.to_datetime(df['Date'], format='%d %b %Y', utc=True)
+    df['Hashrate (H/s)'] = df['Hashrate (H/s)'].astype(float)
+    genesis_date = pd.to_datetime('2021-11-07', utc=True)
+    df['days_from_genesis'] = (df['Date'] - genesis_date).dt.days
+    df = df[df['days_from_genesis'] >= 0]
+    df['Hashrate_PH'] = df['Hashrate (H/s)'] / 1e15
+    return df
+
+def legacy_price(data):
+    df = pd.DataFrame(data[1:], columns=data[0])
+    df = df[['Date', 'Price']]
+    df['Date'] = pd.to_datetime(df['Date'], utc=True)
+    df['Price'] = df['Price'].astype(float)
+    genesis_date = pd.to_datetime('2021-11-07', utc=True)
+    df['days_from_genesis'] = (df['Date'] - genesis_date).dt.days
+    return df[df['days_from_genesis'] >= 0]
+
+def legacy_volume(data):
+    df = pd.DataFrame(data[1:], columns=data[0])
+    df = df[['date', 'price', 'total_volume']]
+    df = df.rename(columns={'date': 'Date', 'price': 'Price', 'total_volume': 'Volume_USD'})
+    df['Date'] = pd.to_datetime(df['Date'], utc=True)
+    df['Price'] = pd.to_numeric(df['Price'], errors='coerce')
+    df['Volume_USD'] = pd.to_numeric(df['Volume_USD'], errors='coerce')
+    df = df.dropna()
+    genesis_date = pd.to_datetime('2021-11-07', utc=True)
+    df['days_from_genesis'] = (df['Date'] - genesis_date).dt.days
+    df = df[df['days_from_genesis'] >= 0]
+    return df.sort_values('Date').reset_index(drop=True)
+
+def legacy_marketcap(data):
+    df = pd.DataFrame(data[1:], columns=data[0])
+    df = df[['Date', 'MarketCap']]
+    df['Date'] = pd.to_datetime(df['Date'], utc=True)
+    df['MarketCap'] = df['MarketCap'].astype(float)
+    genesis_date = pd.to_datetime('2021-11-07', utc=True)
+    df['days_from_genesis'] = (df['Date'] - genesis_date).dt.days
+    df = df[df['days_from_genesis'] >= 0]
+    df['MarketCap_B'] = df['MarketCap'] / 1e9
+    return df
+
+LEGACY = {
+    'hashrate': legacy_hashrate,
+    'price': legacy_price,
+    'volume': legacy_volume,
+    'marketcap': legacy_marketcap,
+}
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+def run(scales, repeat):
+    rows = []
+    for scale in scales:
+        for series, df in synthetic_series(scale).items():
+            data = [list(df.columns)] + df.to_numpy().tolist()
+            legacy = best_of(lambda: LEGACY[series](data), repeat)
+            schema = best_of(lambda: ingest(series, data), repeat)
+            rows.append({
+                'scale': scale, 'series': series, 'rows': len(data) - 1,
+                'legacy_s': round(legacy, 4), 'ingest_s': round(schema, 4),
+                'speedup': round(legacy / schema, 1),
+            })
+    return pd.DataFrame(rows)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    print(run(args.scales, args.repeat).to_string(index=False))
@@ -0,0 +1,168 @@
+"""
+Multi-session load test: rerun latency, memory per session and cache hit rates
+
+Simulates --sessions users of one server (one process, so they share its
+caches) with Streamlit's AppTest. All sessions open the app, then take turns
+performing --actions random interactions each: switching to another chart
+page, or changing one of the page's select boxes. Every rerun is timed, and
+the run reports:
+
+  - p50/p95/p99/max rerun latency, overall and per page, and reruns that raised
+  - process RSS growth per open session (an upper bound: it includes
+    AppTest's copy of each session's element tree)
+  - figure cache hit rate, and how often the expensive steps behind the other
+    caches (sheet fetch, parse, fits, pyramids, merges) actually ran, from the
+    timing spans
+
+AppTest swaps process-wide Streamlit state on every run, so reruns are taken
+one at a time: latencies are service times without queueing behind other
+sessions' reruns.
+
+The report goes to stdout. Logging stays on, since the spans are counted
+from their log records, so Streamlit's console output (deprecations, tracebacks
+of reruns that raised) still reaches stderr. Uses the configured data source;
+for synthetic data run e.g.
+
+    KASPA_DATA_SOURCE=local KASPA_DATA_DIR=data python benchmarks/load_test.py --sessions 50 2>/dev/null
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR))
+# Spans are only logged with this set; they are collected below, not printed
+os.environ.setdefault("KASPA_TIMING_LOG", "1")
+
+import numpy as np
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+import timing
+from data_registry import process_rss_bytes
+from figure_cache import get_figure_cache
+
+PAGES = [
+    'pages/1_Price.py',
+    'pages/2_Hashrate_Analysis.py',
+    'pages/3_MarketCap.py',
+    'pages/4_Kaspa Trading Volume.py',
+    'pages/5_Kaspa Price vs Hashrate.py',
+    'pages/6_Kaspa Price Hashrate and  PH-Ratio Deviation.py',
+    'pages/7_Power Law Residual of Kaspa Price Relative to Network Hashrate.py',
+    'pages/41_Kaspa price vs Trading volume.py',
+]
+
+# Probability that an interaction navigates instead of changing a control
+SWITCH_PAGE_P = 0.25
+
+# Spans whose count is the number of times the work behind a cache ran
+RECOMPUTE_SPANS = ['fetch', 'parse', 'store open', 'merge', 'fit_power_law',
+                   'calculate_daily_power_law', 'build pyramid', 'build']
+
+class SpanCounter(logging.Handler):
+    """Counts the timing module's JSON span records by span name"""
+
+    def __init__(self):
+        super().__init__()
+        self.counts = Counter()
+
+    def emit(self, record):
+        self.counts[json.loads(record.getMessage())['span']] += 1
+
+class Session:
+    """One simulated user, starting on the app's home page"""
+
+    def __init__(self, number, timeout, seed):
+        self.number = number
+        self.rng = random.Random(seed + number)
+        self.page = 'app.py'
+        self.at = AppTest.from_file(str(APP_DIR / self.page), default_timeout=timeout)
+
+    def interact(self):
+        """Switches page or changes a select box at random"""
+        boxes = [box for box in self.at.selectbox if len(box.options) > 1] if self.page != 'app.py' else []
+        if not boxes or self.rng.random() < SWITCH_PAGE_P:
+            self.page = self.rng.choice([p for p in PAGES if p != self.page])
+            self.at.switch_page(self.page)
+        else:
+            box = self.rng.choice(boxes)
+            box.set_value(self.rng.choice([o for o in box.options if o != box.value]))
+
+    def rerun(self):
+        start = time.perf_counter()
+        self.at.run()
+        return {
+            'session': self.number, 'page': Path(self.page).stem,
+            'ms': (time.perf_counter() - start) * 1000,
+            'errors': len(self.at.exception),
+        }
+
+def latency_summary(samples):
+    ms = samples['ms']
+    return pd.Series({
+        'reruns': len(ms),
+        'p50_ms': np.percentile(ms, 50), 'p95_ms': np.percentile(ms, 95),
+        'p99_ms': np.percentile(ms, 99), 'max_ms': ms.max(),
+        'errors': (samples['errors'] > 0).sum(),
+    })
+
+def run(sessions, actions, timeout, seed):
+    counter = SpanCounter()
+    timing.logger.handlers = [counter]
+
+    # One session through every page first, so the numbers below are the
+    # steady state rather than the first load of each dataset
+    warm = AppTest.from_file(str(APP_DIR / 'app.py'), default_timeout=timeout).run()
+    for page in PAGES:
+        warm.switch_page(page).run()
+    counter.counts.clear()
+    cache_before = get_figure_cache().stats()
+    rss_before = process_rss_bytes()
+
+    start = time.perf_counter()
+    users = [Session(number, timeout, seed) for number in range(sessions)]
+    samples = [user.rerun() for user in users]
+    for _ in range(actions):
+        for user in users:
+            user.interact()
+            samples.append(user.rerun())
+    elapsed = time.perf_counter() - start
+
+    samples = pd.DataFrame(samples)
+    cache_after = get_figure_cache().stats()
+    hits = cache_after['hits'] - cache_before['hits']
+    misses = cache_after['misses'] - cache_before['misses']
+    summary = {
+        'sessions': sessions,
+        'reruns': len(samples),
+        'reruns_per_s': len(samples) / elapsed,
+        'rss_mb_per_session': (process_rss_bytes() - rss_before) / sessions / 1e6 if rss_before else float('nan'),
+        'figure_cache_hit_rate': hits / max(1, hits + misses),
+    }
+    recomputes = {name: counter.counts.get(name, 0) for name in RECOMPUTE_SPANS}
+    return samples, summary, recomputes
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=20)
+    parser.add_argument('--actions', type=int, default=10, help='interactions per session after opening the app')
+    parser.add_argument('--timeout', type=float, default=300)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    os.chdir(APP_DIR)
+
+    samples, summary, recomputes = run(args.sessions, args.actions, args.timeout, args.seed)
+    print(latency_summary(samples).round(1).to_string())
+    print()
+    print(samples.groupby('page').apply(latency_summary).round(1).to_string())
+    print()
+    for name, value in summary.items():
+        print(f"{name:24s} {value:.3f}" if isinstance(value, float) else f"{name:24s} {value}")
+    print()
+    print("recomputed during the run: " + ', '.join(f"{name} {count}" for name, count in recomputes.items()))
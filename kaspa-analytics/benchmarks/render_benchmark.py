@@ -0,0 +1,82 @@
+"""
+Price chart figure cost per render mode: Python build time and JSON payload
+
+Builds the 1_Price figure (price line, power-law fit, two deviation bands,
+rangeslider) from synthetic history, once with every row as the page used
+to plot it and once downsampled, in each render mode. Build time covers
+figure construction plus apply_render_mode; JSON is what st.plotly_chart
+serializes for the browser.
+
+    python benchmarks/render_benchmark.py --scales 1 10 100
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+from series_schema import ingest
+from synthetic_history import synthetic_series
+from utils import fit_power_law, power_law_curve, days_to_dates
+from downsample import downsample_frame
+from chart_render import apply_render_mode, RENDER_MODES
+
+def price_figure(df, a, b, sampled):
+    if sampled:
+        df = downsample_frame(df, ['Price'])
+        fit_x, y_fit = power_law_curve(a, b, df['days_from_genesis'].min(), df['days_from_genesis'].max())
+        fit_x = days_to_dates(fit_x)
+    else:
+        fit_x, y_fit = df['Date'], a * np.power(df['days_from_genesis'], b)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=df['Date'], y=df['Price'], mode='lines', name='Price (USD)',
+                             line=dict(color='#00FFCC', width=2.5), text=df['Date']))
+    fig.add_trace(go.Scatter(x=fit_x, y=y_fit, mode='lines', name='Power-Law Fit',
+                             line=dict(color='#FFA726', dash='dot', width=2)))
+    fig.add_trace(go.Scatter(x=fit_x, y=y_fit * 0.4, mode='lines', name='-60% Deviation',
+                             line=dict(color='rgba(255, 255, 255, 0.5)', dash='dot', width=1)))
+    fig.add_trace(go.Scatter(x=fit_x, y=y_fit * 2.2, mode='lines', name='+120% Deviation',
+                             line=dict(color='rgba(255, 255, 255, 0.5)', dash='dot', width=1),
+                             fill='tonexty', fillcolor='rgba(100, 100, 100, 0.2)'))
+    fig.update_layout(plot_bgcolor='#262730', paper_bgcolor='#262730', height=700,
+                      xaxis=dict(rangeslider=dict(visible=True, thickness=0.1)))
+    return fig
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    return min(timings), result
+
+def run(scales, repeat):
+    rows = []
+    for scale in scales:
+        sheet = synthetic_series(scale)['price']
+        df, _ = ingest('price', [list(sheet.columns)] + sheet.to_numpy().tolist())
+        a, b, _ = fit_power_law(df, y_col='Price')
+        for sampled in (False, True):
+            for mode in RENDER_MODES:
+                build_s, fig = best_of(lambda: apply_render_mode(price_figure(df, a, b, sampled), mode), repeat)
+                json_s, payload = best_of(lambda: pio.to_json(fig, validate=False), repeat)
+                rows.append({
+                    'scale': scale, 'rows': len(df), 'points': 'sampled' if sampled else 'every row',
+                    'mode': mode, 'traces': '/'.join(sorted({t.type for t in fig.data})),
+                    'build_s': round(build_s, 4), 'to_json_s': round(json_s, 4),
+                    'json_kb': round(len(payload) / 1024, 1),
+                })
+    return pd.DataFrame(rows)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    print(run(args.scales, args.repeat).to_string(index=False))
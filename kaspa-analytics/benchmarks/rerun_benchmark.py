@@ -0,0 +1,63 @@
+"""
+Server time per chart-control interaction: whole-page rerun vs chart fragment
+
+Drives pages 1-4 with Streamlit's AppTest, stepping the Period control through
+every value twice (first visit builds the figure, second hits the figure
+cache). For each step it reports the whole-script rerun, which is what every
+interaction cost before the chart sections became fragments, and the chart
+section's own run time, which is what a fragment-scoped rerun executes now.
+
+Uses the configured data source; for synthetic data run e.g.
+
+    KASPA_DATA_SOURCE=local KASPA_DATA_DIR=data python benchmarks/rerun_benchmark.py
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR))
+
+import pandas as pd
+from streamlit.testing.v1 import AppTest
+from chart_render import section_timings
+
+PAGES = {
+    'pages/1_Price.py': ('price_chart_section', 'price_time_range_select'),
+    'pages/2_Hashrate_Analysis.py': ('hashrate_chart_section', 'time_range_select'),
+    'pages/3_MarketCap.py': ('marketcap_chart_section', 'mcap_time_range_select'),
+    'pages/4_Kaspa Trading Volume.py': ('volume_chart_section', 'time_range_select'),
+}
+
+def run(pages, timeout):
+    rows = []
+    for page in pages:
+        section, period_key = PAGES[page]
+        at = AppTest.from_file(str(APP_DIR / page), default_timeout=timeout).run()
+        periods = at.selectbox(key=period_key).options
+        for visit in ('first', 'repeat'):
+            for period in periods:
+                at.selectbox(key=period_key).set_value(period)
+                start = time.perf_counter()
+                at.run()
+                rows.append({
+                    'page': Path(page).stem, 'visit': visit, 'period': period,
+                    'page_rerun_ms': round((time.perf_counter() - start) * 1000, 1),
+                    'fragment_ms': round(section_timings.get(section, float('nan')) * 1000, 1),
+                })
+    return pd.DataFrame(rows)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', nargs='+', default=list(PAGES), choices=list(PAGES))
+    parser.add_argument('--timeout', type=float, default=300)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    os.chdir(APP_DIR)
+    results = run(args.pages, args.timeout)
+    print(results.to_string(index=False))
+    print()
+    print(results.groupby(['page', 'visit'])[['page_rerun_ms', 'fragment_ms']].median().to_string())
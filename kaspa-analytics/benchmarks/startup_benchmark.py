@@ -0,0 +1,130 @@
+"""
+Cold-start cost of every page: import time and first run after a restart
+
+For each page, a fresh interpreter imports streamlit, as a running server
+already has, then runs just the page's module-level imports under
+`python -X importtime`; it reports the time those add and the packages that
+weigh most. A second fresh interpreter times the page's first AppTest run:
+imports, empty caches, data loading and the first render, i.e. the server
+side of the first paint after a restart.
+
+Exits with status 1 when a page goes over the import or first-run budget, or
+its first run fails or raises, so it can guard against regressions:
+
+    KASPA_DATA_SOURCE=local KASPA_DATA_DIR=data python benchmarks/startup_benchmark.py
+"""
+import argparse
+import ast
+import json
+import logging
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+
+import pandas as pd
+
+IMPORT_BUDGET_MS = 600
+FIRST_RUN_BUDGET_MS = 3000
+
+PAGE_MARKER = '--- page imports ---'
+
+FIRST_RUN = """
+import json, logging, sys, time
+logging.disable(logging.WARNING)
+sys.path.insert(0, {app_dir!r})
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({page!r}, default_timeout={timeout})
+start = time.perf_counter()
+at.run()
+print(json.dumps({{'ms': (time.perf_counter() - start) * 1000, 'exceptions': len(at.exception)}}))
+"""
+
+def all_pages():
+    return ['app.py'] + sorted(str(p.relative_to(APP_DIR)) for p in (APP_DIR / 'pages').glob('*.py'))
+
+def module_imports(path):
+    """Source of the import statements a page runs at module level, including inside top-level try/if"""
+    tree = ast.parse((APP_DIR / path).read_text(encoding='utf-8'))
+    statements, pending = [], list(tree.body)
+    while pending:
+        node = pending.pop(0)
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            statements.append(ast.unparse(node))
+        elif isinstance(node, (ast.Try, ast.If)):
+            pending[:0] = node.body
+    return statements
+
+def import_profile(path, top):
+    """
+    (ms, heaviest packages) the page's module-level imports add under
+    -X importtime, on top of what importing streamlit already loaded
+    """
+    code = '\n'.join([
+        f'import sys; sys.path.insert(0, {str(APP_DIR)!r})',
+        'import streamlit',
+        f'sys.stderr.write({PAGE_MARKER!r} + "\\n")',
+    ] + module_imports(path))
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=APP_DIR, capture_output=True, text=True)
+    stderr = result.stderr.split(PAGE_MARKER, 1)[-1]
+    total_us, packages = 0, defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        total_us += int(self_us)
+        if not name.startswith('  '):
+            packages[name.strip().split('.')[0]] += int(cumulative_us)
+    heaviest = sorted(packages.items(), key=lambda item: -item[1])[:top]
+    return total_us / 1000, ', '.join(f'{name} {us / 1000:.0f}' for name, us in heaviest)
+
+def first_run(path, timeout):
+    code = FIRST_RUN.format(app_dir=str(APP_DIR), page=str(APP_DIR / path), timeout=timeout)
+    result = subprocess.run([sys.executable, '-c', code], cwd=APP_DIR, capture_output=True, text=True)
+    lines = result.stdout.strip().splitlines()
+    if result.returncode or not lines:
+        return float('nan'), 'failed'
+    run = json.loads(lines[-1])
+    return run['ms'], run['exceptions']
+
+def run(pages, top, timeout, skip_first_run):
+    rows = []
+    for path in pages:
+        import_ms, heaviest = import_profile(path, top)
+        row = {'page': Path(path).stem, 'import_ms': round(import_ms, 1), 'heaviest_ms': heaviest}
+        if not skip_first_run:
+            first_ms, exceptions = first_run(path, timeout)
+            row.update(first_run_ms=round(first_ms, 1), exceptions=exceptions)
+        rows.append(row)
+    return pd.DataFrame(rows)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', nargs='+', default=all_pages())
+    parser.add_argument('--top', type=int, default=3, help='heaviest packages listed per page')
+    parser.add_argument('--import-budget-ms', type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument('--first-run-budget-ms', type=float, default=FIRST_RUN_BUDGET_MS)
+    parser.add_argument('--skip-first-run', action='store_true')
+    parser.add_argument('--timeout', type=float, default=300)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    results = run(args.pages, args.top, args.timeout, args.skip_first_run)
+    with pd.option_context('display.max_colwidth', None, 'display.width', 200):
+        print(results.to_string(index=False))
+
+    over = results['import_ms'] > args.import_budget_ms
+    failed = pd.Series(False, index=results.index)
+    if 'first_run_ms' in results:
+        over |= results['first_run_ms'] > args.first_run_budget_ms
+        # A crashed or raising first run is no measurement, and never within budget
+        failed = results['first_run_ms'].isna() | (results['exceptions'] != 0)
+    if over.any():
+        print(f"\nOver budget (import {args.import_budget_ms:.0f} ms, first run {args.first_run_budget_ms:.0f} ms): "
+              + ', '.join(results.loc[over, 'page']))
+    if failed.any():
+        print("\nFirst run failed or raised: " + ', '.join(results.loc[failed, 'page']))
+    if over.any() or failed.any():
+        sys.exit(1)
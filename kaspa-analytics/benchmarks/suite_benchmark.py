@@ -0,0 +1,291 @@
+"""
+Benchmark suite: loaders, fitters, wallet analytics and page pipelines
+
+Runs every case on synthetic history at each --scales multiple of today's
+length (rows per day since genesis) and compares the best of --repeat runs
+with benchmarks/baseline.json. A case slower than its baseline by more than
+--threshold fails the run with status 1.
+
+  parse <series>      sheet rows -> frame, what the load_* functions run
+  fit_power_law       price power-law fit
+  growth_metrics      calculate_growth_metrics on price
+  daily_power_law     calculate_daily_power_law on volume (quadratic in rows; 1x only)
+  wallet <step>       extract_net_changes, calculate_average_purchase_price_over_time
+                      and the daily balance loop on 100 x scale transactions
+  page <name>         first run of a page in a fresh process on that history
+                      (cold caches), its figure build + serialization spans,
+                      and a rerun with warm caches
+
+A page whose run raises (AppTest's at.exception) is no measurement: its rows
+are flagged in the error column, fail the run and are never saved as baseline.
+
+    python benchmarks/suite_benchmark.py
+    python benchmarks/suite_benchmark.py --scales 1 10 --skip-pages
+    python benchmarks/suite_benchmark.py --save-baseline
+"""
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+
+APP_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(APP_DIR))
+
+import numpy as np
+import pandas as pd
+from series_schema import ingest
+from synthetic_history import synthetic_series, write_synthetic_history
+from utils import fit_power_law, calculate_growth_metrics, calculate_daily_power_law
+from wallet_history import extract_net_changes, calculate_average_purchase_price_over_time, daily_balance_history
+
+BASELINE_PATH = Path(__file__).resolve().parent / 'baseline.json'
+REGRESSION_THRESHOLD = 1.5
+# Timer noise on sub-millisecond cases; slowdowns smaller than this never fail
+REGRESSION_MIN_DELTA = 0.002
+
+PAGES = [
+    'pages/1_Price.py',
+    'pages/2_Hashrate_Analysis.py',
+    'pages/3_MarketCap.py',
+    'pages/4_Kaspa Trading Volume.py',
+    'pages/5_Kaspa Price vs Hashrate.py',
+    'pages/6_Kaspa Price Hashrate and  PH-Ratio Deviation.py',
+    'pages/7_Power Law Residual of Kaspa Price Relative to Network Hashrate.py',
+    'pages/41_Kaspa price vs Trading volume.py',
+]
+
+# Spans (see timing.py) that make up building and sending a page's figures
+FIGURE_SPANS = ('build', 'serialize', 'plotly_chart')
+
+WALLET_ADDRESS = 'kaspa:benchmark'
+WALLET_TX_PER_SCALE = 100
+
+# ===== INPUTS =====
+@lru_cache(maxsize=None)
+def sheets(scale):
+    """Sheet rows per series, as data sources return them"""
+    return {series: [list(df.columns)] + df.to_numpy().tolist() for series, df in synthetic_series(scale).items()}
+
+@lru_cache(maxsize=None)
+def frames(scale):
+    return {series: ingest(series, rows)[0] for series, rows in sheets(scale).items()}
+
+@lru_cache(maxsize=None)
+def price_history():
+    """Daily prices in the wallet tracker's fetch_kaspa_price_history layout"""
+    df = frames(1)['price']
+    timestamps = (df['Date'].astype('int64') // 1_000_000).tolist()
+    return [{'timestamp': ts, 'datetime': d.strftime('%Y-%m-%d'), 'price': p}
+            for ts, d, p in zip(timestamps, df['Date'], df['Price'])]
+
+@lru_cache(maxsize=None)
+def transactions(count, seed=0):
+    """full-transactions-page style results moving KAS in and out of WALLET_ADDRESS"""
+    rng = np.random.default_rng(seed)
+    prices = price_history()
+    times = np.sort(rng.integers(prices[0]['timestamp'], prices[-1]['timestamp'], count))
+    txs = []
+    for i, block_time in enumerate(times):
+        amount = int(rng.integers(1, 10_000) * 1e8)
+        incoming = rng.random() < 0.7
+        ours = {'script_public_key_address': WALLET_ADDRESS, 'amount': str(amount)}
+        other = {'script_public_key_address': 'kaspa:other', 'amount': str(amount)}
+        spent = {'previous_outpoint_address': WALLET_ADDRESS, 'previous_outpoint_amount': str(amount)}
+        txs.append({
+            'transaction_id': f'{i:064x}',
+            'block_time': int(block_time),
+            'inputs': [] if incoming else [spent],
+            'outputs': [ours] if incoming else [other],
+        })
+    return txs
+
+def wallet_frame(count):
+    """The wallet page's transaction frame: one row per transaction with its running balance"""
+    changes = extract_net_changes(transactions(count), WALLET_ADDRESS)
+    df = pd.DataFrame(changes)
+    df['balance'] = df['net_change'].cumsum()
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    return df.sort_values('timestamp')
+
+# ===== CASES =====
+# name -> (max scale or None, setup(scale) returning the call to time)
+CASES = {}
+
+def case(name, max_scale=None):
+    def register(setup):
+        CASES[name] = (max_scale, setup)
+        return setup
+    return register
+
+for _series in ('hashrate', 'price', 'volume', 'marketcap'):
+    case(f'parse {_series}')(lambda scale, series=_series: (lambda rows=sheets(scale)[series]: ingest(series, rows)))
+
+@case('fit_power_law')
+def _fit(scale):
+    df = frames(scale)['price']
+    return lambda: fit_power_law(df, y_col='Price')
+
+@case('growth_metrics')
+def _growth(scale):
+    df = frames(scale)['price']
+    return lambda: calculate_growth_metrics(df)
+
+@case('daily_power_law', max_scale=1)
+def _daily_power_law(scale):
+    df = frames(scale)['volume']
+    return lambda: calculate_daily_power_law(df, y_col='Volume_USD')
+
+@case('wallet net_changes')
+def _net_changes(scale):
+    txs = transactions(WALLET_TX_PER_SCALE * scale)
+    return lambda: extract_net_changes(txs, WALLET_ADDRESS)
+
+@case('wallet avg_purchase_price')
+def _avg_price(scale):
+    changes = extract_net_changes(transactions(WALLET_TX_PER_SCALE * scale), WALLET_ADDRESS)
+    prices = price_history()
+    return lambda: calculate_average_purchase_price_over_time(changes, prices)
+
+@case('wallet daily_balance')
+def _daily_balance(scale):
+    df = wallet_frame(WALLET_TX_PER_SCALE * scale)
+    start = pd.to_datetime(price_history()[0]['timestamp'], unit='ms').date()
+    return lambda: daily_balance_history(df, start)
+
+def best_of(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+# ===== PAGE PIPELINES =====
+PAGE_RUN = """
+import json, logging, sys, time
+logging.disable(logging.WARNING)
+sys.path.insert(0, {app_dir!r})
+from streamlit.testing.v1 import AppTest
+import timing
+spans = []
+class Collect(logging.Handler):
+    def emit(self, record):
+        spans.append(json.loads(record.getMessage()))
+logging.disable(logging.NOTSET)
+logging.getLogger('streamlit').setLevel(logging.ERROR)
+timing.logger.handlers = [Collect()]
+at = AppTest.from_file({page!r}, default_timeout={timeout})
+start = time.perf_counter()
+at.run()
+first = time.perf_counter() - start
+figure = sum(s['ms'] for s in spans if s['span'] in {figure_spans!r}) / 1000
+raised = len(at.exception)
+start = time.perf_counter()
+at.run()
+rerun = time.perf_counter() - start
+raised += len(at.exception)
+print(json.dumps({{'timings': {{'first_run': first, 'figure': figure, 'rerun': rerun}}, 'exceptions': raised}}))
+"""
+
+def page_timings(page, data_dir, timeout):
+    """
+    ({metric: seconds}, exceptions) for a page's cold first run, its figure
+    spans and a warm rerun, in a fresh process
+    """
+    with tempfile.TemporaryDirectory() as store_dir:
+        env = dict(os.environ, KASPA_DATA_SOURCE='local', KASPA_DATA_DIR=str(data_dir),
+                   KASPA_SERIES_DIR=store_dir, KASPA_TIMING_LOG='1')
+        code = PAGE_RUN.format(app_dir=str(APP_DIR), page=str(APP_DIR / page), timeout=timeout,
+                               figure_spans=FIGURE_SPANS)
+        result = subprocess.run([sys.executable, '-c', code], cwd=APP_DIR, env=env, capture_output=True, text=True)
+    lines = result.stdout.strip().splitlines()
+    if result.returncode or not lines:
+        raise RuntimeError(f"{page} failed: {result.stderr.strip().splitlines()[-1:]}")
+    run = json.loads(lines[-1])
+    return run['timings'], run['exceptions']
+
+# ===== RUN =====
+def run(scales, repeat, names, pages, timeout):
+    rows = []
+    for scale in scales:
+        for name in names:
+            max_scale, setup = CASES[name]
+            if max_scale is not None and scale > max_scale:
+                continue
+            rows.append({'case': name, 'scale': scale, 'seconds': best_of(setup(scale), repeat), 'error': ''})
+        if not pages:
+            continue
+        with tempfile.TemporaryDirectory() as data_dir:
+            write_synthetic_history(Path(data_dir), scale)
+            for page in pages:
+                timings, exceptions = page_timings(page, data_dir, timeout)
+                error = f'raised {exceptions}' if exceptions else ''
+                for metric, seconds in timings.items():
+                    rows.append({'case': f'page {Path(page).stem} {metric}', 'scale': scale,
+                                 'seconds': seconds, 'error': error})
+    return pd.DataFrame(rows)
+
+def result_key(row):
+    return f"{row['case']} @{row['scale']}x"
+
+def compare(results, baseline, threshold, min_delta):
+    """
+    Adds baseline seconds and the ratio to it; returns the rows over
+    threshold x baseline, leaving out page runs that raised
+    """
+    results['baseline'] = [baseline.get(result_key(row), np.nan) for _, row in results.iterrows()]
+    results['ratio'] = (results['seconds'] / results['baseline']).round(2)
+    slower = results['seconds'] - results['baseline'] > min_delta
+    return results[(results['ratio'] > threshold) & slower & (results['error'] == '')]
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--cases', nargs='+', default=list(CASES), choices=list(CASES))
+    parser.add_argument('--pages', nargs='+', default=PAGES)
+    parser.add_argument('--skip-pages', action='store_true')
+    parser.add_argument('--timeout', type=float, default=600)
+    parser.add_argument('--baseline', type=Path, default=BASELINE_PATH)
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help='fail when a case takes more than this many times its baseline')
+    parser.add_argument('--min-delta', type=float, default=REGRESSION_MIN_DELTA,
+                        help='seconds a case must also lose against its baseline to fail')
+    parser.add_argument('--save-baseline', action='store_true', help='write these results as the new baseline')
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    results = run(args.scales, args.repeat, args.cases, [] if args.skip_pages else args.pages, args.timeout)
+    results['seconds'] = results['seconds'].round(5)
+    failed = results[results['error'] != '']
+
+    if args.save_baseline:
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        saved = results[results['error'] == '']
+        baseline.update({result_key(row): row['seconds'] for _, row in saved.iterrows()})
+        for _, row in failed.iterrows():
+            baseline.pop(result_key(row), None)
+        args.baseline.write_text(json.dumps(dict(sorted(baseline.items())), indent=2) + '\n')
+        print(results.to_string(index=False))
+        print(f"\nSaved {len(saved)} results to {args.baseline}")
+        if len(failed):
+            print(f"Left out {len(failed)} results of page runs that raised")
+        sys.exit(0)
+
+    baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+    regressions = compare(results, baseline, args.threshold, args.min_delta)
+    print(results.to_string(index=False))
+    if len(regressions):
+        print(f"\nSlower than {args.threshold}x baseline:")
+        print(regressions.to_string(index=False))
+    if len(failed):
+        print("\nPage runs raised:")
+        print(failed.to_string(index=False))
+    if len(regressions) or len(failed):
+        sys.exit(1)
@@ -0,0 +1,139 @@
+from collections import namedtuple
+from functools import lru_cache
+import pandas as pd
+from kaspa_api import api_get, map_concurrent
+
+SOMPI_PER_KAS = 1e8
+MAX_BLUE_SCORE_RANGE = 50
+
+# ===== TRANSACTION LOOKUPS =====
+@lru_cache(maxsize=20_000)
+def fetch_transaction_rows(tx_id):
+    """
+    Resolves one transaction into immutable (inputs, outputs) row tuples
+
+    Transaction inputs and outputs never change once a transaction exists, so
+    results are memoized process-wide with no expiry. Failed lookups raise and
+    are therefore not cached.
+    """
+    tx = api_get(f"/transactions/{tx_id}", params={"resolve_previous_outpoints": "light"})
+    inputs = tuple(
+        (
+            tx_id,
+            inp.get('index', i),
+            inp.get('previous_outpoint_hash', ''),
+            inp.get('previous_outpoint_index', ''),
+            inp.get('previous_outpoint_address') or '',
+            float(inp.get('previous_outpoint_amount') or 0) / SOMPI_PER_KAS,
+        )
+        for i, inp in enumerate(tx.get('inputs') or [])
+    )
+    outputs = tuple(
+        (
+            tx_id,
+            out.get('index', i),
+            out.get('script_public_key_address') or '',
+            float(out.get('amount') or 0) / SOMPI_PER_KAS,
+        )
+        for i, out in enumerate(tx.get('outputs') or [])
+    )
+    return inputs, outputs
+
+def resolve_transactions(tx_ids):
+    """
+    Resolves many transactions concurrently through the pooled client
+
+    Returns inputs_df, outputs_df and the list of tx ids that failed to resolve.
+    """
+    input_rows, output_rows, failed = [], [], []
+    for tx_id, rows, error in map_concurrent(fetch_transaction_rows, dict.fromkeys(tx_ids)):
+        if error is not None:
+            failed.append(tx_id)
+            continue
+        input_rows.extend(rows[0])
+        output_rows.extend(rows[1])
+
+    inputs_df = pd.DataFrame(input_rows, columns=[
+        'transaction_id', 'index', 'previous_outpoint_hash', 'previous_outpoint_index', 'address', 'amount'
+    ])
+    outputs_df = pd.DataFrame(output_rows, columns=['transaction_id', 'index', 'address', 'amount'])
+    return inputs_df, outputs_df, failed
+
+# ===== BLOCK DRILL-DOWN =====
+BlockOutline = namedtuple('BlockOutline', ['hash', 'blue_score', 'timestamp', 'tx_ids'])
+
+def _block_outline(block):
+    verbose = block.get('verboseData') or {}
+    tx_ids = tuple(
+        (tx.get('verboseData') or {}).get('transactionId', '')
+        for tx in block.get('transactions') or [] if isinstance(tx, dict)
+    )
+    return BlockOutline(
+        verbose.get('hash', ''),
+        verbose.get('blueScore', ''),
+        (block.get('header') or {}).get('timestamp', ''),
+        tuple(tx_id for tx_id in tx_ids if tx_id),
+    )
+
+@lru_cache(maxsize=4_096)
+def fetch_block_outline(block_hash):
+    """Block contents are immutable once the block exists, so they are memoized like transactions"""
+    return _block_outline(api_get(f"/blocks/{block_hash}", params={"includeTransactions": True}))
+
+def fetch_blue_score_outlines(blue_score):
+    """Not memoized: blocks near the tip can still arrive at a recent blue score"""
+    blocks = api_get("/blocks-from-bluescore", params={"blueScore": blue_score, "includeTransactions": True})
+    return [_block_outline(block) for block in blocks or []]
+
+def drill_down(outlines):
+    """
+    Resolves every transaction of the given blocks into per-block, per-transaction,
+    input and output tables. Lookups that fail are reported in 'failed' and retried
+    on the next call since only successful lookups are memoized.
+    """
+    tx_block = {tx_id: outline.hash for outline in outlines for tx_id in outline.tx_ids}
+    inputs_df, outputs_df, failed = resolve_transactions(tx_block)
+
+    totals = pd.DataFrame({'transaction_id': list(tx_block), 'block_hash': list(tx_block.values())})
+    totals = totals.merge(
+        inputs_df.groupby('transaction_id')['amount'].agg(inputs='size', input_amount='sum'),
+        on='transaction_id', how='left')
+    totals = totals.merge(
+        outputs_df.groupby('transaction_id')['amount'].agg(outputs='size', output_amount='sum'),
+        on='transaction_id', how='left')
+    totals[['inputs', 'outputs']] = totals[['inputs', 'outputs']].fillna(0).astype(int)
+    totals[['input_amount', 'output_amount']] = totals[['input_amount', 'output_amount']].fillna(0.0)
+
+    blocks_df = pd.DataFrame(
+        [(o.hash, o.blue_score, o.timestamp, len(o.tx_ids)) for o in outlines],
+        columns=['hash', 'blue_score', 'timestamp', 'transactions'])
+
+    return {
+        'blocks': blocks_df,
+        'transactions': totals,
+        'inputs': inputs_df,
+        'outputs': outputs_df,
+        'failed': failed,
+    }
+
+def drill_down_block(block_hash):
+    """Fetches a block and resolves all of its transactions in one call"""
+    return drill_down([fetch_block_outline(block_hash)])
+
+def drill_down_blue_score_range(start_blue_score, end_blue_score):
+    """
+    Fetches every block with a blue score in [start, end], one request per blue
+    score on the pool, and resolves all of their transactions
+    """
+    if end_blue_score < start_blue_score:
+        raise ValueError("End blue score must not be below the start blue score")
+    if end_blue_score - start_blue_score + 1 > MAX_BLUE_SCORE_RANGE:
+        raise ValueError(f"Blue score range is limited to {MAX_BLUE_SCORE_RANGE} blue scores")
+
+    outlines = {}
+    for blue_score, result, error in map_concurrent(fetch_blue_score_outlines, range(start_blue_score, end_blue_score + 1)):
+        if error is not None:
+            raise error
+        for outline in result:
+            outlines[outline.hash] = outline
+    return drill_down(list(outlines.values()))
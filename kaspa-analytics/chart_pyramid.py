@@ -0,0 +1,136 @@
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+
+# ===== AGGREGATION PYRAMID =====
+# Daily, weekly (Monday-based) and monthly aggregates of a series. Each level has
+# the source's columns as bucket means, so chart code can use any level like
+# the original frame, plus <col>_open/_high/_low/_close for float columns and
+# the number of source rows per bucket in `count`.
+
+NS_PER_DAY = 86_400 * 10**9
+MONDAY_OFFSET = 4  # 1970-01-01 was a Thursday
+
+AGG_LEVELS = ['daily', 'weekly', 'monthly']
+LEVEL_NAMES = {'raw': 'All points', 'daily': 'Daily', 'weekly': 'Weekly avg', 'monthly': 'Monthly avg'}
+
+# Coarsest level that still puts at least this many points in the visible span
+MIN_CHART_POINTS = 200
+
+# source: the frame the levels were built from, kept to detect appends on refresh;
+# reused_rows: source rows whose buckets were carried over from the previous build
+Pyramid = namedtuple('Pyramid', ['source', 'levels', 'reused_rows'])
+
+def _date_ns(dates):
+    if dates.dt.tz is not None:
+        dates = dates.dt.tz_convert('UTC').dt.tz_localize(None)
+    return dates.to_numpy('datetime64[ns]').view('int64')
+
+def _bucket_ids(ns, level):
+    days = ns // NS_PER_DAY
+    if level == 'daily':
+        return days
+    if level == 'weekly':
+        return (days - MONDAY_OFFSET) // 7
+    return ns.view('datetime64[ns]').astype('datetime64[M]').astype('int64')
+
+def aggregate(df, level, columns=None):
+    """
+    Aggregates a date-sorted frame into calendar buckets
+
+    NaNs are ignored; a bucket whose values are all NaN is NaN. Integer columns
+    (day counts) are averaged, float columns also get open/high/low/close.
+    """
+    if level == 'raw':
+        return df
+    if columns is None:
+        columns = [c for c in df.columns if c != 'Date' and pd.api.types.is_numeric_dtype(df[c])]
+
+    ns = _date_ns(df['Date'])
+    ids = _bucket_ids(ns, level)
+    if len(ids) == 0:
+        return pd.DataFrame(columns=['Date', 'count'] + list(columns))
+    starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]])
+    ends = np.r_[starts[1:], len(ids)]
+    counts = ends - starts
+
+    # mean timestamp, from offsets to each bucket's first row so the sum can't overflow
+    first = ns[starts]
+    offsets = (ns - np.repeat(first, counts)).astype('float64')
+    dates = pd.to_datetime(first + (np.add.reduceat(offsets, starts) / counts).astype('int64'))
+    data = {'Date': dates.tz_localize('UTC') if df['Date'].dt.tz is not None else dates}
+    ohlc = {}
+    for column in columns:
+        values = df[column].to_numpy()
+        if not np.issubdtype(values.dtype, np.floating):
+            data[column] = np.add.reduceat(values.astype('float64'), starts) / counts
+            continue
+        valid = ~np.isnan(values)
+        valid_counts = np.add.reduceat(valid.astype('int64'), starts)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            data[column] = np.add.reduceat(np.where(valid, values, 0.0), starts) / valid_counts
+        ohlc[f'{column}_open'] = values[starts]
+        ohlc[f'{column}_high'] = np.fmax.reduceat(values, starts)
+        ohlc[f'{column}_low'] = np.fmin.reduceat(values, starts)
+        ohlc[f'{column}_close'] = values[ends - 1]
+    data.update(ohlc)
+    data['count'] = counts
+    return pd.DataFrame(data)
+
+def _is_prefix(previous, df):
+    """Whether df starts with exactly the rows `previous` was built from"""
+    n = len(previous)
+    if n == 0 or len(df) < n or list(previous.columns) != list(df.columns):
+        return False
+    if not np.array_equal(_date_ns(previous['Date']), _date_ns(df['Date'])[:n]):
+        return False
+    for column in df.columns.drop('Date'):
+        old, new = previous[column].to_numpy(), df[column].to_numpy()[:n]
+        if not np.array_equal(old, new, equal_nan=old.dtype.kind == 'f'):
+            return False
+    return True
+
+def build_pyramid(df, previous=None):
+    """
+    Builds all levels for a series, reusing `previous` (a Pyramid of an earlier
+    version) when the new rows only extend it: completed buckets are kept and
+    only the last old bucket onwards is aggregated again
+    """
+    ns = _date_ns(df['Date'])
+    if len(ns) > 1 and (np.diff(ns) < 0).any():
+        df = df.iloc[np.argsort(ns, kind='stable')].reset_index(drop=True)
+
+    reusable = previous is not None and _is_prefix(previous.source, df)
+    levels = {}
+    reused_rows = 0
+    for level in AGG_LEVELS:
+        if reusable:
+            old = previous.levels[level]
+            kept = old.iloc[:-1]
+            cut = int(kept['count'].sum())
+            levels[level] = pd.concat([kept, aggregate(df.iloc[cut:], level)], ignore_index=True)
+            reused_rows = max(reused_rows, cut)
+        else:
+            levels[level] = aggregate(df, level)
+        if level == 'daily' and (levels[level]['count'] == 1).all():
+            # already one row per day: share the source's columns instead of a copy
+            levels[level] = df.assign(count=np.ones(len(df), dtype='int64'))
+    return Pyramid(df, levels, reused_rows)
+
+def trace_name(name, level):
+    """Legend name noting when a trace shows aggregated points"""
+    return f"{name} · {LEVEL_NAMES[level]}" if level in ('weekly', 'monthly') else name
+
+def pick_level(pyramid, start_date=None, end_date=None, min_points=MIN_CHART_POINTS):
+    """Coarsest level with at least min_points buckets between start_date and end_date, else 'raw'"""
+    for level in reversed(AGG_LEVELS):
+        if len(level_slice(pyramid, level, start_date, end_date)) >= min_points:
+            return level
+    return 'raw'
+
+def level_slice(pyramid, level, start_date=None, end_date=None):
+    frame = pyramid.source if level == 'raw' else pyramid.levels[level]
+    dates = frame['Date']
+    lo = dates.searchsorted(start_date, side='left') if start_date is not None else 0
+    hi = dates.searchsorted(end_date, side='right') if end_date is not None else len(frame)
+    return frame.iloc[lo:hi]
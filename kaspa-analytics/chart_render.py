@@ -0,0 +1,207 @@
+import functools
+import os
+import re
+import time
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import streamlit as st
+from timing import span
+from metrics import record_section
+from figure_cache import SpecFigure
+
+# ===== RENDER MODE =====
+# SVG scatter traces get slow in the browser past a few thousand points, and a
+# rangeslider draws every trace a second time underneath the chart. Figures
+# go through apply_render_mode right before st.plotly_chart, which swaps every
+# rangeslider for a navigator whatever the mode, then picks the trace type:
+#   svg   - traces as built
+#   auto  - traces with WEBGL_POINT_THRESHOLD or more points become Scattergl
+#   webgl - every scatter trace becomes Scattergl
+RENDER_MODES = ['auto', 'svg', 'webgl']
+RENDER_MODE = os.environ.get("KASPA_RENDER_MODE", "auto")
+WEBGL_POINT_THRESHOLD = 1000
+
+# Scattergl draws straight segments only
+GL_UNSUPPORTED_LINE = ('shape', 'smoothing')
+
+NAVIGATOR_BUTTONS = [
+    dict(count=1, label="1M", step="month", stepmode="backward"),
+    dict(count=3, label="3M", step="month", stepmode="backward"),
+    dict(count=6, label="6M", step="month", stepmode="backward"),
+    dict(count=1, label="1Y", step="year", stepmode="backward"),
+    dict(step="all", label="All"),
+]
+
+def trace_points(trace):
+    y = trace.y if trace.y is not None else trace.x
+    return 0 if y is None else len(y)
+
+def _to_gl(trace):
+    props = trace.to_plotly_json()
+    props.pop('type', None)
+    line = props.get('line')
+    if line:
+        props['line'] = {k: v for k, v in line.items() if k not in GL_UNSUPPORTED_LINE}
+    return go.Scattergl(props)
+
+def _is_date_axis(fig, axis):
+    if axis.type == 'log':
+        return False
+    if axis.type == 'date':
+        return True
+    for trace in fig.data:
+        if trace.x is not None and len(trace.x):
+            return pd.api.types.infer_dtype(np.asarray(trace.x[:1]), skipna=True) in ('datetime64', 'datetime', 'date')
+    return False
+
+def use_navigator(fig):
+    """
+    Replaces rangesliders with rangeselector buttons on date axes (log axes
+    keep drag-to-zoom only); buttons don't redraw any trace
+    """
+    for name in fig.layout:
+        if not name.startswith('xaxis'):
+            continue
+        axis = fig.layout[name]
+        if not axis.rangeslider.visible:
+            continue
+        axis.rangeslider.visible = False
+        if _is_date_axis(fig, axis):
+            axis.rangeselector = dict(
+                buttons=NAVIGATOR_BUTTONS,
+                bgcolor='#3A3C4A',
+                activecolor='#00FFCC',
+                bordercolor='#3A3C4A',
+                font=dict(color='#e0e0e0', size=11),
+                x=0, y=1.02, xanchor='left', yanchor='bottom',
+            )
+    return fig
+
+def apply_render_mode(fig, mode=None):
+    """
+    Returns fig rendered for `mode` (RENDER_MODE by default) with its arrays
+    compacted for transport; may be a new Figure
+    """
+    mode = mode or RENDER_MODE
+    # Before compacting: the navigator checks x for dates
+    use_navigator(fig)
+    if mode == 'svg':
+        return compact_arrays(fig)
+    traces, converted = [], False
+    for trace in fig.data:
+        if trace.type == 'scatter' and (mode == 'webgl' or trace_points(trace) >= WEBGL_POINT_THRESHOLD):
+            traces.append(_to_gl(trace))
+            converted = True
+        else:
+            traces.append(trace)
+    if converted:
+        fig = go.Figure(data=traces, layout=fig.layout)
+    return compact_arrays(fig)
+
+# ===== ARRAY TRANSPORT =====
+# Plotly writes numeric numpy arrays as base64 typed arrays ({dtype, bdata})
+# and everything else as JSON lists: a date is a 20-odd character string per
+# point, once for x and again for the hover text. compact_arrays rewrites a
+# built figure so its bulk data takes the binary path:
+#   - datetime x values become float64 epoch milliseconds on an explicit date axis
+#   - per-point text repeating the x dates is dropped, hovertemplates format %{x} instead
+#   - other date text (x is days or hashrate) is cut to YYYY-MM-DD
+#   - numeric lists and tuples of BINARY_MIN_POINTS or more become arrays
+#     (a typed-array wrapper costs more than a few numbers)
+BINARY_MIN_POINTS = 16
+
+_TEXT_FIELD = re.compile(r'%\{text(\|[^}]*)?\}')
+_ISO_DATE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+def _dates(values):
+    """values as a datetime64[ns] array when they are datetimes or ISO date strings, else None"""
+    if values is None or isinstance(values, str) or len(values) == 0:
+        return None
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype('datetime64[ns]')
+    first = values.flat[0]
+    # Lists of strftime strings come out of np.asarray as fixed-width '<U10', not object
+    if values.dtype.kind in 'OU' and (isinstance(first, pd.Timestamp)
+                                      or (isinstance(first, str) and _ISO_DATE.match(first))):
+        try:
+            return pd.to_datetime(values, utc=True).tz_localize(None).to_numpy('datetime64[ns]')
+        except (ValueError, TypeError):
+            return None
+    return None
+
+def _epoch_ms(dates):
+    ms = dates.astype('datetime64[ms]').astype('int64').astype('float64')
+    ms[np.isnat(dates)] = np.nan
+    return ms
+
+def _numeric_arrays(trace, names=('x', 'y', 'customdata')):
+    for name in names:
+        values = trace[name]
+        if isinstance(values, (list, tuple)) and len(values) >= BINARY_MIN_POINTS:
+            array = np.asarray(values)
+            if array.dtype.kind in 'iuf':
+                # Plotly skips assignments equal to the current value
+                trace[name] = None
+                trace[name] = array
+
+def _drop_date_text(trace):
+    """Points the hovertemplate's %{text} fields at x; False where the text is shown another way"""
+    template = trace.hovertemplate
+    if not isinstance(template, str) or 'text' in (trace.mode or '') or trace.texttemplate:
+        return False
+    trace.hovertemplate = _TEXT_FIELD.sub(lambda m: '%{x' + (m.group(1) or '|%Y-%m-%d') + '}', template)
+    trace.text = None
+    return True
+
+def compact_arrays(fig):
+    """Rewrites fig's traces in place for binary array transport; returns fig"""
+    for trace in fig.data:
+        if trace.type not in ('scatter', 'scattergl'):
+            continue
+        x_dates = _dates(trace.x)
+        if x_dates is not None:
+            axis = fig.layout['xaxis' + (trace.xaxis or 'x')[1:]]
+            if axis.type in (None, '-', 'date'):
+                axis.type = 'date'
+                trace.x = _epoch_ms(x_dates)
+            else:
+                x_dates = None
+        text_dates = _dates(trace.text)
+        if text_dates is not None:
+            repeats_x = x_dates is not None and np.array_equal(text_dates, x_dates)
+            if not (repeats_x and _drop_date_text(trace)):
+                trace.text = np.datetime_as_string(text_dates, unit='D').astype(object)
+        _numeric_arrays(trace)
+    return fig
+
+# ===== RERUN SCOPE =====
+# A page's chart controls and the chart they drive run as a fragment, so a
+# control change reruns only that section instead of the page's CSS, header,
+# data loading and metrics. Streamlit versions without fragments run the
+# section as part of the page, as before.
+_fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None)
+
+# Seconds the last run of each chart section took, by section name
+section_timings = {}
+
+def chart_fragment(func):
+    """Decorator making a page section its own rerun unit, timed into section_timings"""
+    @functools.wraps(func)
+    def section(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            with span(func.__name__):
+                return func(*args, **kwargs)
+        finally:
+            section_timings[func.__name__] = time.perf_counter() - start
+            record_section(func.__name__, section_timings[func.__name__])
+    return _fragment(section) if _fragment else section
+
+def plotly_chart(fig, **kwargs):
+    """st.plotly_chart, timed as a span (Streamlit serializes the figure here)"""
+    with span('plotly_chart'):
+        if isinstance(fig, go.Figure) and not isinstance(fig, SpecFigure):
+            compact_arrays(fig)
+        return st.plotly_chart(fig, **kwargs)
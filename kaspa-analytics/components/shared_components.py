@@ -1,4 +1,5 @@
 import streamlit as st
+from theme import use_stylesheet
 from datetime import datetime
 
 def render_page_config(page_title="Kaspa Analytics Pro", page_icon="💎"):
@@ -12,689 +13,7 @@ def render_page_config(page_title="Kaspa Analytics Pro", page_icon="💎"):
 
 def render_custom_css_with_sidebar():
     """Enhanced CSS with beautiful sidebar dropdowns and glow effects - SIMPLIFIED VERSION"""
-    st.markdown("""
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
-        @import url('https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css');
-        
-        /* Base styles with background effects */
-        html, body, .stApp {
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif !important;
-            background: linear-gradient(135deg, #0a0e1a 0%, #1a1f2e 50%, #0f1419 100%) !important;
-            color: #e2e8f0 !important;
-            overflow-x: hidden !important;
-        }
-        
-        .stApp {
-            background-attachment: fixed !important;
-        }
-        
-        /* Background gradient effects */
-        .stApp::before {
-            content: '';
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background-image: 
-                radial-gradient(circle at 20% 80%, rgba(120, 119, 198, 0.15) 0%, transparent 50%),
-                radial-gradient(circle at 80% 20%, rgba(255, 119, 198, 0.15) 0%, transparent 50%),
-                radial-gradient(circle at 40% 40%, rgba(120, 219, 255, 0.15) 0%, transparent 50%);
-            pointer-events: none;
-            z-index: -1;
-            animation: backgroundShift 20s ease-in-out infinite;
-        }
-        
-        @keyframes backgroundShift {
-            0%, 100% { opacity: 1; transform: translateX(0px) translateY(0px); }
-            50% { opacity: 0.8; transform: translateX(20px) translateY(-20px); }
-        }
-        
-        @keyframes shimmer {
-            0% {
-                background-position: -200% center;
-                text-shadow: 0 0 10px rgba(241, 245, 249, 0.3);
-            }
-            50% {
-                text-shadow: 
-                    0 0 20px rgba(0, 212, 255, 0.6),
-                    0 0 30px rgba(0, 212, 255, 0.4),
-                    0 0 40px rgba(0, 212, 255, 0.2);
-            }
-            100% {
-                background-position: 200% center;
-                text-shadow: 0 0 10px rgba(241, 245, 249, 0.3);
-            }
-        }
-        
-        @keyframes glow {
-            0%, 100% {
-                text-shadow: 
-                    0 0 10px rgba(241, 245, 249, 0.3),
-                    0 0 20px rgba(0, 212, 255, 0.2),
-                    0 0 30px rgba(0, 212, 255, 0.1);
-            }
-            50% {
-                text-shadow: 
-                    0 0 20px rgba(241, 245, 249, 0.5),
-                    0 0 30px rgba(0, 212, 255, 0.4),
-                    0 0 40px rgba(0, 212, 255, 0.3),
-                    0 0 50px rgba(0, 212, 255, 0.2);
-            }
-        }
-        
-        /* Professional Header - Improved layout and gradient */
-        .professional-header {
-            position: fixed !important;
-            top: 0 !important;
-            left: 0 !important;
-            right: 0 !important;
-            width: 100vw !important;
-            height: 80px !important;
-            background: linear-gradient(135deg, #0a0e1a 0%, #1a1f2e 50%, #0f1419 100%) !important;
-            backdrop-filter: blur(25px) !important;
-            border-bottom: 1px solid rgba(100, 116, 139, 0.2) !important;
-            padding: 0 60px !important;
-            z-index: 999999999 !important;
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.4) !important;
-            display: flex !important;
-            align-items: center !important;
-            justify-content: space-between !important;
-        }
-        
-        .header-content {
-            display: flex !important;
-            align-items: center !important;
-            justify-content: space-between !important;
-            width: 100% !important;
-            max-width: none !important;
-        }
-        
-        /* Brand section - moved more to the left */
-        .brand-section {
-            display: flex !important;
-            align-items: center !important;
-            gap: 15px !important;
-            flex: 0 0 auto !important;
-        }
-        
-        /* Updated logo with blue/cyan theme only */
-        .logo {
-            width: 45px !important;
-            height: 45px !important;
-            background: linear-gradient(135deg, #00d4ff 0%, #0099cc 50%, #006699 100%) !important;
-            border-radius: 12px !important;
-            display: flex !important;
-            align-items: center !important;
-            justify-content: center !important;
-            font-size: 24px !important;
-            color: white !important;
-            font-weight: 800 !important;
-            box-shadow: 0 4px 15px rgba(0, 212, 255, 0.3) !important;
-            position: relative !important;
-            overflow: hidden !important;
-        }
-        
-        /* Add a subtle inner glow to the logo */
-        .logo::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: radial-gradient(circle at 30% 30%, rgba(255, 255, 255, 0.2) 0%, transparent 60%);
-            border-radius: 12px;
-            pointer-events: none;
-        }
-        
-        /* Simplified brand text - removed subtitle */
-        .brand-text {
-            display: flex !important;
-            flex-direction: column !important;
-        }
-        
-        .brand-text h1 {
-            font-size: 26px !important;
-            font-weight: 800 !important;
-            background: linear-gradient(135deg, #00d4ff 0%, #94a3b8 50%, #e2e8f0 100%) !important;
-            -webkit-background-clip: text !important;
-            -webkit-text-fill-color: transparent !important;
-            margin: 0 !important;
-            line-height: 1.1 !important;
-            text-shadow: 0 0 20px rgba(0, 212, 255, 0.1) !important;
-        }
-        
-        /* Auth section - moved more to the right */
-        .auth-section {
-            display: flex !important;
-            align-items: center !important;
-            gap: 12px !important;
-            flex: 0 0 auto !important;
-            margin-left: auto !important;
-        }
-        
-        /* Updated login button to match theme */
-        .login-button {
-            background: transparent !important;
-            border: 1px solid rgba(100, 116, 139, 0.4) !important;
-            border-radius: 10px !important;
-            padding: 8px 16px !important;
-            color: #cbd5e1 !important;
-            font-size: 13px !important;
-            font-weight: 600 !important;
-            cursor: pointer !important;
-            transition: all 0.3s ease !important;
-        }
-        
-        .login-button:hover {
-            border-color: rgba(0, 212, 255, 0.6) !important;
-            color: #00d4ff !important;
-            background: rgba(0, 212, 255, 0.05) !important;
-        }
-        
-        /* Updated signup button with blue theme only */
-        .signup-button {
-            background: linear-gradient(135deg, #00d4ff 0%, #0099cc 100%) !important;
-            border: none !important;
-            border-radius: 10px !important;
-            padding: 10px 20px !important;
-            color: white !important;
-            font-size: 13px !important;
-            font-weight: 700 !important;
-            cursor: pointer !important;
-            box-shadow: 0 4px 15px rgba(0, 212, 255, 0.3) !important;
-            transition: all 0.3s ease !important;
-        }
-        
-        .signup-button:hover {
-            transform: translateY(-1px) !important;
-            box-shadow: 0 6px 20px rgba(0, 212, 255, 0.4) !important;
-            background: linear-gradient(135deg, #00d4ff 0%, #00aadd 100%) !important;
-        }
-        
-        /* Ultra-professional sidebar with matching gradient - FIXED gap */
-        section[data-testid="stSidebar"] {
-            background: linear-gradient(135deg, #0a0e1a 0%, #1a1f2e 50%, #0f1419 100%) !important;
-            border-right: 1px solid rgba(100, 116, 139, 0.2) !important;
-            margin-top: 80px !important;
-            backdrop-filter: blur(25px) !important;
-            box-shadow: 8px 0 32px rgba(0, 0, 0, 0.4) !important;
-            position: relative !important;
-        }
-        
-        /* Add subtle gradient overlay for extra depth */
-        section[data-testid="stSidebar"]::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            right: 0;
-            bottom: 0;
-            background: linear-gradient(180deg, rgba(0, 212, 255, 0.02) 0%, transparent 30%, transparent 70%, rgba(0, 212, 255, 0.02) 100%);
-            pointer-events: none;
-            z-index: 1;
-        }
-        
-        /* Fix sidebar collapse/expand button positioning */
-        button[data-testid="collapsedControl"] {
-            top: 90px !important;
-            left: 8px !important;
-            z-index: 999999998 !important;
-            background: linear-gradient(135deg, rgba(30, 41, 59, 0.9) 0%, rgba(15, 23, 42, 0.9) 100%) !important;
-            border: 1px solid rgba(100, 116, 139, 0.3) !important;
-            border-radius: 8px !important;
-            width: 32px !important;
-            height: 32px !important;
-            backdrop-filter: blur(15px) !important;
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3) !important;
-        }
-        
-        /* Ensure sidebar content is above the overlay */
-        section[data-testid="stSidebar"] > div {
-            background: transparent !important;
-            padding: 16px 12px !important;
-            position: relative !important;
-            z-index: 2 !important;
-        }
-        
-        /* Hide Streamlit's default navigation */
-        nav[data-testid="stSidebarNav"] {
-            display: none !important;
-        }
-        
-        /* Hide radio buttons for navigation */
-        section[data-testid="stSidebar"] .stRadio {
-            display: none !important;
-        }
-        
-        /* CRITICAL: Preserve selectbox dropdown buttons in main content */
-        .main .stSelectbox button {
-            display: block !important;
-            visibility: visible !important;
-        }
-        
-        /* Ensure dropdown arrows are visible */
-        .main .stSelectbox svg {
-            display: block !important;
-            visibility: visible !important;
-        }
-        
-        /* Head metrics styling */
-        .head-metric {
-            font-size: 12px !important;
-            font-weight: 600 !important;
-            color: #94a3b8 !important;
-            text-transform: uppercase !important;
-            letter-spacing: 0.5px !important;
-            margin: 16px 0 8px 0 !important;
-            cursor: pointer !important;
-            transition: color 0.2s ease !important;
-            display: flex !important;
-            align-items: center !important;
-            gap: 8px !important;
-        }
-        
-        .head-metric:hover {
-            color: #cbd5e1 !important;
-        }
-        
-        .head-metric:first-child {
-            margin-top: 8px !important;
-        }
-        
-        .head-metric i {
-            color: #94a3b8 !important;
-            font-size: 12px !important;
-            width: 16px !important;
-            text-align: center !important;
-            transition: color 0.2s ease !important;
-        }
-        
-        .head-metric:hover i {
-            color: #cbd5e1 !important;
-        }
-        
-        /* Sub metrics styling */
-        .sub-metric {
-            font-size: 12px !important;
-            font-weight: 600 !important;
-            color: #64748b !important;
-            text-transform: uppercase !important;
-            letter-spacing: 0.5px !important;
-            margin: 4px 0 4px 16px !important;
-            cursor: pointer !important;
-            transition: color 0.2s ease !important;
-            display: flex !important;
-            align-items: center !important;
-            gap: 8px !important;
-        }
-        
-        .sub-metric:hover {
-            color: #94a3b8 !important;
-        }
-        
-        .sub-metric.active {
-            color: #00d4ff !important;
-        }
-        
-        .sub-metric i {
-            color: #64748b !important;
-            font-size: 12px !important;
-            width: 16px !important;
-            text-align: center !important;
-            transition: color 0.2s ease !important;
-        }
-        
-        .sub-metric:hover i {
-            color: #94a3b8 !important;
-        }
-        
-        .sub-metric.active i {
-            color: #00d4ff !important;
-        }
-        
-        /* Chart section styling */
-        .chart-section {
-            margin: 12px 40px 28px 40px;
-            background: rgba(30, 41, 59, 0.4);
-            backdrop-filter: blur(25px);
-            border: none;
-            border-radius: 16px;
-            overflow: hidden;
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.25);
-            position: relative;
-            transition: all 0.3s ease;
-        }
-        
-        /* Header section with controls */
-        .header-section {
-            padding: 15px 40px 15px 40px;
-            background: transparent;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            flex-wrap: wrap;
-            gap: 15px;
-            margin-bottom: 20px;
-        }
-        
-        .title-container {
-            flex: 0 0 auto;
-        }
-        
-        .main-title {
-            font-size: 16px;
-            font-weight: 700;
-            color: #ffffff;
-            margin: 0;
-            letter-spacing: 0.5px;
-            text-align: left;
-            text-shadow: 0 0 8px rgba(255, 255, 255, 0.3);
-            position: relative;
-            white-space: nowrap;
-            line-height: 1.2;
-        }
-        
-        .controls-container {
-            display: flex;
-            gap: 20px;
-            align-items: center;
-            flex-wrap: wrap;
-            flex: 1;
-            justify-content: flex-end;
-        }
-        
-        .control-group {
-            display: flex;
-            flex-direction: column;
-            gap: 3px;
-            min-width: 120px;
-        }
-        
-        .control-label {
-            font-size: 11px;
-            font-weight: 600;
-            color: #94a3b8;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-            margin-bottom: 0;
-            white-space: nowrap;
-            line-height: 1;
-        }
-        
-        /* EXACT ORIGINAL: Match your exact original dropdown styling */
-        
-        .stSelectbox > div > div {
-            background: linear-gradient(135deg, rgba(30, 41, 59, 0.9) 0%, rgba(15, 23, 42, 0.9) 100%) !important;
-            border: 2px solid rgba(100, 116, 139, 0.3) !important;
-            border-radius: 12px !important;
-            backdrop-filter: blur(15px) !important;
-            transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1) !important;
-            box-shadow: 0 4px 16px rgba(0, 0, 0, 0.2) !important;
-            min-height: 26px !important;
-            width: 150px !important;
-            max-width: 250px !important;
-            min-width: 100px !important;
-        }
-        
-        .stSelectbox > div > div:hover {
-            border-color: #00d4ff !important;
-            box-shadow: 0 8px 32px rgba(0, 212, 255, 0.2), 0 0 0 1px rgba(0, 212, 255, 0.3) !important;
-            transform: translateY(-2px);
-        }
-        
-        .stSelectbox > div > div > div {
-            color: #f1f5f9 !important;
-            font-weight: 600 !important;
-            font-size: 13px !important;
-            padding: 8px 16px !important;
-            background: transparent !important;
-        }
-        
-        /* Reset any deeper nested elements to prevent conflicts */
-        .stSelectbox > div > div > div > div,
-        .stSelectbox > div > div > div > div > div {
-            background: transparent !important;
-            border: none !important;
-            box-shadow: none !important;
-            backdrop-filter: none !important;
-            transform: none !important;
-        }
-        
-        /* Ensure dropdown arrow is visible and styled */
-        .stSelectbox button,
-        .stSelectbox svg {
-            display: block !important;
-            visibility: visible !important;
-            background: transparent !important;
-            border: none !important;
-            color: #94a3b8 !important;
-            width: 16px !important;
-            height: 16px !important;
-        }
-        
-        /* Style the dropdown menu when opened - FIXED nested panels */
-        
-        /* Target only the outermost popover container */
-        div[data-baseweb="popover"]:not(div[data-baseweb="popover"] div[data-baseweb="popover"]) {
-            background: rgba(15, 20, 25, 0.98) !important;
-            backdrop-filter: blur(25px) !important;
-            border: 1px solid rgba(0, 212, 255, 0.3) !important;
-            border-radius: 12px !important;
-            box-shadow: 0 12px 40px rgba(0, 0, 0, 0.4) !important;
-            margin-top: 4px !important;
-            max-height: none !important;
-            height: auto !important;
-            overflow: visible !important;
-            overflow-x: hidden !important;
-            overflow-y: hidden !important;
-        }
-        
-        /* Reset all nested elements inside popover to prevent double styling */
-        div[data-baseweb="popover"] div[data-baseweb="popover"],
-        div[data-baseweb="popover"] > div,
-        div[data-baseweb="popover"] > div > div,
-        div[data-baseweb="menu"],
-        div[data-baseweb="menu"] > div {
-            background: transparent !important;
-            border: none !important;
-            box-shadow: none !important;
-            backdrop-filter: none !important;
-            border-radius: 0 !important;
-        }
-        
-        /* Target the list container specifically */
-        ul[role="listbox"] {
-            background: transparent !important;
-            border: none !important;
-            box-shadow: none !important;
-            backdrop-filter: none !important;
-            padding: 4px !important;
-            margin: 0 !important;
-            max-height: none !important;
-            overflow: visible !important;
-        }
-        
-        /* Specifically target the scrollable container inside popover */
-        div[data-baseweb="popover"] div[role="presentation"],
-        div[data-baseweb="menu"] div[role="presentation"] {
-            background: transparent !important;
-            border: none !important;
-            box-shadow: none !important;
-            backdrop-filter: none !important;
-            max-height: none !important;
-            overflow: visible !important;
-            overflow-y: visible !important;
-            scrollbar-width: none !important;
-            -ms-overflow-style: none !important;
-        }
-        
-        /* Hide any scrollbars that might appear */
-        div[data-baseweb="popover"] ::-webkit-scrollbar,
-        div[data-baseweb="menu"] ::-webkit-scrollbar {
-            display: none !important;
-            width: 0 !important;
-            height: 0 !important;
-        }
-        
-        /* Style dropdown options - ensure they don't cause overflow */
-        li[role="option"],
-        div[role="option"] {
-            background: transparent !important;
-            color: #e2e8f0 !important;
-            padding: 12px 16px !important;
-            font-weight: 500 !important;
-            font-size: 13px !important;
-            transition: all 0.2s ease !important;
-            border-radius: 8px !important;
-            margin: 2px 4px !important;
-            white-space: nowrap !important;
-            flex-shrink: 0 !important;
-            border: none !important;
-            box-shadow: none !important;
-        }
-        
-        li[role="option"]:hover,
-        div[role="option"]:hover {
-            background: rgba(0, 212, 255, 0.1) !important;
-            color: #00d4ff !important;
-        }
-        
-        .chart-content {
-            padding: 8px 28px;
-            position: relative;
-        }
-        
-        /* Metric cards styling */
-        .metric-card {
-            background: rgba(30, 41, 59, 0.4) !important;
-            backdrop-filter: blur(25px) !important;
-            border: 1px solid rgba(255, 255, 255, 0.15) !important;
-            border-radius: 16px !important;
-            padding: 24px !important;
-            position: relative !important;
-            overflow: hidden !important;
-            transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1) !important;
-            cursor: pointer !important;
-            margin-bottom: 16px !important;
-            width: 100% !important;
-            box-sizing: border-box !important;
-            box-shadow: 0 4px 20px rgba(0, 0, 0, 0.2) !important;
-        }
-        
-        .metric-card:hover {
-            border-color: rgba(0, 212, 255, 0.4) !important;
-            box-shadow: 0 8px 32px rgba(0, 212, 255, 0.15), 0 0 0 1px rgba(0, 212, 255, 0.2) !important;
-            transform: translateY(-3px) !important;
-            background: rgba(30, 41, 59, 0.6) !important;
-        }
-        
-        .metric-label {
-            color: #94a3b8 !important;
-            font-size: 12px !important;
-            font-weight: 600 !important;
-            text-transform: uppercase !important;
-            letter-spacing: 1px !important;
-            margin-bottom: 10px !important;
-        }
-        
-        .metric-value {
-            color: #f1f5f9 !important;
-            font-size: 28px !important;
-            font-weight: 800 !important;
-            line-height: 1.1 !important;
-            margin-bottom: 6px !important;
-            text-shadow: 0 0 15px rgba(255, 255, 255, 0.1);
-        }
-        
-        .metric-delta {
-            font-size: 14px !important;
-            font-weight: 700 !important;
-            margin-bottom: 8px;
-        }
-        
-        .metric-delta.positive {
-            color: #00ff88 !important;
-        }
-        
-        .metric-delta.negative {
-            color: #ff4757 !important;
-        }
-        
-        .stPlotlyChart {
-            border-radius: 12px;
-            overflow: hidden;
-            box-shadow: 0 6px 24px rgba(0, 0, 0, 0.2);
-        }
-        
-        .stPlotlyChart .modebar {
-            background: transparent !important;
-            transform: translateY(10px) !important;
-        }
-        
-        .stPlotlyChart .modebar-group {
-            background: transparent !important;
-        }
-        
-        /* Main content adjustments */
-        .main .block-container {
-            padding-top: 100px !important;
-            padding-left: 0px !important;
-            padding-right: 0px !important;
-            max-width: 100% !important;
-        }
-        
-        /* Hide Streamlit elements */
-        #MainMenu {visibility: hidden !important;}
-        footer {visibility: hidden !important;}
-        header {visibility: hidden !important;}
-        .stDeployButton {display: none !important;}
-        
-        /* Responsive design for smaller screens */
-        @media (max-width: 1200px) {
-            .header-section {
-                flex-direction: column;
-                align-items: flex-start;
-                gap: 12px;
-            }
-            
-            .controls-container {
-                width: 100%;
-                justify-content: flex-start;
-                gap: 16px;
-            }
-            
-            .control-group {
-                min-width: 100px;
-            }
-        }
-        
-        @media (max-width: 768px) {
-            .professional-header {
-                height: 70px !important;
-                padding: 0 20px !important;
-            }
-            
-            .brand-text h1 {
-                font-size: 22px !important;
-            }
-            
-            .main .block-container {
-                padding-top: 90px !important;
-            }
-            
-            .controls-container {
-                gap: 12px;
-            }
-            
-            .control-group {
-                min-width: 90px;
-            }
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    use_stylesheet('fontawesome', 'sidebar')
 
 def render_clean_header(user_name=None, user_role=None, show_auth=True):
     """Render a clean header with just branding and auth"""
@@ -0,0 +1,161 @@
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+import streamlit as st
+from scipy import sparse
+from history_store import load_store, store_version
+
+SOMPI_PER_KAS = 1e8
+DEFAULT_MAX_NODES = 2_000
+
+# Nodes are positions in `addresses`; volume[i, j] is KAS sent from i to j and
+# tx_count[i, j] the number of transactions carrying that flow. The *_t
+# matrices are the transposes in CSR form so incoming edges are row slices too.
+CounterpartyGraph = namedtuple(
+    'CounterpartyGraph', ['addresses', 'index', 'volume', 'tx_count', 'volume_t', 'tx_count_t']
+)
+
+def counterparty_flows(inputs_df, outputs_df):
+    """
+    Attributes every output of a transaction to its senders in proportion to
+    their share of the transaction's inputs
+
+    Outputs paid back to one of the senders are treated as change and dropped.
+    Returns one row per (transaction, sender, receiver) with the flow in KAS.
+    """
+    inputs_df = inputs_df[inputs_df['address'] != '']
+    outputs_df = outputs_df[outputs_df['address'] != '']
+
+    senders = inputs_df.groupby(['transaction_id', 'address'], sort=False)['amount'].sum().reset_index()
+    senders['share'] = senders['amount'] / senders.groupby('transaction_id')['amount'].transform('sum')
+    receivers = outputs_df.groupby(['transaction_id', 'address'], sort=False)['amount'].sum().reset_index()
+
+    flows = senders[['transaction_id', 'address', 'share']].merge(
+        receivers, on='transaction_id', suffixes=('_src', '_dst'))
+    flows = flows.rename(columns={'address_src': 'src', 'address_dst': 'dst'})
+
+    change_addresses = senders[['transaction_id', 'address']].rename(columns={'address': 'dst'})
+    change_addresses['is_change'] = True
+    flows = flows.merge(change_addresses, on=['transaction_id', 'dst'], how='left')
+    flows = flows[flows['is_change'].isna()]
+
+    flows['kas'] = flows['share'].to_numpy() * flows['amount'].to_numpy() / SOMPI_PER_KAS
+    return flows[['transaction_id', 'src', 'dst', 'kas']].reset_index(drop=True)
+
+def build_counterparty_graph(inputs_df, outputs_df):
+    """Builds the sparse sender -> receiver adjacency from stored transaction rows"""
+    flows = counterparty_flows(inputs_df, outputs_df)
+
+    codes, addresses = pd.factorize(pd.concat([flows['src'], flows['dst']], ignore_index=True))
+    src, dst = codes[:len(flows)], codes[len(flows):]
+    n = len(addresses)
+
+    # Duplicate (src, dst) pairs are summed on conversion to CSR, which gives the
+    # per-edge group-by for free
+    volume = sparse.csr_matrix((flows['kas'].to_numpy(), (src, dst)), shape=(n, n))
+    tx_count = sparse.csr_matrix((np.ones(len(flows), dtype=np.int32), (src, dst)), shape=(n, n))
+
+    addresses = np.asarray(addresses, dtype=object)
+    return CounterpartyGraph(
+        addresses=addresses,
+        index=pd.Index(addresses),
+        volume=volume,
+        tx_count=tx_count,
+        volume_t=volume.T.tocsr(),
+        tx_count_t=tx_count.T.tocsr(),
+    )
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def _cached_graph(version):
+    inputs_df, outputs_df, _ = load_store()
+    return build_counterparty_graph(inputs_df, outputs_df)
+
+def load_counterparty_graph():
+    """Graph over everything in the history store, rebuilt only when the store changes. Treat as read-only."""
+    return _cached_graph(store_version())
+
+def node_of(graph, address):
+    position = graph.index.get_indexer([address])[0]
+    if position < 0:
+        raise KeyError(f"{address} has no counterparties in the stored histories")
+    return position
+
+def counterparties(graph, address):
+    """Direct counterparties of an address with volumes and transaction counts in both directions"""
+    node = node_of(graph, address)
+    sent = graph.volume.getrow(node).tocoo()
+    received = graph.volume_t.getrow(node).tocoo()
+    sent_txs = graph.tx_count.getrow(node).tocoo()
+    received_txs = graph.tx_count_t.getrow(node).tocoo()
+
+    frames = [
+        pd.Series(sent.data, index=sent.col, name='sent_kas'),
+        pd.Series(received.data, index=received.col, name='received_kas'),
+        pd.Series(sent_txs.data, index=sent_txs.col, name='sent_txs'),
+        pd.Series(received_txs.data, index=received_txs.col, name='received_txs'),
+    ]
+    df = pd.concat(frames, axis=1).fillna(0)
+    df[['sent_txs', 'received_txs']] = df[['sent_txs', 'received_txs']].astype(int)
+    df['net_kas'] = df['received_kas'] - df['sent_kas']
+    df['total_kas'] = df['received_kas'] + df['sent_kas']
+    df.insert(0, 'counterparty', graph.addresses[df.index.to_numpy()])
+    return df.sort_values('total_kas', ascending=False).reset_index(drop=True)
+
+def neighborhood(graph, address, hops=2, max_nodes=DEFAULT_MAX_NODES, min_edge_kas=0.0):
+    """
+    Breadth-first multi-hop neighborhood over the undirected flow graph
+
+    Each hop is one sparse matrix-vector product. When a hop would exceed
+    max_nodes, the candidates most strongly connected to the current frontier
+    (by KAS volume) are kept.
+
+    Returns:
+        nodes: DataFrame of address, hop and total volume to the previous hop
+        edges: DataFrame of directed src/dst/kas/txs edges among those nodes
+        truncated: whether max_nodes cut the expansion short
+    """
+    root = node_of(graph, address)
+    undirected = graph.volume + graph.volume_t
+    if min_edge_kas > 0:
+        undirected = undirected.multiply(undirected >= min_edge_kas).tocsr()
+
+    n = len(graph.addresses)
+    hop_of = np.full(n, -1, dtype=np.int16)
+    link_kas = np.zeros(n)
+    hop_of[root] = 0
+    frontier = np.zeros(n)
+    frontier[root] = 1.0
+    truncated = False
+
+    for hop in range(1, hops + 1):
+        reach = undirected @ frontier
+        candidates = np.flatnonzero((reach > 0) & (hop_of < 0))
+        budget = max_nodes - np.count_nonzero(hop_of >= 0)
+        if len(candidates) > budget:
+            truncated = True
+            candidates = candidates[np.argsort(reach[candidates])[::-1][:max(budget, 0)]]
+        if len(candidates) == 0:
+            break
+        hop_of[candidates] = hop
+        link_kas[candidates] = reach[candidates]
+        frontier = np.zeros(n)
+        frontier[candidates] = 1.0
+
+    members = np.flatnonzero(hop_of >= 0)
+    nodes = pd.DataFrame({
+        'address': graph.addresses[members],
+        'hop': hop_of[members],
+        'link_kas': link_kas[members],
+    }).sort_values(['hop', 'link_kas'], ascending=[True, False]).reset_index(drop=True)
+
+    sub_volume = graph.volume[members][:, members].tocoo()
+    sub_txs = graph.tx_count[members][:, members].tocsr()
+    edges = pd.DataFrame({
+        'src': graph.addresses[members[sub_volume.row]],
+        'dst': graph.addresses[members[sub_volume.col]],
+        'kas': sub_volume.data,
+        'txs': np.asarray(sub_txs[sub_volume.row, sub_volume.col]).ravel(),
+    })
+    if min_edge_kas > 0:
+        edges = edges[edges['kas'] >= min_edge_kas]
+    return nodes, edges.sort_values('kas', ascending=False).reset_index(drop=True), truncated
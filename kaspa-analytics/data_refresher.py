@@ -0,0 +1,196 @@
+import logging
+import random
+import threading
+import time
+from collections import namedtuple
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+if not logger.handlers and not logging.getLogger().handlers:
+    # Streamlit only configures its own loggers; make refresh latencies visible
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+
+REFRESH_INTERVAL = 3600   # same freshness as the old st.cache_data(ttl=3600)
+REFRESH_LEAD = 300        # re-fetch this long before a version would have expired
+REFRESH_JITTER = 120      # +/- seconds so the series don't all hit Google Sheets together
+RETRY_BASE_DELAY = 30     # first retry after a failed refresh, doubled per failure
+RETRY_MAX_DELAY = 900
+PROBE_INTERVAL = 120      # how often a series with a change probe is checked
+PROBE_JITTER = 20
+MAX_AGE = 24 * 3600       # full re-fetch even without a detected change, since probes can miss edits
+
+# version increases by one every time a refresh actually loads new data;
+# signature is the probe result taken just before that load
+Entry = namedtuple('Entry', ['version', 'value', 'fetched_at', 'latency', 'signature'])
+
+class SeriesRefresher:
+    """
+    Stale-while-revalidate holder for slow-loading series
+
+    Readers always get the last good Entry straight from memory. A daemon thread
+    re-fetches each series shortly before it would expire and swaps the new Entry
+    in with a single dict assignment, so readers see either the old or the new
+    version, never a partial one. Failed refreshes keep serving the old version
+    and retry with exponential backoff.
+
+    Series with a probe in `probes` are revalidated instead: every probe_interval
+    the cheap probe runs, and the full loader only when its signature differs
+    from the one stored with the current Entry (or the Entry is older than
+    max_age). Unchanged data keeps its version, so nothing derived from it is
+    recomputed.
+
+    Loaders of probed series are called with a signature: the probe result when
+    a copy stored under it may be reused (first load, or a change another
+    process may already have fetched), None when the load must really fetch.
+    """
+
+    def __init__(self, loaders, interval=REFRESH_INTERVAL, lead=REFRESH_LEAD, jitter=REFRESH_JITTER,
+                 probes=None, probe_interval=PROBE_INTERVAL, probe_jitter=PROBE_JITTER, max_age=MAX_AGE):
+        self._loaders = dict(loaders)
+        self._probes = dict(probes or {})
+        self._interval = interval
+        self._lead = lead
+        self._jitter = jitter
+        self._probe_interval = probe_interval
+        self._probe_jitter = probe_jitter
+        self._max_age = max_age
+        self._checked_at = {}
+        self._entries = {}
+        self._due = {}
+        self._failures = {name: 0 for name in self._loaders}
+        self._last_error = {}
+        self._load_locks = {name: threading.Lock() for name in self._loaders}
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def get(self, name):
+        """Current Entry for a series; only the very first read of a series waits for a fetch"""
+        entry = self._entries.get(name)
+        if entry is not None:
+            return entry
+        with self._load_locks[name]:
+            entry = self._entries.get(name)
+            if entry is None:
+                entry = self._refresh(name, reuse=True)
+        return entry
+
+    def refresh_now(self, name):
+        """Synchronously re-fetches a series, e.g. from an admin action"""
+        with self._load_locks[name]:
+            return self._refresh(name)
+
+    def _probe(self, name):
+        probe = self._probes.get(name)
+        return probe() if probe else None
+
+    def _refresh(self, name, signature=None, reuse=False):
+        if signature is None:
+            # probing first means a change landing mid-download is seen next time
+            try:
+                signature = self._probe(name)
+            except Exception as e:
+                # without a signature the next probe always re-fetches, which is safe
+                logger.warning("probe of %s failed, loading anyway: %s", name, e)
+        start = time.perf_counter()
+        if name in self._probes:
+            value = self._loaders[name](signature if reuse else None)
+        else:
+            value = self._loaders[name]()
+        latency = time.perf_counter() - start
+
+        previous = self._entries.get(name)
+        entry = Entry(previous.version + 1 if previous else 1, value, time.time(), latency, signature)
+        self._entries[name] = entry
+        self._checked_at[name] = entry.fetched_at
+        self._failures[name] = 0
+        self._last_error.pop(name, None)
+        self._schedule_next(name)
+        logger.info("refreshed %s v%d in %.2fs", name, entry.version, latency)
+        return entry
+
+    def _revalidate(self, name):
+        """Probes a series and re-fetches it only if it changed or has hit max_age"""
+        entry = self._entries.get(name)
+        if name not in self._probes or entry is None or time.time() - entry.fetched_at >= self._max_age:
+            return self._refresh(name)
+
+        start = time.perf_counter()
+        signature = self._probe(name)
+        if signature != entry.signature:
+            logger.info("%s changed upstream, re-fetching", name)
+            return self._refresh(name, signature, reuse=True)
+
+        self._checked_at[name] = time.time()
+        self._failures[name] = 0
+        self._last_error.pop(name, None)
+        self._schedule_next(name)
+        logger.debug("%s unchanged at v%d (probe %.2fs)", name, entry.version, time.perf_counter() - start)
+        return entry
+
+    def _schedule_next(self, name):
+        if name in self._probes:
+            self._schedule(name, self._probe_interval, self._probe_jitter)
+        else:
+            self._schedule(name, self._interval - self._lead)
+
+    def _schedule(self, name, delay, jitter=None):
+        jitter = self._jitter if jitter is None else jitter
+        self._due[name] = time.time() + max(delay + random.uniform(-jitter, jitter), 1)
+        self._wakeup.set()
+
+    def _refresh_in_background(self, name):
+        if not self._load_locks[name].acquire(blocking=False):
+            return  # a reader is already loading it
+        try:
+            self._revalidate(name)
+        except Exception as e:
+            self._failures[name] += 1
+            self._last_error[name] = str(e)
+            delay = min(RETRY_BASE_DELAY * 2 ** (self._failures[name] - 1), RETRY_MAX_DELAY)
+            self._schedule(name, delay)
+            logger.warning("refresh of %s failed (attempt %d), retrying in ~%ds: %s",
+                           name, self._failures[name], delay, e)
+        finally:
+            self._load_locks[name].release()
+
+    def _run(self):
+        while True:
+            self._wakeup.clear()
+            now = time.time()
+            due = [name for name, at in list(self._due.items()) if at <= now]
+            for name in due:
+                self._due.pop(name, None)
+                self._refresh_in_background(name)
+            next_at = min(list(self._due.values()), default=now + self._interval)
+            self._wakeup.wait(timeout=max(next_at - time.time(), 0.5))
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="series-refresher", daemon=True)
+            self._thread.start()
+        return self
+
+    def status(self):
+        """One row per series: version, age, last fetch latency, last check, next check and failures"""
+        now = time.time()
+        rows = []
+        for name in self._loaders:
+            entry = self._entries.get(name)
+            rows.append({
+                'series': name,
+                'version': entry.version if entry else 0,
+                'age_s': round(now - entry.fetched_at) if entry else None,
+                'latency_s': round(entry.latency, 3) if entry else None,
+                'checked_s_ago': round(now - self._checked_at[name]) if name in self._checked_at else None,
+                'probed': name in self._probes,
+                'next_refresh_s': round(self._due[name] - now) if name in self._due else None,
+                'failures': self._failures[name],
+                'last_error': self._last_error.get(name, ''),
+            })
+        return pd.DataFrame(rows)
+
+    def entries(self):
+        return dict(self._entries)
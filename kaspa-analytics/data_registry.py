@@ -0,0 +1,322 @@
+import mmap
+import os
+import sys
+import numpy as np
+import pandas as pd
+import streamlit as st
+from utils import (
+    fetch_data, fetch_price_data, fetch_volume_data, fetch_marketcap_data,
+    probe_data, probe_price_data, probe_volume_data, probe_marketcap_data,
+    fit_power_law
+)
+from series_schema import GENESIS_DATE
+from data_refresher import SeriesRefresher, MAX_AGE
+from series_store import open_series, write_series
+from chart_pyramid import Pyramid, build_pyramid, pick_level, level_slice, AGG_LEVELS, MIN_CHART_POINTS
+from downsample import downsample_frame, CHART_POINT_BUDGET
+from timing import span
+from metrics import cache_lookup, cache_miss, record_cache
+from analytics import (
+    merge_price_hashrate, positive_marketcap, daily_power_law, ratio_deviation, price_residuals, fit_key
+)
+from artifact_store import open_frame, stored_fit
+
+# ===== SHARED DATASETS =====
+# st.cache_data hands every caller its own unpickled copy; here exactly one
+# object per dataset lives in the process-wide refresher, which probes the
+# sheet for changes in the background and re-fetches only when it changed, and
+# every session reads that copy. The frames are views over the memory-mapped
+# series store, so server processes share their values through the page cache.
+
+SERIES_FETCHERS = {
+    'hashrate': fetch_data,
+    'price': fetch_price_data,
+    'volume': fetch_volume_data,
+    'marketcap': fetch_marketcap_data,
+}
+
+SERIES_PROBES = {
+    'hashrate': probe_data,
+    'price': probe_price_data,
+    'volume': probe_volume_data,
+    'marketcap': probe_marketcap_data,
+}
+
+def _stored_loader(series, fetch):
+    """
+    Loader that serves the series from the memory-mapped store: a copy stored
+    under the same probe signature (e.g. by another server process) is opened
+    as is, anything else is fetched, written to the store and opened from it
+    """
+    def load(signature=None):
+        cache_miss()
+        with span('store open', series=series):
+            df = open_series(series, signature, max_age=MAX_AGE) if signature is not None else None
+        if signature is not None:
+            record_cache('series_store', series, df is not None)
+        if df is None:
+            result = fetch()
+            with span('store write', series=series):
+                write_series(series, result[0] if isinstance(result, tuple) else result, signature)
+                df = open_series(series)
+        return df
+    return load
+
+SERIES_LOADERS = {series: _stored_loader(series, fetch) for series, fetch in SERIES_FETCHERS.items()}
+
+# Datasets built from other datasets; their version is the tuple of the source
+# versions, so a change to any source cascades to everything keyed on it
+DERIVED_SOURCES = {
+    'price_hashrate': ('hashrate', 'price'),
+    'marketcap_positive': ('marketcap',),
+}
+
+# Latest value of each derived entry, for the memory readout only
+_loaded = {}
+
+@st.cache_resource
+def get_refresher():
+    """The process-wide refresher, started on first use"""
+    return SeriesRefresher(SERIES_LOADERS, probes=SERIES_PROBES).start()
+
+def dataset_version(dataset):
+    """Bumped whenever the upstream data actually changes; derived caches are keyed on it"""
+    if dataset in DERIVED_SOURCES:
+        return tuple(dataset_version(source) for source in DERIVED_SOURCES[dataset])
+    return get_refresher().get(dataset).version
+
+def _entry(dataset):
+    with cache_lookup('series', dataset):
+        return get_refresher().get(dataset).value
+
+# ===== PRECOMPUTED ARTIFACTS =====
+# Derived entries below are read from the precompute job's artifacts when it
+# ran on the exact series versions being served (same probe signatures), and
+# computed here otherwise
+def source_signatures(dataset):
+    """Probe signature of each series a dataset is built from; None where a source can't be probed"""
+    return {series: get_refresher().get(series).signature for series in DERIVED_SOURCES.get(dataset, (dataset,))}
+
+def _stored_frame(name, dataset):
+    df = open_frame(name, source_signatures(dataset))
+    record_cache('artifact', name, df is not None)
+    return df
+
+def _stored_fit(dataset, y_col, x_col):
+    name = fit_key(dataset, y_col, x_col)
+    fit = stored_fit(name, source_signatures(dataset))
+    record_cache('artifact', f'fit:{name}', fit is not None)
+    return fit
+
+def _view(df):
+    """
+    Shallow copy: shares the registry's column data, but adding or replacing
+    columns on it (as the pages do) never touches the shared frame. Never
+    modify values in place.
+    """
+    return df.copy(deep=False)
+
+def get_hashrate_data():
+    """(df, genesis_date) for the daily hashrate series"""
+    return _view(_entry('hashrate')), GENESIS_DATE
+
+def get_price_data():
+    """(df, genesis_date) for the daily price series"""
+    return _view(_entry('price')), GENESIS_DATE
+
+def get_volume_data():
+    """Daily price and trading volume frame"""
+    return _view(_entry('volume'))
+
+def get_marketcap_data():
+    """(df, genesis_date) for the daily market cap series"""
+    return _view(_entry('marketcap')), GENESIS_DATE
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _price_hashrate_entry(version):
+    cache_miss()
+    merged_df = _stored_frame('price_hashrate', 'price_hashrate')
+    if merged_df is None:
+        with span('merge', dataset='price_hashrate'):
+            merged_df = merge_price_hashrate(_entry('hashrate'), _entry('price'))
+    _loaded['price_hashrate'] = merged_df
+    return merged_df
+
+def get_price_hashrate_data():
+    """
+    (df, genesis_date): daily hashrate left-joined with price on the normalized
+    date, plus Price_Hashrate_Ratio and Days_Since_Genesis. Price is NaN on days
+    without a price.
+    """
+    version = dataset_version('price_hashrate')
+    with cache_lookup('derived', 'price_hashrate'):
+        df = _price_hashrate_entry(version)
+    return _view(df), GENESIS_DATE
+
+DATASETS = {
+    'hashrate': lambda: get_hashrate_data()[0],
+    'price': lambda: get_price_data()[0],
+    'volume': get_volume_data,
+    'marketcap': lambda: get_marketcap_data()[0],
+    'price_hashrate': lambda: get_price_hashrate_data()[0],
+    'marketcap_positive': lambda: positive_marketcap(get_marketcap_data()[0]),
+}
+
+# ===== SHARED DERIVED ANALYTICS =====
+# Keyed on the dataset version so a refresh recomputes them on next use
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _power_law_fit_entry(dataset, version, y_col, x_col):
+    cache_miss()
+    return _stored_fit(dataset, y_col, x_col) or fit_power_law(DATASETS[dataset](), y_col=y_col, x_col=x_col)
+
+def get_power_law_fit(dataset, y_col, x_col=None):
+    """(a, b, r2) of fit_power_law over a registry dataset, computed once per data version"""
+    version = dataset_version(dataset)
+    with cache_lookup('power_law_fit', f'{dataset}:{y_col}'):
+        return _power_law_fit_entry(dataset, version, y_col, x_col)
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def _daily_power_law_entry(dataset, version, y_col):
+    cache_miss()
+    name = f'daily_power_law:{dataset}:{y_col}'
+    df = _stored_frame(name, dataset)
+    _loaded[name] = df if df is not None else daily_power_law(DATASETS[dataset](), y_col)
+    return _loaded[name]
+
+def get_daily_power_law(dataset, y_col):
+    """Expanding-window power law slope and R² history"""
+    version = dataset_version(dataset)
+    with cache_lookup('daily_power_law', f'{dataset}:{y_col}'):
+        df = _daily_power_law_entry(dataset, version, y_col)
+    return _view(df)
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _ratio_deviation_entry(version):
+    cache_miss()
+    df = _stored_frame('ratio_deviation', 'price_hashrate')
+    if df is None:
+        a, b, _ = get_power_law_fit('price_hashrate', 'Price_Hashrate_Ratio', x_col='Days_Since_Genesis')
+        df = ratio_deviation(DATASETS['price_hashrate'](), a, b)
+    _loaded['ratio_deviation'] = df
+    return df
+
+def get_ratio_deviation():
+    """
+    Days with both hashrate and price, with the price/hashrate ratio's deviation
+    from its power-law trend over time (Ratio_Deviation_Pct) and its bands
+    """
+    version = dataset_version('price_hashrate')
+    with cache_lookup('derived', 'ratio_deviation'):
+        df = _ratio_deviation_entry(version)
+    return _view(df)
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _price_residuals_entry(version):
+    cache_miss()
+    df = _stored_frame('price_residuals', 'price_hashrate')
+    if df is None:
+        a, b, _ = get_power_law_fit('price_hashrate', 'Price', x_col='Hashrate_PH')
+        df = price_residuals(DATASETS['price_hashrate'](), a, b)
+    _loaded['price_residuals'] = df
+    return df
+
+def get_price_residuals():
+    """Days with both hashrate and price, with price's deviation from its power law in hashrate (Price_Deviation_Pct)"""
+    version = dataset_version('price_hashrate')
+    with cache_lookup('derived', 'price_residuals'):
+        df = _price_residuals_entry(version)
+    return _view(df)
+
+# ===== CHART LEVELS =====
+# Latest pyramid per dataset, extended incrementally by the next version
+_pyramids = {}
+
+@st.cache_resource(max_entries=16, show_spinner=False)
+def _pyramid_entry(dataset, version):
+    cache_miss()
+    levels = {}
+    for level in AGG_LEVELS:
+        levels[level] = _stored_frame(f'pyramid:{dataset}:{level}', dataset)
+        if levels[level] is None:
+            break
+    if levels.get(AGG_LEVELS[-1]) is not None:
+        pyramid = Pyramid(DATASETS[dataset](), levels, 0)
+    else:
+        with span('build pyramid', dataset=dataset):
+            pyramid = build_pyramid(DATASETS[dataset](), _pyramids.get(dataset))
+    _pyramids[dataset] = pyramid
+    _loaded[f'pyramid:{dataset}'] = tuple(pyramid.levels[level] for level in AGG_LEVELS[1:])
+    return pyramid
+
+def get_pyramid(dataset):
+    """Aggregation pyramid of a registry dataset for its current version; read-only"""
+    version = dataset_version(dataset)
+    with cache_lookup('pyramid', dataset):
+        return _pyramid_entry(dataset, version)
+
+OHLC_SUFFIXES = ('_open', '_high', '_low', '_close')
+
+def get_chart_series(dataset, start_date=None, end_date=None, min_points=MIN_CHART_POINTS,
+                     value_cols=None, max_points=CHART_POINT_BUDGET):
+    """
+    (df, level) for charting a dataset between start_date and end_date: the
+    coarsest of daily/weekly/monthly means that still has min_points rows in
+    the span, or the full series ('raw') when none has
+
+    Spans longer than max_points rows are LTTB-downsampled on value_cols (by
+    default every float column except the OHLC ones).
+    """
+    with span('chart series', dataset=dataset) as fields:
+        pyramid = get_pyramid(dataset)
+        level = pick_level(pyramid, start_date, end_date, min_points)
+        df = level_slice(pyramid, level, start_date, end_date)
+        if len(df) > max_points:
+            if value_cols is None:
+                value_cols = [c for c in df.columns if pd.api.types.is_float_dtype(df[c])
+                              and not c.endswith(OHLC_SUFFIXES)]
+            df = downsample_frame(df, value_cols, max_points=max_points)
+        fields.update(level=level, rows=len(df))
+    return _view(df), level
+
+# ===== MEMORY READOUT =====
+def _is_mapped(values):
+    while values is not None:
+        if isinstance(values, (np.memmap, mmap.mmap)):
+            return True
+        values = getattr(values, 'base', None)
+    return False
+
+def _backing(column):
+    # The column's own buffer: to_numpy() would build an object array for tz-aware dates
+    return np.asarray(column.array, dtype=getattr(column.dtype, 'base', None))
+
+def _frame_bytes(value):
+    """(bytes, rows, memory-mapped bytes) of a frame or tuple of frames"""
+    if isinstance(value, pd.DataFrame):
+        backing = [_backing(value[column]) for column in value.columns]
+        mapped = sum(values.nbytes for values in backing if _is_mapped(values))
+        return int(value.memory_usage(deep=True).sum()), len(value), mapped
+    if isinstance(value, tuple):
+        sizes = [_frame_bytes(v) for v in value]
+        return tuple(sum(s[i] for s in sizes) for i in range(3))
+    return sys.getsizeof(value), 0, 0
+
+def process_rss_bytes():
+    """Current resident set size, falling back to the peak where /proc is unavailable"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+def registry_memory_usage():
+    """Rows and bytes held by each dataset and derived frame loaded so far; mapped bytes live in the page cache"""
+    loaded = {name: entry.value for name, entry in get_refresher().entries().items()}
+    loaded.update(_loaded)
+    rows = []
+    for name, value in loaded.items():
+        nbytes, nrows, mapped = _frame_bytes(value)
+        rows.append({'dataset': name, 'rows': nrows, 'bytes': nbytes, 'mapped_bytes': mapped})
+    return pd.DataFrame(rows, columns=['dataset', 'rows', 'bytes', 'mapped_bytes'])
@@ -0,0 +1,126 @@
+import os
+from functools import lru_cache
+from pathlib import Path
+import pandas as pd
+
+# Every source returns a series as the raw sheet layout: a header row followed
+# by rows of strings, exactly what gspread's get_all_values() gives. Parsing
+# into frames stays in utils, so all sources share one schema.
+
+# (spreadsheet id, worksheet name) of each series
+SHEETS = {
+    'hashrate': ("1NPwQh2FQKVES7OYUzKQLKwuOrRuIivGhOtQWZZ-Sp80", "kaspa_daily_hashrate (3)"),
+    'price': ("1rMBuWn0CscUZkcKy2gleH85rXSO6U4YOSk3Sz2KuR_s", "kaspa_daily_price"),
+    'volume': ("1IdAmETrtZ8_lCuSQwEyDLtMIGiQbJFOyGGpMa9_hxZc", "KAS_VOLUME_ETC"),
+    'marketcap': ("15BZcsswJPZZF2MQ6S_m9CtbHPtVJVcET_VjZ9_aJ8nY", "kaspa_market_cap"),
+}
+
+# Header row of each series, as laid out in the sheets
+SHEET_COLUMNS = {
+    'hashrate': ['Date', 'Hashrate (H/s)'],
+    'price': ['Date', 'Price'],
+    'volume': ['date', 'price', 'total_volume'],
+    'marketcap': ['Date', 'MarketCap'],
+}
+
+DATA_SOURCE = os.environ.get("KASPA_DATA_SOURCE", "sheets")
+LOCAL_DATA_DIR = Path(os.environ.get("KASPA_DATA_DIR", Path(__file__).parent / "data"))
+
+PROBE_TAIL_ROWS = 3
+
+# Shared authentication function
+def get_gspread_client():
+    import gspread
+    import streamlit as st
+    from google.oauth2 import service_account
+
+    credentials = service_account.Credentials.from_service_account_info(
+        st.secrets["gcp_service_account"],
+        scopes=[
+            "https://www.googleapis.com/auth/spreadsheets",
+            # lets probe() read the spreadsheet's modified time from Drive
+            "https://www.googleapis.com/auth/drive.metadata.readonly",
+        ],
+    )
+    return gspread.authorize(credentials)
+
+class GoogleSheetsSource:
+    """The production source: one worksheet per series"""
+
+    name = "sheets"
+
+    def __init__(self, sheets=SHEETS):
+        self._sheets = dict(sheets)
+
+    def read(self, series):
+        sheet_id, worksheet_name = self._sheets[series]
+        return get_gspread_client().open_by_key(sheet_id).worksheet(worksheet_name).get_all_values()
+
+    def probe(self, series, tail_rows=PROBE_TAIL_ROWS):
+        """
+        Cheap change signature for a worksheet, compared against the last one
+        seen to decide whether a full read() is needed
+
+        Uses the spreadsheet's Drive modified time when the credentials allow it.
+        Otherwise falls back to the row count plus the last few rows, which
+        catches appended and rewritten recent rows but not edits further up;
+        callers should still do an occasional full refresh.
+        """
+        import gspread
+
+        sheet_id, worksheet_name = self._sheets[series]
+        spreadsheet = get_gspread_client().open_by_key(sheet_id)
+        try:
+            return ('modified', spreadsheet.get_lastUpdateTime())
+        except gspread.exceptions.APIError:
+            pass  # Drive scope not granted or Drive API disabled for the project
+
+        worksheet = spreadsheet.worksheet(worksheet_name)
+        last_row = len(worksheet.col_values(1))
+        tail = worksheet.get(f"A{max(last_row - tail_rows + 1, 1)}:ZZ{last_row}") if last_row else []
+        return ('tail', last_row, tuple(tuple(row) for row in tail))
+
+class LocalFileSource:
+    """
+    Offline stand-in for the sheets: <directory>/<series>.parquet or .csv with
+    the same header and string formats as the worksheet
+
+    Files exported from the sheets or written by synthetic_history.py both fit.
+    Reading Parquet needs pyarrow or fastparquet.
+    """
+
+    name = "local"
+
+    def __init__(self, directory=LOCAL_DATA_DIR):
+        self.directory = Path(directory)
+
+    def path(self, series):
+        for suffix in (".parquet", ".csv"):
+            path = self.directory / f"{series}{suffix}"
+            if path.exists():
+                return path
+        raise FileNotFoundError(f"No {series}.parquet or {series}.csv in {self.directory}")
+
+    def read(self, series):
+        path = self.path(series)
+        if path.suffix == ".parquet":
+            df = pd.read_parquet(path).astype(str)
+        else:
+            df = pd.read_csv(path, dtype=str, keep_default_na=False)
+        return [list(df.columns)] + df.to_numpy().tolist()
+
+    def probe(self, series):
+        stat = self.path(series).stat()
+        return ('file', stat.st_mtime_ns, stat.st_size)
+
+DATA_SOURCES = {
+    GoogleSheetsSource.name: GoogleSheetsSource,
+    LocalFileSource.name: LocalFileSource,
+}
+
+@lru_cache(maxsize=None)
+def get_data_source(name=DATA_SOURCE):
+    """The configured source; set KASPA_DATA_SOURCE=local (and KASPA_DATA_DIR) to run without Google Sheets"""
+    if name not in DATA_SOURCES:
+        raise ValueError(f"Unknown data source {name!r}, expected one of {sorted(DATA_SOURCES)}")
+    return DATA_SOURCES[name]()
@@ -0,0 +1,77 @@
+import os
+import numpy as np
+import pandas as pd
+
+# ===== LTTB DOWNSAMPLING =====
+# Largest-Triangle-Three-Buckets keeps the first and last point and, per bucket,
+# the point forming the largest triangle with the point kept in the previous
+# bucket and the mean of the next one, so peaks and troughs survive.
+
+# Server side has no idea of the browser's chart width, so the budget assumes a
+# wide-layout chart; roughly one point per horizontal pixel is all a line can show
+CHART_WIDTH_PX = int(os.environ.get("KASPA_CHART_WIDTH", 1400))
+POINTS_PER_PIXEL = 1.0
+
+def chart_point_budget(width_px=CHART_WIDTH_PX, points_per_pixel=POINTS_PER_PIXEL):
+    """Maximum points per trace for a chart width_px pixels wide"""
+    return max(int(width_px * points_per_pixel), 3)
+
+CHART_POINT_BUDGET = chart_point_budget()
+
+def lttb_indices(x, y, n_out):
+    """
+    Positions of the n_out points LTTB keeps out of (x, y), in order
+
+    x must be increasing. NaN values are never picked over real ones within a bucket.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype='float64')
+    y = np.asarray(y, dtype='float64')
+
+    # n_out - 2 buckets over the interior points; edges[i]:edges[i + 1] is bucket i
+    edges = np.linspace(1, n - 1, n_out - 1).astype('int64')
+    counts = np.diff(edges)
+    interior_x, interior_y = x[1:n - 1], y[1:n - 1]
+    starts = edges[:-1] - 1
+    mean_x = np.add.reduceat(interior_x, starts) / counts
+    mean_y = np.add.reduceat(np.nan_to_num(interior_y), starts) / counts
+    # anchor for bucket i is the mean of bucket i + 1; the last bucket uses the last point
+    next_x = np.r_[mean_x[1:], x[-1]]
+    next_y = np.r_[mean_y[1:], y[-1]]
+
+    kept = np.empty(n_out, dtype='int64')
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        ax, ay = x[a], y[a]
+        area = np.abs((ax - next_x[i]) * (y[lo:hi] - ay) - (ax - x[lo:hi]) * (next_y[i] - ay))
+        a = lo + int(np.argmax(np.nan_to_num(area, nan=-1.0)))
+        kept[i + 1] = a
+    return kept
+
+def downsample_frame(df, y_cols, x_col='Date', max_points=CHART_POINT_BUDGET):
+    """
+    Rows of df kept by LTTB on each of y_cols, so traces built from the result
+    (and their text/customdata arrays) stay aligned
+
+    Each column gets an equal share of max_points, and its overall high and low
+    are always kept (LTTB alone can miss them); the result has at most
+    max_points rows. Frames within the budget are returned unchanged.
+    """
+    if len(df) <= max_points:
+        return df
+    x = df[x_col]
+    if pd.api.types.is_datetime64_any_dtype(x):
+        x = x.dt.tz_convert('UTC').dt.tz_localize(None) if x.dt.tz is not None else x
+        x = x.to_numpy('datetime64[ns]').view('int64')
+    share = max(max_points // max(len(y_cols), 1) - 2, 3)
+    kept = []
+    for col in y_cols:
+        y = df[col].to_numpy('float64', na_value=np.nan)
+        kept.append(lttb_indices(x, y, share))
+        if not np.isnan(y).all():
+            kept.append([np.nanargmax(y), np.nanargmin(y)])
+    return df.iloc[np.unique(np.concatenate(kept))]
@@ -0,0 +1,94 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+import plotly.graph_objects as go
+import plotly.io as pio
+import streamlit as st
+from timing import span
+from metrics import record_cache
+
+# ===== FIGURE CACHE =====
+# Serialized figures keyed on (chart, dataset version, control values), shared
+# by every session of the process. A widget change that lands on a combination
+# already drawn by anyone reuses its JSON: no data slicing, no figure
+# construction and no serialization.
+
+FIGURE_CACHE_SIZE = int(os.environ.get("KASPA_FIGURE_CACHE_SIZE", 64))
+
+class FigureCache:
+    """LRU of figure JSON strings"""
+
+    def __init__(self, maxsize=FIGURE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._specs = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            spec = self._specs.get(key)
+            if spec is None:
+                self.misses += 1
+                return None
+            self._specs.move_to_end(key)
+            self.hits += 1
+            return spec
+
+    def put(self, key, spec):
+        with self._lock:
+            self._specs[key] = spec
+            self._specs.move_to_end(key)
+            while len(self._specs) > self.maxsize:
+                self._specs.popitem(last=False)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._specs),
+                'bytes': sum(len(spec) for spec in self._specs.values()),
+                'hits': self.hits,
+                'misses': self.misses,
+            }
+
+@st.cache_resource
+def get_figure_cache():
+    return FigureCache()
+
+class SpecFigure(go.Figure):
+    """
+    A figure that is already serialized. st.plotly_chart takes a Figure's
+    to_dict() as valid, so this skips re-validating the spec; it is meant
+    for rendering only, not for adding traces.
+    """
+
+    def __init__(self, spec):
+        super().__init__()
+        self._spec = spec
+
+    def to_dict(self):
+        return json.loads(self._spec)
+
+    def to_json(self, *args, **kwargs):
+        return self._spec
+
+def cached_figure(chart, key, build):
+    """
+    Figure for `chart` under `key` (dataset version plus control values): the
+    cached spec when this combination was drawn before, else build()'s figure,
+    serialized and cached
+    """
+    cache = get_figure_cache()
+    full_key = (chart,) + tuple(key)
+    with span('figure', chart=chart) as fields:
+        spec = cache.get(full_key)
+        fields['cached'] = spec is not None
+        record_cache('figure', chart, spec is not None)
+        if spec is None:
+            with span('build'):
+                fig = build()
+            with span('serialize'):
+                spec = pio.to_json(fig, validate=False)
+            cache.put(full_key, spec)
+    return SpecFigure(spec)
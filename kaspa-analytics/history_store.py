@@ -0,0 +1,102 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+import pandas as pd
+import streamlit as st
+
+HISTORY_STORE_DIR = Path(os.environ.get("KASPA_HISTORY_DIR", Path(__file__).parent / ".cache" / "history"))
+
+INPUT_COLUMNS = ['transaction_id', 'index', 'block_time', 'address', 'amount']
+OUTPUT_COLUMNS = ['transaction_id', 'index', 'block_time', 'address', 'amount']
+INTEGER_COLUMNS = {'block_time': 'int64', 'amount': 'int64'}
+
+_write_lock = threading.Lock()
+
+def _paths():
+    return (
+        HISTORY_STORE_DIR / "inputs.pkl",
+        HISTORY_STORE_DIR / "outputs.pkl",
+        HISTORY_STORE_DIR / "addresses.json",
+    )
+
+def flatten_transactions(transactions):
+    """
+    Flattens full-transactions-page results into input and output row tables
+
+    Amounts are kept in sompi as int64. Inputs need the page to be fetched with
+    resolve_previous_outpoints so each input carries its address and amount.
+    """
+    input_rows, output_rows = [], []
+    for tx in transactions:
+        if not isinstance(tx, dict):
+            continue
+        tx_id = tx.get('transaction_id', '')
+        block_time = tx.get('block_time') or 0
+        for i, inp in enumerate(tx.get('inputs') or []):
+            input_rows.append((
+                tx_id, inp.get('index', i), block_time,
+                inp.get('previous_outpoint_address') or '',
+                int(inp.get('previous_outpoint_amount') or 0),
+            ))
+        for i, out in enumerate(tx.get('outputs') or []):
+            output_rows.append((
+                tx_id, out.get('index', i), block_time,
+                out.get('script_public_key_address') or '',
+                int(out.get('amount') or 0),
+            ))
+
+    inputs_df = pd.DataFrame(input_rows, columns=INPUT_COLUMNS).astype(INTEGER_COLUMNS)
+    outputs_df = pd.DataFrame(output_rows, columns=OUTPUT_COLUMNS).astype(INTEGER_COLUMNS)
+    return inputs_df, outputs_df
+
+def _read_tables():
+    inputs_path, outputs_path, addresses_path = _paths()
+    if not inputs_path.exists():
+        return (
+            pd.DataFrame(columns=INPUT_COLUMNS).astype(INTEGER_COLUMNS),
+            pd.DataFrame(columns=OUTPUT_COLUMNS).astype(INTEGER_COLUMNS),
+            {},
+        )
+    addresses = json.loads(addresses_path.read_text()) if addresses_path.exists() else {}
+    return pd.read_pickle(inputs_path), pd.read_pickle(outputs_path), addresses
+
+def _write_atomic(path, write):
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+def save_transactions(address, transactions):
+    """Merges an address history into the store, de-duplicating transactions seen from several addresses"""
+    new_inputs, new_outputs = flatten_transactions(transactions)
+
+    with _write_lock:
+        HISTORY_STORE_DIR.mkdir(parents=True, exist_ok=True)
+        inputs_df, outputs_df, addresses = _read_tables()
+        inputs_df = pd.concat([inputs_df, new_inputs], ignore_index=True)
+        inputs_df = inputs_df.drop_duplicates(['transaction_id', 'index'], keep='last').reset_index(drop=True)
+        outputs_df = pd.concat([outputs_df, new_outputs], ignore_index=True)
+        outputs_df = outputs_df.drop_duplicates(['transaction_id', 'index'], keep='last').reset_index(drop=True)
+        addresses[address] = {
+            'fetched_at': int(time.time()),
+            'transactions': len(transactions),
+        }
+
+        inputs_path, outputs_path, addresses_path = _paths()
+        _write_atomic(inputs_path, inputs_df.to_pickle)
+        _write_atomic(outputs_path, outputs_df.to_pickle)
+        _write_atomic(addresses_path, lambda p: p.write_text(json.dumps(addresses)))
+
+def store_version():
+    """Modification time of the store, used to key caches built from it"""
+    _, outputs_path, _ = _paths()
+    return outputs_path.stat().st_mtime_ns if outputs_path.exists() else 0
+
+@st.cache_data(max_entries=2, show_spinner=False)
+def _load_store(version):
+    return _read_tables()
+
+def load_store():
+    """Returns (inputs_df, outputs_df, addresses) for everything stored so far"""
+    return _load_store(store_version())
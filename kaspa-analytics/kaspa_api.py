@@ -0,0 +1,72 @@
+import threading
+import time
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from metrics import record_api_request
+
+API_BASE_URL = "https://api.kaspa.org"
+POOL_SIZE = 16
+REQUEST_TIMEOUT = 30
+
+_session = None
+_session_lock = threading.Lock()
+
+# ===== POOLED CLIENT =====
+def _build_session():
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def get_api_session():
+    """
+    One keep-alive session per server process, shared by all user sessions and
+    worker threads. Held in a module global rather than st.cache_resource so
+    pool threads can use it without a script run context.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+def api_get(endpoint, params=None, as_text=False):
+    """GET an API endpoint, raising requests exceptions instead of rendering them"""
+    start = time.perf_counter()
+    status = 'error'
+    try:
+        response = get_api_session().get(f"{API_BASE_URL}{endpoint}", params=params, timeout=REQUEST_TIMEOUT)
+        status = response.status_code
+    finally:
+        record_api_request(endpoint, status, time.perf_counter() - start)
+    response.raise_for_status()
+    return response.text if as_text else response.json()
+
+def map_concurrent(func, items, max_workers=POOL_SIZE):
+    """
+    Applies func to every item on a thread pool sized to the connection pool
+
+    Returns a list of (item, result, error) tuples in input order; exactly one of
+    result and error is None so a single failed lookup doesn't sink the batch.
+    """
+    def run(item):
+        try:
+            return item, func(item), None
+        except Exception as e:
+            return item, None, e
+
+    items = list(items)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(run, items))
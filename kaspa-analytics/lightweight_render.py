@@ -0,0 +1,172 @@
+import os
+import threading
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+import streamlit as st
+from data_registry import dataset_version, get_pyramid
+from chart_pyramid import pick_level, level_slice
+from series_schema import GENESIS_DATE
+from analytics import DEFAULT_FIT_BANDS
+from utils import power_law_curve, days_to_dates
+from timing import span
+
+try:
+    from streamlit_lightweight_charts import renderLightweightCharts
+except ImportError:
+    renderLightweightCharts = None
+
+# ===== CHART BACKEND =====
+# The time-series pages draw their main chart with Plotly or with TradingView's
+# lightweight-charts (canvas, one {time, value} pair per point instead of a
+# Plotly figure). KASPA_CHART_BACKEND picks it for every page,
+# KASPA_CHART_BACKEND_<PAGE> (e.g. KASPA_CHART_BACKEND_PRICE) for one page,
+# and ?chart=plotly|lightweight in the URL for one session, to compare the two.
+# Log time axes have no lightweight-charts equivalent and stay on Plotly.
+CHART_BACKENDS = ['plotly', 'lightweight']
+CHART_BACKEND = os.environ.get("KASPA_CHART_BACKEND", "plotly")
+
+LOG_PRICE_SCALE = 1  # PriceScaleMode.Logarithmic
+DOTTED = 1           # LineStyle.Dotted
+
+def chart_backend(page):
+    """'plotly' or 'lightweight' for a page's main chart"""
+    choice = (getattr(st, 'query_params', {}).get('chart')
+              or os.environ.get(f"KASPA_CHART_BACKEND_{page.upper()}")
+              or CHART_BACKEND)
+    if choice == 'lightweight' and renderLightweightCharts is not None:
+        return 'lightweight'
+    return 'plotly'
+
+# ===== POINTS =====
+# Whole-level point lists per (dataset, level, column), shared by every
+# session. A new data version reuses the previous list for the rows it still
+# has unchanged and converts only the rest (the last row is always redone:
+# it may be a partial week or month), so a refresh that appends a day costs a
+# few points, not the whole history.
+LevelPoints = namedtuple('LevelPoints', ['version', 'times', 'values', 'points', 'point_times'])
+
+_level_points = {}
+_lock = threading.Lock()
+
+def _epoch_seconds(dates):
+    dates = pd.DatetimeIndex(dates)
+    if dates.tz is not None:
+        dates = dates.tz_convert('UTC').tz_localize(None)
+    return dates.to_numpy('datetime64[s]').astype('int64')
+
+def _to_points(times, values):
+    # NaN days are left out; lightweight-charts has no missing-value marker
+    return [{'time': t, 'value': v} for t, v in zip(times.tolist(), values.tolist()) if v == v]
+
+def frame_points(df, column, date_col='Date'):
+    """[{time, value}] for a frame's column, time in UTC epoch seconds"""
+    return _to_points(_epoch_seconds(df[date_col]), df[column].to_numpy(dtype='float64'))
+
+def _extend(previous, times, values):
+    """Points for times/values, reusing previous' conversions for its unchanged leading rows"""
+    if previous is None or len(previous.times) < 2 or len(previous.times) > len(times):
+        return _to_points(times, values)
+    keep = len(previous.times) - 1
+    if not (np.array_equal(previous.times[:keep], times[:keep])
+            and np.array_equal(previous.values[:keep], values[:keep], equal_nan=True)):
+        return _to_points(times, values)
+    reused = sum(1 for v in previous.values[:keep].tolist() if v == v)
+    return previous.points[:reused] + _to_points(times[keep:], values[keep:])
+
+def _whole_level(dataset, level, column):
+    version = dataset_version(dataset)
+    key = (dataset, level, column)
+    with _lock:
+        cached = _level_points.get(key)
+    if cached is not None and cached.version == version:
+        return cached
+    frame = level_slice(get_pyramid(dataset), level)
+    times = _epoch_seconds(frame['Date'])
+    values = frame[column].to_numpy(dtype='float64')
+    points = _extend(cached, times, values)
+    entry = LevelPoints(version, times, values, points, np.array([p['time'] for p in points], dtype='int64'))
+    with _lock:
+        _level_points[key] = entry
+    return entry
+
+def level_points(dataset, columns, start_date=None):
+    """
+    ({column: [{time, value}]}, level) for a registry dataset from start_date
+    on, at the level the Plotly chart would use for the same span
+    """
+    with span('lightweight points', dataset=dataset) as fields:
+        level = pick_level(get_pyramid(dataset), start_date)
+        start = _epoch_seconds([start_date])[0] if start_date is not None else None
+        result = {}
+        for column in columns:
+            entry = _whole_level(dataset, level, column)
+            if start is None:
+                result[column] = entry.points
+            else:
+                result[column] = entry.points[entry.point_times.searchsorted(start, side='left'):]
+        fields.update(level=level, rows=sum(len(p) for p in result.values()))
+    return result, level
+
+def curve_points(dates, values):
+    """[{time, value}] for a fit curve on a date axis (days_to_dates output)"""
+    times = _epoch_seconds(dates)
+    # Curve samples can land within the same second; times must increase
+    keep = np.concatenate([[True], np.diff(times) > 0])
+    return _to_points(times[keep], np.asarray(values, dtype='float64')[keep])
+
+def fit_series(a, b, r2, points, bands=DEFAULT_FIT_BANDS, price_scale='right'):
+    """Power-law fit and deviation band lines over the time span of points, as the Plotly pages draw them"""
+    if not points:
+        return []
+    genesis = _epoch_seconds([GENESIS_DATE])[0]
+    first_day = max((points[0]['time'] - genesis) // 86_400, 1)
+    last_day = (points[-1]['time'] - genesis) // 86_400
+    x_fit, y_fit = power_law_curve(a, b, first_day, max(last_day, first_day))
+    dates = days_to_dates(x_fit)
+    lower, upper = bands
+    return [
+        line_series(curve_points(dates, y_fit), f'Power-Law Fit (R²={r2:.3f})', '#FFA726', dotted=True,
+                    price_scale=price_scale),
+        line_series(curve_points(dates, y_fit * lower), f'{lower - 1:+.0%} Deviation', 'rgba(255, 255, 255, 0.5)',
+                    width=1, dotted=True, price_scale=price_scale),
+        line_series(curve_points(dates, y_fit * upper), f'{upper - 1:+.0%} Deviation', 'rgba(255, 255, 255, 0.5)',
+                    width=1, dotted=True, price_scale=price_scale),
+    ]
+
+# ===== CHART =====
+def line_series(points, title, color, width=2, dotted=False, price_scale='right'):
+    return {
+        'type': 'Line',
+        'data': points,
+        'options': {
+            'title': title,
+            'color': color,
+            'lineWidth': width,
+            'lineStyle': DOTTED if dotted else 0,
+            'priceScaleId': price_scale,
+            'priceLineVisible': False,
+            'lastValueVisible': not dotted,
+        },
+    }
+
+def chart_options(log_y=False, left_scale=False, height=700):
+    """The dashboard's dark chart theme; left_scale shows a second price scale for 'left' series"""
+    scale = {'mode': LOG_PRICE_SCALE if log_y else 0, 'borderColor': '#3A3C4A'}
+    return {
+        'height': height,
+        'layout': {'background': {'type': 'solid', 'color': '#262730'}, 'textColor': '#e0e0e0'},
+        'grid': {
+            'vertLines': {'color': 'rgba(255, 255, 255, 0.1)'},
+            'horzLines': {'color': 'rgba(255, 255, 255, 0.1)'},
+        },
+        'rightPriceScale': scale,
+        'leftPriceScale': dict(scale, visible=left_scale),
+        'timeScale': {'borderColor': '#3A3C4A', 'timeVisible': False},
+        'crosshair': {'mode': 0},
+    }
+
+def lightweight_chart(series, key, **options):
+    """Draws one chart; a fixed key keeps the component mounted across reruns"""
+    with span('lightweight_chart'):
+        return renderLightweightCharts([{'chart': chart_options(**options), 'series': series}], key=key)
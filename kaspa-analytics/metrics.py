@@ -0,0 +1,151 @@
+import contextlib
+import logging
+import os
+import re
+import threading
+import time
+
+try:
+    from prometheus_client import Counter, Gauge, Histogram, start_http_server
+except ImportError:
+    Counter = Gauge = Histogram = start_http_server = None
+
+logger = logging.getLogger(__name__)
+
+# ===== PROMETHEUS METRICS =====
+# Process-wide counters and histograms in the Prometheus text format. With
+# KASPA_METRICS_PORT set, the first import starts an HTTP endpoint on that port
+# in a daemon thread, next to the Streamlit server:
+#
+#   KASPA_METRICS_PORT=9464 streamlit run app.py
+#   curl -s localhost:9464/metrics | grep ^kaspa_
+#
+# Without prometheus_client installed every metric is a no-op.
+
+METRICS_PORT = int(os.environ.get("KASPA_METRICS_PORT", 0))
+METRICS_ADDR = os.environ.get("KASPA_METRICS_ADDR", "0.0.0.0")
+
+SHEET_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+API_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+RERUN_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+class _NullMetric:
+    def labels(self, *args, **kwargs):
+        return self
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+def _metric(kind, name, documentation, labels=(), **kwargs):
+    return kind(name, documentation, labels, **kwargs) if kind else _NullMetric()
+
+SHEET_FETCH_SECONDS = _metric(Histogram, 'kaspa_sheet_fetch_seconds',
+                              'Data source requests by series; op is read (full sheet) or probe (change check)',
+                              ['series', 'op'], buckets=SHEET_BUCKETS)
+SHEET_FETCH_FAILURES = _metric(Counter, 'kaspa_sheet_fetch_failures_total',
+                               'Data source requests that raised', ['series', 'op'])
+CACHE_REQUESTS = _metric(Counter, 'kaspa_cache_requests_total',
+                         'Lookups in the shared caches by cache, entry and result (hit or miss)',
+                         ['cache', 'name', 'result'])
+API_REQUEST_SECONDS = _metric(Histogram, 'kaspa_api_request_seconds',
+                              'Kaspa API request latency, retries included', ['endpoint'], buckets=API_BUCKETS)
+API_RESPONSES = _metric(Counter, 'kaspa_api_responses_total',
+                        'Kaspa API responses by final status code, or error when none came back',
+                        ['endpoint', 'status'])
+RERUN_SECONDS = _metric(Histogram, 'kaspa_rerun_seconds',
+                        'Full script reruns by page', ['page'], buckets=RERUN_BUCKETS)
+SECTION_SECONDS = _metric(Histogram, 'kaspa_section_seconds',
+                          'Chart section runs, including fragment-only reruns', ['section'], buckets=RERUN_BUCKETS)
+ACTIVE_SESSIONS = _metric(Gauge, 'kaspa_active_sessions', 'Browser sessions connected to this server')
+PROCESS_RSS = _metric(Gauge, 'kaspa_process_rss_bytes', 'Resident set size of the server process')
+
+def _active_sessions():
+    try:
+        from streamlit.runtime import Runtime
+        return Runtime.instance()._session_mgr.num_active_sessions()
+    except Exception:
+        return float('nan')  # no running server, e.g. under AppTest
+
+def _process_rss():
+    from data_registry import process_rss_bytes
+    return process_rss_bytes()
+
+ACTIVE_SESSIONS.set_function(_active_sessions)
+PROCESS_RSS.set_function(_process_rss)
+
+# ===== RECORDING =====
+@contextlib.contextmanager
+def sheet_request(series, op):
+    """Times a data source request, counting it as failed if it raises"""
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        SHEET_FETCH_FAILURES.labels(series, op).inc()
+        raise
+    finally:
+        SHEET_FETCH_SECONDS.labels(series, op).observe(time.perf_counter() - start)
+
+# Addresses, hashes and numbers in API paths, so each endpoint is one series
+_API_PATH_PARAMS = [
+    (re.compile(r'kaspa(test|dev|sim)?:[a-z0-9]+'), '{address}'),
+    (re.compile(r'\b[0-9a-f]{64}\b'), '{hash}'),
+    (re.compile(r'/\d+(?=/|$)'), '/{n}'),
+]
+
+def api_endpoint_label(endpoint):
+    for pattern, placeholder in _API_PATH_PARAMS:
+        endpoint = pattern.sub(placeholder, endpoint)
+    return endpoint
+
+def record_api_request(endpoint, status, seconds):
+    endpoint = api_endpoint_label(endpoint)
+    API_REQUEST_SECONDS.labels(endpoint).observe(seconds)
+    API_RESPONSES.labels(endpoint, str(status)).inc()
+
+def record_cache(cache, name, hit):
+    CACHE_REQUESTS.labels(cache, name, 'hit' if hit else 'miss').inc()
+
+# A lookup through an st.cache_resource function can't see whether the cached
+# function ran; the function marks it with cache_miss() on this thread
+_local = threading.local()
+
+def cache_miss():
+    """Called at the start of a cached function, so the enclosing cache_lookup counts a miss"""
+    _local.missed = True
+
+@contextlib.contextmanager
+def cache_lookup(cache, name):
+    """Counts the enclosed cached call as a hit, or a miss if it ran cache_miss()"""
+    outer = getattr(_local, 'missed', False)
+    _local.missed = False
+    try:
+        yield
+    finally:
+        record_cache(cache, name, not _local.missed)
+        _local.missed = outer
+
+def record_rerun(page, seconds):
+    RERUN_SECONDS.labels(page).observe(seconds)
+
+def record_section(section, seconds):
+    SECTION_SECONDS.labels(section).observe(seconds)
+
+# ===== ENDPOINT =====
+_server_lock = threading.Lock()
+_server_started = False
+
+def start_metrics_server(port=METRICS_PORT, addr=METRICS_ADDR):
+    """Serves /metrics on port, once per process; a port already taken is logged, not raised"""
+    global _server_started
+    with _server_lock:
+        if _server_started or not port or start_http_server is None:
+            return
+        try:
+            start_http_server(port, addr=addr)
+            _server_started = True
+            logger.info("metrics on http://%s:%d/metrics", addr, port)
+        except OSError as e:
+            logger.warning("metrics endpoint not started on port %d: %s", port, e)
+
+start_metrics_server()
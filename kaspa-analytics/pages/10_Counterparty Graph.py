@@ -0,0 +1,127 @@
+import streamlit as st
+import plotly.graph_objects as go
+import numpy as np
+from history_store import load_store
+from counterparty_graph import load_counterparty_graph, counterparties, neighborhood
+
+st.set_page_config(page_title="Kaspa Counterparty Graph", page_icon="⛓️", layout="wide")
+
+HOP_COLORS = ['#00FFCC', '#FFA726', '#7E57C2', '#90A4AE']
+
+def neighborhood_figure(nodes, edges):
+    """Concentric layout: one ring per hop, nodes ordered by link volume around the ring"""
+    ring_rank = nodes.groupby('hop').cumcount().to_numpy()
+    ring_size = nodes.groupby('hop')['hop'].transform('size').to_numpy()
+    angle = 2 * np.pi * ring_rank / ring_size
+    radius = nodes['hop'].to_numpy().astype(float)
+    node_x = radius * np.cos(angle)
+    node_y = radius * np.sin(angle)
+
+    position = dict(zip(nodes['address'], range(len(nodes))))
+    src = edges['src'].map(position).to_numpy()
+    dst = edges['dst'].map(position).to_numpy()
+    edge_x = np.column_stack([node_x[src], node_x[dst], np.full(len(src), np.nan)]).ravel()
+    edge_y = np.column_stack([node_y[src], node_y[dst], np.full(len(src), np.nan)]).ravel()
+
+    fig = go.Figure()
+    fig.add_trace(go.Scattergl(
+        x=edge_x, y=edge_y,
+        mode='lines',
+        line=dict(color='rgba(255, 255, 255, 0.15)', width=1),
+        hoverinfo='skip',
+        showlegend=False
+    ))
+    for hop, hop_nodes in nodes.groupby('hop'):
+        idx = hop_nodes.index.to_numpy()
+        fig.add_trace(go.Scattergl(
+            x=node_x[idx], y=node_y[idx],
+            mode='markers',
+            name='Address' if hop == 0 else f'Hop {hop}',
+            marker=dict(size=12 if hop == 0 else 7, color=HOP_COLORS[min(hop, len(HOP_COLORS) - 1)]),
+            text=hop_nodes['address'],
+            customdata=hop_nodes['link_kas'],
+            hovertemplate='%{text}<br><b>Link volume</b>: %{customdata:,.2f} KAS<extra></extra>'
+        ))
+
+    fig.update_layout(
+        plot_bgcolor='#262730',
+        paper_bgcolor='#262730',
+        font_color='#e0e0e0',
+        height=700,
+        margin=dict(l=20, r=20, t=40, b=20),
+        xaxis=dict(visible=False),
+        yaxis=dict(visible=False, scaleanchor='x'),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return fig
+
+st.markdown('<div class="title-spacing"><h2>Counterparty Graph</h2></div>', unsafe_allow_html=True)
+st.divider()
+
+_, _, stored_addresses = load_store()
+if not stored_addresses:
+    st.info("No address histories stored yet. Fetch a full history in the Wallet Tracker first.")
+    st.stop()
+
+graph = load_counterparty_graph()
+st.caption(f"{len(stored_addresses):,} stored histories • {len(graph.addresses):,} addresses • "
+           f"{graph.volume.nnz:,} counterparty edges")
+
+col1, col2, col3, col4 = st.columns([3, 1, 1, 1])
+with col1:
+    address = st.selectbox("Address", sorted(stored_addresses))
+with col2:
+    hops = st.selectbox("Hops", [1, 2, 3], index=1)
+with col3:
+    min_edge_kas = st.number_input("Min edge volume (KAS)", min_value=0.0, value=0.0, step=100.0)
+with col4:
+    max_nodes = st.number_input("Max nodes", min_value=10, value=500, step=100)
+
+try:
+    direct = counterparties(graph, address)
+except KeyError as e:
+    st.warning(str(e))
+    st.stop()
+
+cols = st.columns(3)
+with cols[0]:
+    st.metric("Counterparties", f"{len(direct):,}")
+with cols[1]:
+    st.metric("Total Sent", f"{direct['sent_kas'].sum():,.2f} KAS")
+with cols[2]:
+    st.metric("Total Received", f"{direct['received_kas'].sum():,.2f} KAS")
+
+st.subheader("Direct Counterparties")
+st.dataframe(
+    direct,
+    column_config={
+        "counterparty": "Address",
+        "sent_kas": st.column_config.NumberColumn("Sent", format="%.2f KAS"),
+        "received_kas": st.column_config.NumberColumn("Received", format="%.2f KAS"),
+        "sent_txs": "Txs Out",
+        "received_txs": "Txs In",
+        "net_kas": st.column_config.NumberColumn("Net", format="%+.2f KAS"),
+        "total_kas": st.column_config.NumberColumn("Total", format="%.2f KAS")
+    },
+    hide_index=True,
+    use_container_width=True
+)
+
+st.subheader(f"{hops}-Hop Neighborhood")
+nodes, edges, truncated = neighborhood(graph, address, hops=hops, max_nodes=int(max_nodes), min_edge_kas=min_edge_kas)
+if truncated:
+    st.caption(f"Neighborhood limited to the {int(max_nodes):,} most strongly connected addresses")
+st.plotly_chart(neighborhood_figure(nodes, edges), use_container_width=True)
+
+with st.expander("Neighborhood edges"):
+    st.dataframe(
+        edges,
+        column_config={
+            "src": "From",
+            "dst": "To",
+            "kas": st.column_config.NumberColumn("Volume", format="%.2f KAS"),
+            "txs": "Txs"
+        },
+        hide_index=True,
+        use_container_width=True
+    )
@@ -1,119 +1,31 @@
 import streamlit as st
 import plotly.graph_objects as go
 import pandas as pd
-import numpy as np
-from utils import load_volume_data, fit_power_law
+from utils import power_law_curve
+from data_registry import get_volume_data, get_power_law_fit
+from chart_render import plotly_chart
+from theme import use_stylesheet
+from timing import start_rerun, timing_panel
 from datetime import datetime, timedelta
 
 st.set_page_config(layout="wide")
+start_rerun('price_volume')
 
 # Custom CSS - matching the style of your other pages
-st.markdown("""
-<style>
-    .stApp { background-color: #0E1117; }
-    .st-emotion-cache-6qob1r, .sidebar-content { background-color: #262730 !important; }
-    .title-spacing { padding-left: 40px; margin-bottom: 15px; }
-    div[data-testid="stVerticalBlock"] > div[data-testid="stVerticalBlockBorderWrapper"] {
-        background-color: #262730 !important;
-        border-radius: 10px !important;
-        border: 1px solid #3A3C4A !important;
-        padding: 15px !important;
-    }
-    div[data-testid="stMetric"] {
-        background-color: #262730 !important;
-        border: 1px solid #3A3C4A !important;
-        border-radius: 8px !important;
-        padding: 15px 20px !important;
-    }
-    div[data-testid="stMetricValue"] > div {
-        font-size: 24px !important;
-        font-weight: 600 !important;
-        color: #00FFCC !important;
-    }
-    div[data-testid="stMetricLabel"] > div {
-        font-size: 14px !important;
-        opacity: 0.8 !important;
-        color: #e0e0e0 !important;
-    }
-    .stMetric { margin: 5px !important; height: 100% !important; }
-    h2 { color: #e0e0e0 !important; }
-    .hovertext text.hovertext { fill: #e0e0e0 !important; }
-    .range-slider .handle:after { background-color: #00FFCC !important; }
-    .metrics-container {
-        width: calc(100% - 40px) !important;
-        margin-left: 20px !important;
-        margin-right: 20px !important;
-        margin-top: 10px !important;
-        margin-bottom: 0px !important;
-    }
-    .control-label {
-        font-size: 11px !important;
-        color: #e0e0e0 !important;
-        margin-bottom: 2px !important;
-        white-space: nowrap;
-    }
-    .st-emotion-cache-1dp5vir {
-        border-top: 2px solid #3A3C4A !important;
-        margin-top: 1px !important;
-        margin-bottom: 2px !important;
-    }
-    [data-baseweb="select"] {
-        font-size: 12px !important;
-    }
-    [data-baseweb="select"] > div {
-        padding: 2px 6px !important;
-        border-radius: 4px !important;
-        border: 1px solid #3A3C4A !important;
-        background-color: #262730 !important;
-        transition: all 0.2s ease;
-    }
-    [data-baseweb="select"] > div:hover {
-        border-color: #00FFCC !important;
-    }
-    [data-baseweb="select"] > div[aria-expanded="true"],
-    [data-baseweb="select"] > div:focus-within {
-        border-color: #00FFCC !important;
-        box-shadow: 0 0 0 1px #00FFCC !important;
-    }
-    [role="option"] {
-        font-size: 12px !important;
-        padding: 8px 12px !important;
-    }
-    [role="option"]:hover {
-        background-color: #3A3C4A !important;
-    }
-    [aria-selected="true"] {
-        background-color: #00FFCC20 !important;
-        color: #00FFCC !important;
-    }
-    div[role="combobox"] > div {
-        font-size: 12px !important;
-        color: #e0e0e0 !important;
-    }
-    .stSelectbox [data-baseweb="select"] > div:has(> div[aria-selected="true"]) {
-        border-color: #00FFCC !important;
-        background-color: #00FFCC10 !important;
-    }
-    .stSelectbox [data-baseweb="select"] > div:has(> div[aria-selected="true"]) > div {
-        color: #00FFCC !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+use_stylesheet('analysis')
 
 # Data loading
-if 'volume_df' not in st.session_state:
-    try:
-        st.session_state.volume_df = load_volume_data()
-    except Exception as e:
-        st.error(f"Failed to load volume data: {str(e)}")
-        st.stop()
+try:
+    volume_df = get_volume_data()
+except Exception as e:
+    st.error(f"Failed to load volume data: {str(e)}")
+    st.stop()
 
-volume_df = st.session_state.volume_df
 volume_df['Date'] = pd.to_datetime(volume_df['Date']).dt.normalize()
 
 # Calculate power law fit for Price vs Volume
 try:
-    a, b, r2 = fit_power_law(volume_df, x_col='Volume_USD', y_col='Price')
+    a, b, r2 = get_power_law_fit('volume', 'Price', x_col='Volume_USD')
 except Exception as e:
     st.error(f"Failed to calculate power law: {str(e)}")
     st.stop()
@@ -198,8 +110,8 @@ with st.container():
 
     # Add power law fit if enabled
     if show_power_law == "Show":
-        x_fit = np.linspace(filtered_df['Volume_USD'].min(), filtered_df['Volume_USD'].max(), 100)
-        y_fit = a * np.power(x_fit, b)
+        x_fit, y_fit = power_law_curve(a, b, filtered_df['Volume_USD'].min(), filtered_df['Volume_USD'].max(),
+                                       log_x=x_scale == "Log")
         
         fig.add_trace(go.Scatter(
             x=x_fit,
@@ -280,7 +192,7 @@ with st.container():
         )
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig, use_container_width=True)
 
 # Stats
 st.markdown('<div class="metrics-container">', unsafe_allow_html=True)
@@ -294,3 +206,5 @@ with cols[2]:
 with cols[3]:
     st.metric("Current Price", f"${volume_df['Price'].iloc[-1]:.4f}")
 st.markdown('</div>', unsafe_allow_html=True)
+
+timing_panel()
@@ -2,42 +2,32 @@ import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
 import pandas as pd
-from utils import fit_power_law, load_data, load_price_data
+from utils import power_law_curve, fit_curve_x
+from data_registry import get_price_hashrate_data, get_power_law_fit
+from chart_render import plotly_chart
+from theme import use_stylesheet
+from timing import start_rerun, timing_panel
 from datetime import datetime, timedelta
 
 st.set_page_config(layout="wide")
+start_rerun('price_hashrate')
 
 # Data loading and processing
-if 'df' not in st.session_state or 'genesis_date' not in st.session_state:
-    try:
-        st.session_state.df, st.session_state.genesis_date = load_data()
-        st.session_state.price_df, _ = load_price_data()
-    except Exception as e:
-        st.error(f"Failed to load data: {str(e)}")
-        st.stop()
-
-df = st.session_state.df
-price_df = st.session_state.price_df
-genesis_date = st.session_state.genesis_date
-
-# Merge data and clean
-df['Date'] = pd.to_datetime(df['Date']).dt.normalize()
-price_df['Date'] = pd.to_datetime(price_df['Date']).dt.normalize()
-price_df = price_df.drop_duplicates('Date', keep='last')
-merged_df = pd.merge(df, price_df[['Date', 'Price']], on='Date', how='left')
+try:
+    merged_df, genesis_date = get_price_hashrate_data()
+except Exception as e:
+    st.error(f"Failed to load data: {str(e)}")
+    st.stop()
 
 # Remove rows where either hashrate or price is missing
 analysis_df = merged_df.dropna(subset=['Hashrate_PH', 'Price']).copy()
-analysis_df['Price_Hashrate_Ratio'] = analysis_df['Price'] / analysis_df['Hashrate_PH']
-
-# Calculate days since genesis for log time scale
-analysis_df['Days_Since_Genesis'] = (analysis_df['Date'] - genesis_date).dt.days + 1  # +1 to avoid log(0)
 
 # Calculate power law for price vs hashrate relationship
 try:
-    a_relation, b_relation, r2_relation = fit_power_law(analysis_df, x_col='Hashrate_PH', y_col='Price')
+    a_relation, b_relation, r2_relation = get_power_law_fit('price_hashrate', 'Price', x_col='Hashrate_PH')
     # Calculate power law for ratio vs time relationship
-    a_ratio_time, b_ratio_time, r2_ratio_time = fit_power_law(analysis_df, x_col='Days_Since_Genesis', y_col='Price_Hashrate_Ratio')
+    a_ratio_time, b_ratio_time, r2_ratio_time = get_power_law_fit(
+        'price_hashrate', 'Price_Hashrate_Ratio', x_col='Days_Since_Genesis')
 except Exception as e:
     st.error(f"Failed to calculate power laws: {str(e)}")
     st.stop()
@@ -48,101 +38,7 @@ purple_gradient = ['#00FFCC', '#40E0D0', '#80C0FF', '#A080FF', '#C040FF', '#E000
 last_7['color'] = purple_gradient
 
 # Custom CSS - consistent styling
-st.markdown("""
-<style>
-    .stApp { background-color: #0E1117; }
-    .st-emotion-cache-6qob1r, .sidebar-content { background-color: #262730 !important; }
-    .title-spacing { padding-left: 40px; margin-bottom: 15px; }
-    div[data-testid="stVerticalBlock"] > div[data-testid="stVerticalBlockBorderWrapper"] {
-        background-color: #262730 !important;
-        border-radius: 10px !important;
-        border: 1px solid #3A3C4A !important;
-        padding: 15px !important;
-    }
-    div[data-testid="stMetric"] {
-        background-color: #262730 !important;
-        border: 1px solid #3A3C4A !important;
-        border-radius: 8px !important;
-        padding: 15px 20px !important;
-    }
-    div[data-testid="stMetricValue"] > div {
-        font-size: 24px !important;
-        font-weight: 600 !important;
-        color: #00FFCC !important;
-    }
-    div[data-testid="stMetricLabel"] > div {
-        font-size: 14px !important;
-        opacity: 0.8 !important;
-        color: #e0e0e0 !important;
-    }
-    .stMetric { margin: 5px !important; height: 100% !important; }
-    h2 { color: #e0e0e0 !important; }
-    .hovertext text.hovertext { fill: #e0e0e0 !important; }
-    .range-slider .handle:after { background-color: #00FFCC !important; }
-    .metrics-container {
-        width: calc(100% - 40px) !important;
-        margin-left: 20px !important;
-        margin-right: 20px !important;
-        margin-top: 10px !important;
-        margin-bottom: 0px !important;
-    }
-    .control-label {
-        font-size: 11px !important;
-        color: #e0e0e0 !important;
-        margin-bottom: 2px !important;
-        white-space: nowrap;
-    }
-    .st-emotion-cache-1dp5vir {
-        border-top: 2px solid #3A3C4A !important;
-        margin-top: 1px !important;
-        margin-bottom: 2px !important;
-    }
-    [data-baseweb="select"] {
-        font-size: 12px !important;
-    }
-    [data-baseweb="select"] > div {
-        padding: 2px 6px !important;
-        border-radius: 4px !important;
-        border: 1px solid #3A3C4A !important;
-        background-color: #262730 !important;
-        transition: all 0.2s ease;
-    }
-    [data-baseweb="select"] > div:hover {
-        border-color: #00FFCC !important;
-    }
-    [data-baseweb="select"] > div[aria-expanded="true"],
-    [data-baseweb="select"] > div:focus-within {
-        border-color: #00FFCC !important;
-        box-shadow: 0 0 0 1px #00FFCC !important;
-    }
-    [role="option"] {
-        font-size: 12px !important;
-        padding: 8px 12px !important;
-    }
-    [role="option"]:hover {
-        background-color: #3A3C4A !important;
-    }
-    [aria-selected="true"] {
-        background-color: #00FFCC20 !important;
-        color: #00FFCC !important;
-    }
-    div[role="combobox"] > div {
-        font-size: 12px !important;
-        color: #e0e0e0 !important;
-    }
-    .stSelectbox [data-baseweb="select"] > div:has(> div[aria-selected="true"]) {
-        border-color: #00FFCC !important;
-        background-color: #00FFCC10 !important;
-    }
-    .stSelectbox [data-baseweb="select"] > div:has(> div[aria-selected="true"]) > div {
-        color: #00FFCC !important;
-    }
-    .ratio-chart {
-        margin-top: -30px !important;
-        height: 250px !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+use_stylesheet('price_hashrate')
 
 # ====== MAIN CHART CONTAINER ======
 with st.container():
@@ -240,8 +136,8 @@ with st.container():
 
     if show_power_law == "Show":
         # Generate fitted values
-        x_fit = np.linspace(analysis_df['Hashrate_PH'].min(), analysis_df['Hashrate_PH'].max(), 100)
-        y_fit = a_relation * np.power(x_fit, b_relation)
+        x_fit, y_fit = power_law_curve(a_relation, b_relation, analysis_df['Hashrate_PH'].min(),
+                                       analysis_df['Hashrate_PH'].max(), log_x=x_scale_type == "Log")
         
         fig.add_trace(go.Scatter(
             x=x_fit,
@@ -322,7 +218,7 @@ with st.container():
         )
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig, use_container_width=True)
 
     # ====== RATIO CHART ======
     st.markdown('<div class="title-spacing"><h4>Price/Hashrate Ratio</h4></div>', unsafe_allow_html=True)
@@ -370,9 +266,8 @@ with st.container():
     if show_ratio_fit == "Show":
         # Generate fitted values for ratio chart
         if time_scale == "Log":
-            x_fit_ratio = np.logspace(np.log10(analysis_df['Days_Since_Genesis'].min()), 
-                                     np.log10(analysis_df['Days_Since_Genesis'].max()), 
-                                     100)
+            x_fit_ratio = fit_curve_x(analysis_df['Days_Since_Genesis'].min(),
+                                      analysis_df['Days_Since_Genesis'].max(), log_x=True)
             y_fit_ratio = a_ratio_time * np.power(x_fit_ratio, b_ratio_time)
             
             ratio_fig.add_trace(go.Scatter(
@@ -385,7 +280,7 @@ with st.container():
         else:
             # For linear time scale, we'll use date numeric values but display as dates
             date_numeric = (analysis_df['Date'] - analysis_df['Date'].min()).dt.days + 1
-            x_fit_ratio = np.linspace(1, date_numeric.max(), 100)
+            x_fit_ratio = fit_curve_x(1, date_numeric.max())
             y_fit_ratio = a_ratio_time * np.power(x_fit_ratio, b_ratio_time)
             
             # Convert numeric days back to dates
@@ -439,7 +334,7 @@ with st.container():
         )
     )
     
-    st.plotly_chart(ratio_fig, use_container_width=True, className="ratio-chart")
+    plotly_chart(ratio_fig, use_container_width=True, className="ratio-chart")
 
 # Stats
 st.markdown('<div class="metrics-container">', unsafe_allow_html=True)
@@ -453,6 +348,8 @@ with cols[2]:
 with cols[3]:
     st.metric("Ratio-Time Fit (R²)", f"{r2_ratio_time:.3f}")
 with cols[4]:
-    st.metric("Current Hashrate", f"{df['Hashrate_PH'].iloc[-1]:.2f} PH/s")
+    st.metric("Current Hashrate", f"{merged_df['Hashrate_PH'].iloc[-1]:.2f} PH/s")
 with cols[5]:
-    st.metric("Current Price", f"${price_df['Price'].iloc[-1]:.4f}")
+    st.metric("Current Price", f"${merged_df['Price'].dropna().iloc[-1]:.4f}")
+
+timing_panel()
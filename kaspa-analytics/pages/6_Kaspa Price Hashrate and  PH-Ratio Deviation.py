@@ -1,105 +1,30 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-import pandas as pd
-from scipy.optimize import curve_fit
-from datetime import datetime, timedelta
+from data_registry import get_price_hashrate_data, get_price_data, get_power_law_fit, get_ratio_deviation, get_chart_series
+from chart_pyramid import aggregate
+from downsample import downsample_frame
+from chart_render import apply_render_mode, plotly_chart
+from theme import use_stylesheet
+from timing import start_rerun, timing_panel
+from datetime import timedelta
 
 st.set_page_config(layout="wide")
-
-# Define power law fitting function (using log-log space for better fit)
-def fit_power_law_loglog(df, x_col='days_from_genesis', y_col='Price_Hashrate_Ratio'):
-    """Fit power law y = a*x^b to data in log-log space"""
-    x_data = np.log(df[x_col].values)
-    y_data = np.log(df[y_col].values)
-    
-    # Linear function for log-log space
-    def linear_func(x, a, b):
-        return a * x + b
-    
-    try:
-        params, _ = curve_fit(linear_func, x_data, y_data)
-        a_log, b_log = params
-        
-        # Convert back to power law parameters
-        a = np.exp(b_log)
-        b = a_log
-        
-        # Calculate R-squared in log space
-        y_pred = linear_func(x_data, a_log, b_log)
-        residuals = y_data - y_pred
-        ss_res = np.sum(residuals**2)
-        ss_tot = np.sum((y_data - np.mean(y_data))**2)
-        r_squared = 1 - (ss_res / ss_tot)
-        
-        return a, b, r_squared
-    except Exception as e:
-        st.error(f"Power law fitting failed: {str(e)}")
-        return None, None, None
+start_rerun('ph_ratio_deviation')
 
 # Data loading and processing
-if 'df' not in st.session_state or 'genesis_date' not in st.session_state:
-    try:
-        # Mock data loading functions for demonstration
-        def load_data():
-            date_rng = pd.date_range(start='2022-01-01', end=datetime.now(), freq='D')
-            df = pd.DataFrame(date_rng, columns=['Date'])
-            df['Hashrate_PH'] = np.exp(np.linspace(0, 10, len(df))) * 0.01  # Exponential growth
-            df['days_from_genesis'] = (df['Date'] - df['Date'].iloc[0]).dt.days
-            return df, df['Date'].iloc[0]
-        
-        def load_price_data():
-            date_rng = pd.date_range(start='2022-01-01', end=datetime.now(), freq='D')
-            price_df = pd.DataFrame(date_rng, columns=['Date'])
-            price_df['Price'] = np.random.lognormal(mean=-2, sigma=0.5, size=len(price_df)) * 1000
-            return price_df, None
-            
-        st.session_state.df, st.session_state.genesis_date = load_data()
-        st.session_state.price_df, _ = load_price_data()
-    except Exception as e:
-        st.error(f"Failed to load data: {str(e)}")
-        st.stop()
-
-df = st.session_state.df
-price_df = st.session_state.price_df
-genesis_date = st.session_state.genesis_date
-
-# Normalize timestamps to daily resolution
-df['Date'] = pd.to_datetime(df['Date']).dt.normalize()
-price_df['Date'] = pd.to_datetime(price_df['Date']).dt.normalize()
-
-# Remove duplicate dates (keep last)
-price_df = price_df.drop_duplicates('Date', keep='last')
-
-# Merge data
-merged_df = pd.merge(df, price_df[['Date', 'Price']], on='Date', how='left')
-
-# Calculate price/hashrate ratio and days since genesis
-analysis_df = merged_df.dropna(subset=['Hashrate_PH', 'Price']).copy()
-analysis_df['Price_Hashrate_Ratio'] = analysis_df['Price'] / analysis_df['Hashrate_PH']
-analysis_df['Days_Since_Genesis'] = (analysis_df['Date'] - genesis_date).dt.days + 1  # +1 to avoid log(0)
+try:
+    merged_df, genesis_date = get_price_hashrate_data()
+    price_df, _ = get_price_data()
+except Exception as e:
+    st.error(f"Failed to load data: {str(e)}")
+    st.stop()
 
-# Calculate power law fit for the ratio in log-log space
+# Power law of the ratio over time (log-log fit), and each day's percentage
+# deviation from it with rolling 2-sigma bands
 try:
-    # Fit power law to the ratio vs time in log-log space
-    a_ratio, b_ratio, r2_ratio = fit_power_law_loglog(analysis_df, x_col='Days_Since_Genesis', y_col='Price_Hashrate_Ratio')
-    if None in [a_ratio, b_ratio, r2_ratio]:
-        st.error("Failed to calculate ratio power law fit")
-        st.stop()
-        
-    # Calculate expected ratio values based on power law
-    analysis_df['Expected_Ratio'] = a_ratio * np.power(analysis_df['Days_Since_Genesis'], b_ratio)
-    
-    # Calculate percentage deviation from expected ratio
-    analysis_df['Ratio_Deviation_Pct'] = ((analysis_df['Price_Hashrate_Ratio'] - analysis_df['Expected_Ratio']) / analysis_df['Expected_Ratio']) * 100
-    
-    # Calculate standard deviation bands
-    rolling_window = min(30, len(analysis_df))  # Use 30-day window or all data if less
-    analysis_df['Deviation_MA'] = analysis_df['Ratio_Deviation_Pct'].rolling(rolling_window).mean()
-    analysis_df['Deviation_Std'] = analysis_df['Ratio_Deviation_Pct'].rolling(rolling_window).std()
-    analysis_df['Upper_Band'] = analysis_df['Deviation_MA'] + (2 * analysis_df['Deviation_Std'])
-    analysis_df['Lower_Band'] = analysis_df['Deviation_MA'] - (2 * analysis_df['Deviation_Std'])
-    
+    a_ratio, b_ratio, r2_ratio = get_power_law_fit('price_hashrate', 'Price_Hashrate_Ratio', x_col='Days_Since_Genesis')
+    analysis_df = get_ratio_deviation()
 except Exception as e:
     st.error(f"Failed to calculate ratio power law: {str(e)}")
     st.stop()
@@ -110,97 +35,7 @@ purple_gradient = ['#00FFCC', '#40E0D0', '#80C0FF', '#A080FF', '#C040FF', '#E000
 last_7['color'] = purple_gradient
 
 # Custom CSS to match other pages
-st.markdown("""
-<style>
-    .stApp { background-color: #0E1117; }
-    .st-emotion-cache-6qob1r, .sidebar-content { background-color: #262730 !important; }
-    .title-spacing { padding-left: 40px; margin-bottom: 15px; }
-    div[data-testid="stVerticalBlock"] > div[data-testid="stVerticalBlockBorderWrapper"] {
-        background-color: #262730 !important;
-        border-radius: 10px !important;
-        border: 1px solid #3A3C4A !important;
-        padding: 15px !important;
-    }
-    div[data-testid="stMetric"] {
-        background-color: #262730 !important;
-        border: 1px solid #3A3C4A !important;
-        border-radius: 8px !important;
-        padding: 15px 20px !important;
-    }
-    div[data-testid="stMetricValue"] > div {
-        font-size: 24px !important;
-        font-weight: 600 !important;
-        color: #00FFCC !important;
-    }
-    div[data-testid="stMetricLabel"] > div {
-        font-size: 14px !important;
-        opacity: 0.8 !important;
-        color: #e0e0e0 !important;
-    }
-    .stMetric { margin: 5px !important; height: 100% !important; }
-    h2 { color: #e0e0e0 !important; }
-    .hovertext text.hovertext { fill: #e0e0e0 !important; }
-    .range-slider .handle:after { background-color: #00FFCC !important; }
-    .metrics-container {
-        width: calc(100% - 40px) !important;
-        margin-left: 20px !important;
-        margin-right: 20px !important;
-        margin-top: 10px !important;
-        margin-bottom: 0px !important;
-    }
-    .control-label {
-        font-size: 11px !important;
-        color: #e0e0e0 !important;
-        margin-bottom: 2px !important;
-        white-space: nowrap;
-    }
-    .st-emotion-cache-1dp5vir {
-        border-top: 2px solid #3A3C4A !important;
-        margin-top: 1px !important;
-        margin-bottom: 2px !important;
-    }
-    [data-baseweb="select"] {
-        font-size: 12px !important;
-    }
-    [data-baseweb="select"] > div {
-        padding: 2px 6px !important;
-        border-radius: 4px !important;
-        border: 1px solid #3A3C4A !important;
-        background-color: #262730 !important;
-        transition: all 0.2s ease;
-    }
-    [data-baseweb="select"] > div:hover {
-        border-color: #00FFCC !important;
-    }
-    [data-baseweb="select"] > div[aria-expanded="true"],
-    [data-baseweb="select"] > div:focus-within {
-        border-color: #00FFCC !important;
-        box-shadow: 0 0 0 1px #00FFCC !important;
-    }
-    [role="option"] {
-        font-size: 12px !important;
-        padding: 8px 12px !important;
-    }
-    [role="option"]:hover {
-        background-color: #3A3C4A !important;
-    }
-    [aria-selected="true"] {
-        background-color: #00FFCC20 !important;
-        color: #00FFCC !important;
-    }
-    div[role="combobox"] > div {
-        font-size: 12px !important;
-        color: #e0e0e0 !important;
-    }
-    .stSelectbox [data-baseweb="select"] > div:has(> div[aria-selected="true"]) {
-        border-color: #00FFCC !important;
-        background-color: #00FFCC10 !important;
-    }
-    .stSelectbox [data-baseweb="select"] > div:has(> div[aria-selected="true"]) > div {
-        color: #00FFCC !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+use_stylesheet('analysis')
 
 # ====== MAIN CHART CONTAINER ======
 with st.container():
@@ -261,8 +96,9 @@ with st.container():
     else:
         start_date = merged_df['Date'].iloc[0]
 
-    filtered_df = merged_df[merged_df['Date'] >= start_date]
-    filtered_analysis_df = analysis_df[analysis_df['Date'] >= start_date]
+    filtered_df, chart_level = get_chart_series('price_hashrate', start_date, value_cols=['Hashrate_PH', 'Price'])
+    filtered_analysis_df = downsample_frame(aggregate(analysis_df[analysis_df['Date'] >= start_date], chart_level),
+                                            ['Ratio_Deviation_Pct'])
 
     # Create figure with secondary y-axis for oscillator
     fig = go.Figure()
@@ -481,13 +317,14 @@ with st.container():
         )
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    fig = apply_render_mode(fig)
+    plotly_chart(fig, use_container_width=True)
 
 # Stats
 st.markdown('<div class="metrics-container">', unsafe_allow_html=True)
 cols = st.columns(4)
 with cols[0]:
-    st.metric("Current Hashrate", f"{df['Hashrate_PH'].iloc[-1]:.2f} PH/s")
+    st.metric("Current Hashrate", f"{merged_df['Hashrate_PH'].iloc[-1]:.2f} PH/s")
 with cols[1]:
     st.metric("Current Price", f"${price_df['Price'].iloc[-1]:.4f}")
 with cols[2]:
@@ -496,3 +333,5 @@ with cols[2]:
 with cols[3]:
     st.metric("Ratio Trend (R²)", f"{r2_ratio:.3f}")
 st.markdown('</div>', unsafe_allow_html=True)
+
+timing_panel()
@@ -1,161 +1,34 @@
 import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
-import pandas as pd
-from utils import load_data, load_price_data, fit_power_law
+from data_registry import get_price_hashrate_data, get_power_law_fit, get_price_residuals, get_chart_series
+from chart_pyramid import aggregate
+from downsample import downsample_frame
+from chart_render import apply_render_mode, plotly_chart
+from theme import use_stylesheet
+from timing import start_rerun, timing_panel
 from datetime import datetime, timedelta
 
 st.set_page_config(layout="wide")
+start_rerun('power_law_residual')
 
 # Data loading and processing
-@st.cache_data
-def load_all_data():
-    try:
-        df, genesis_date = load_data()
-        price_df, _ = load_price_data()
-        return df, price_df, genesis_date
-    except Exception as e:
-        st.error(f"Failed to load data: {str(e)}")
-        st.stop()
+try:
+    merged_df, genesis_date = get_price_hashrate_data()
+except Exception as e:
+    st.error(f"Failed to load data: {str(e)}")
+    st.stop()
 
-if 'df' not in st.session_state or 'genesis_date' not in st.session_state:
-    st.session_state.df, st.session_state.price_df, st.session_state.genesis_date = load_all_data()
-
-df = st.session_state.df
-price_df = st.session_state.price_df
-genesis_date = st.session_state.genesis_date
-
-# Data processing
-@st.cache_data
-def process_data(_df, _price_df, genesis_date):
-    # Normalize timestamps to daily resolution
-    _df['Date'] = pd.to_datetime(_df['Date']).dt.normalize()
-    _price_df['Date'] = pd.to_datetime(_price_df['Date']).dt.normalize()
-
-    # Remove duplicate dates (keep last)
-    _price_df = _price_df.drop_duplicates('Date', keep='last')
-
-    # Merge data
-    merged_df = pd.merge(_df, _price_df[['Date', 'Price']], on='Date', how='left')
-    
-    # Calculate days from genesis
-    merged_df['days_from_genesis'] = (merged_df['Date'] - genesis_date).dt.days + 1
-    
-    # Calculate Price/Hashrate ratio and days since genesis
-    analysis_df = merged_df.dropna(subset=['Hashrate_PH', 'Price']).copy()
-    analysis_df['Price_Hashrate_Ratio'] = analysis_df['Price'] / analysis_df['Hashrate_PH']
-    analysis_df['Days_Since_Genesis'] = (analysis_df['Date'] - genesis_date).dt.days + 1  # +1 to avoid log(0)
-
-    # Calculate power law for price vs hashrate relationship
-    try:
-        a_relation, b_relation, r2_relation = fit_power_law(analysis_df, x_col='Hashrate_PH', y_col='Price')
-        
-        # Calculate expected price based on power law
-        analysis_df['Expected_Price'] = a_relation * np.power(analysis_df['Hashrate_PH'], b_relation)
-        
-        # Calculate percentage deviation from power law
-        analysis_df['Price_Deviation_Pct'] = ((analysis_df['Price'] - analysis_df['Expected_Price']) / analysis_df['Expected_Price']) * 100
-        
-    except Exception as e:
-        st.error(f"Failed to calculate power laws: {str(e)}")
-        st.stop()
-    
-    return merged_df, analysis_df, a_relation, b_relation
-
-merged_df, analysis_df, a_relation, b_relation = process_data(df, price_df, genesis_date)
+# Price's deviation from its power law in hashrate
+try:
+    a_relation, b_relation, r2_relation = get_power_law_fit('price_hashrate', 'Price', x_col='Hashrate_PH')
+    analysis_df = get_price_residuals()
+except Exception as e:
+    st.error(f"Failed to calculate power laws: {str(e)}")
+    st.stop()
 
 # Custom CSS - updated divider styling
-st.markdown("""
-<style>
-    .stApp { background-color: #0E1117; }
-    .st-emotion-cache-6qob1r, .sidebar-content { background-color: #262730 !important; }
-    .title-spacing { padding-left: 40px; margin-bottom: 15px; }
-    div[data-testid="stVerticalBlock"] > div[data-testid="stVerticalBlockBorderWrapper"] {
-        background-color: #262730 !important;
-        border-radius: 10px !important;
-        border: 1px solid #3A3C4A !important;
-        padding: 15px !important;
-    }
-    div[data-testid="stMetric"] {
-        background-color: #262730 !important;
-        border: 1px solid #3A3C4A !important;
-        border-radius: 8px !important;
-        padding: 15px 20px !important;
-    }
-    div[data-testid="stMetricValue"] > div {
-        font-size: 24px !important;
-        font-weight: 600 !important;
-        color: #00FFCC !important;
-    }
-    div[data-testid="stMetricLabel"] > div {
-        font-size: 14px !important;
-        opacity: 0.8 !important;
-        color: #e0e0e0 !important;
-    }
-    .stMetric { margin: 5px !important; height: 100% !important; }
-    h2 { color: #e0e0e0 !important; }
-    .hovertext text.hovertext { fill: #e0e0e0 !important; }
-    .range-slider .handle:after { background-color: #00FFCC !important; }
-    .metrics-container {
-        width: calc(100% - 40px) !important;
-        margin-left: 20px !important;
-        margin-right: 20px !important;
-        margin-top: 10px !important;
-        margin-bottom: 0px !important;
-    }
-    .control-label {
-        font-size: 11px !important;
-        color: #e0e0e0 !important;
-        margin-bottom: 2px !important;
-        white-space: nowrap;
-    }
-    .st-emotion-cache-1dp5vir {
-        border-top: 2px solid #3A3C4A !important;
-        margin-top: 1px !important;
-        margin-bottom: 2px !important;
-    }
-    [data-baseweb="select"] {
-        font-size: 12px !important;
-    }
-    [data-baseweb="select"] > div {
-        padding: 2px 6px !important;
-        border-radius: 4px !important;
-        border: 1px solid #3A3C4A !important;
-        background-color: #262730 !important;
-        transition: all 0.2s ease;
-    }
-    [data-baseweb="select"] > div:hover {
-        border-color: #00FFCC !important;
-    }
-    [data-baseweb="select"] > div[aria-expanded="true"],
-    [data-baseweb="select"] > div:focus-within {
-        border-color: #00FFCC !important;
-        box-shadow: 0 0 0 1px #00FFCC !important;
-    }
-    [role="option"] {
-        font-size: 12px !important;
-        padding: 8px 12px !important;
-    }
-    [role="option"]:hover {
-        background-color: #3A3C4A !important;
-    }
-    [aria-selected="true"] {
-        background-color: #00FFCC20 !important;
-        color: #00FFCC !important;
-    }
-    div[role="combobox"] > div {
-        font-size: 12px !important;
-        color: #e0e0e0 !important;
-    }
-    .stSelectbox [data-baseweb="select"] > div:has(> div[aria-selected="true"]) {
-        border-color: #00FFCC !important;
-        background-color: #00FFCC10 !important;
-    }
-    .stSelectbox [data-baseweb="select"] > div:has(> div[aria-selected="true"]) > div {
-        color: #00FFCC !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+use_stylesheet('analysis')
 
 # ====== MAIN CHART CONTAINER ======
 with st.container():
@@ -210,15 +83,16 @@ with st.container():
     else:
         start_date = merged_df['Date'].iloc[0]
 
-    filtered_df = merged_df[merged_df['Date'] >= start_date]
-    filtered_analysis_df = analysis_df[analysis_df['Date'] >= start_date]
+    filtered_df, chart_level = get_chart_series('price_hashrate', start_date, value_cols=['Hashrate_PH', 'Price'])
+    filtered_analysis_df = downsample_frame(aggregate(analysis_df[analysis_df['Date'] >= start_date], chart_level),
+                                            ['Price_Deviation_Pct'])
 
     # Create figure with subplots
     fig = go.Figure()
 
     # Create main chart (top)
     if x_scale_type == "Log":
-        x_values = filtered_df['days_from_genesis']
+        x_values = filtered_df['Days_Since_Genesis']
         x_title = "Days Since Genesis (Log Scale)"
     else:
         x_values = filtered_df['Date']
@@ -371,15 +245,16 @@ with st.container():
         )
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    fig = apply_render_mode(fig)
+    plotly_chart(fig, use_container_width=True)
 
 # Stats
 st.markdown('<div class="metrics-container">', unsafe_allow_html=True)
 cols = st.columns(4)
 with cols[0]:
-    st.metric("Current Hashrate", f"{filtered_df['Hashrate_PH'].iloc[-1]:.2f} PH/s")
+    st.metric("Current Hashrate", f"{merged_df['Hashrate_PH'].iloc[-1]:.2f} PH/s")
 with cols[1]:
-    st.metric("Current Price", f"${filtered_df['Price'].iloc[-1]:.4f}")
+    st.metric("Current Price", f"${merged_df['Price'].iloc[-1]:.4f}")
 with cols[2]:
     st.metric("Power-Law Slope", f"{b_relation:.3f}")
 with cols[3]:
@@ -387,3 +262,5 @@ with cols[3]:
         current_deviation = analysis_df['Price_Deviation_Pct'].iloc[-1]
         st.metric("Current Deviation", f"{current_deviation:.1f}%")
 st.markdown('</div>', unsafe_allow_html=True)
+
+timing_panel()
@@ -1,18 +1,22 @@
 import streamlit as st
 import requests
 import pandas as pd
+import plotly.graph_objects as go
 from datetime import datetime
+from kaspa_api import api_get
+from block_drilldown import MAX_BLUE_SCORE_RANGE, drill_down_block, drill_down_blue_score_range
+from utxo_analytics import (
+    DEFAULT_DUST_THRESHOLD_KAS, parse_utxos, size_histogram, age_distribution, dust_summary, utxo_table
+)
 
 # Configuration
-API_BASE_URL = "https://api.kaspa.org"
+UTXO_TABLE_LIMIT = 1000
 st.set_page_config(page_title="Kaspa Explorer", page_icon="⛓️", layout="wide")
 
 # Helper functions
 def make_api_request(endpoint, params=None, as_text=False):
     try:
-        response = requests.get(f"{API_BASE_URL}{endpoint}", params=params)
-        response.raise_for_status()
-        return response.text if as_text else response.json()
+        return api_get(endpoint, params=params, as_text=as_text)
     except requests.exceptions.RequestException as e:
         st.error(f"API request failed: {str(e)}")
         return None
@@ -27,6 +31,48 @@ def format_timestamp(timestamp_ms):
     except:
         return "N/A"
 
+def utxo_bar_chart(buckets_df, x_title):
+    fig = go.Figure(go.Bar(
+        x=buckets_df['bucket'],
+        y=buckets_df['utxos'],
+        marker_color='#00FFCC',
+        hovertemplate='%{x}<br><b>UTXOs</b>: %{y:,}<extra></extra>'
+    ))
+    fig.update_layout(
+        plot_bgcolor='#262730',
+        paper_bgcolor='#262730',
+        font_color='#e0e0e0',
+        height=320,
+        margin=dict(l=20, r=20, t=20, b=20),
+        xaxis_title=x_title,
+        yaxis_title='UTXOs',
+        xaxis=dict(type='category'),
+        yaxis=dict(gridcolor='rgba(255, 255, 255, 0.1)')
+    )
+    return fig
+
+def render_drill_down(result):
+    if result['failed']:
+        st.warning(f"{len(result['failed'])} transaction(s) could not be resolved; run the drill-down again to retry them")
+
+    col_d1, col_d2, col_d3, col_d4 = st.columns(4)
+    col_d1.metric("Blocks", f"{len(result['blocks']):,}")
+    col_d2.metric("Transactions", f"{len(result['transactions']):,}")
+    col_d3.metric("Inputs", f"{len(result['inputs']):,}")
+    col_d4.metric("Outputs", f"{len(result['outputs']):,}")
+
+    amount_format = {'amount': '{:,.8f}'}
+    st.markdown("**Transactions**")
+    st.dataframe(result['transactions'].style.format({'input_amount': '{:,.8f}', 'output_amount': '{:,.8f}'}),
+                 hide_index=True)
+    col_i, col_o = st.columns(2)
+    with col_i:
+        st.markdown("**Inputs**")
+        st.dataframe(result['inputs'].style.format(amount_format), hide_index=True)
+    with col_o:
+        st.markdown("**Outputs**")
+        st.dataframe(result['outputs'].style.format(amount_format), hide_index=True)
+
 def safe_get(data, *keys, default=None):
     """Safely get nested dictionary values"""
     for key in keys:
@@ -118,6 +164,8 @@ with tab2:
     
     address = st.text_input("Enter a Kaspa address (e.g. kaspa:qq...):", 
                           value="kaspa:qqkqkzjvr7zwxxmjxjkmxxdwju9kjs6e9u82uh59z07vgaks6gg62v8707g73")
+    st.number_input("Dust threshold (KAS)", min_value=0.0, value=DEFAULT_DUST_THRESHOLD_KAS,
+                    step=0.01, format="%.8f", key="utxo_dust_threshold")
     
     if st.button("Lookup Address"):
         if address and address.startswith("kaspa:"):
@@ -135,17 +183,35 @@ with tab2:
                 utxos_data = make_api_request(f"/addresses/{address}/utxos")
                 if utxos_data and isinstance(utxos_data, list):
                     try:
-                        utxos_list = []
-                        for utxo in utxos_data:
-                            if isinstance(utxo, dict) and 'utxoEntry' in utxo:
-                                amount_str = safe_get(utxo, 'utxoEntry', 'amount', default=['0'])[0]
-                                amount = float(amount_str) / 1e8
-                                utxos_list.append({
-                                    'address': safe_get(utxo, 'address', default=''),
-                                    'amount': amount
-                                })
-                        if utxos_list:
-                            utxos_df = pd.DataFrame(utxos_list)
+                        utxos = parse_utxos(utxos_data)
+                        if len(utxos['amount']):
+                            dust_threshold = st.session_state.get("utxo_dust_threshold", DEFAULT_DUST_THRESHOLD_KAS)
+                            dust = dust_summary(utxos['amount'], dust_threshold)
+
+                            col_u1, col_u2, col_u3 = st.columns(3)
+                            col_u1.metric("UTXO Count", f"{len(utxos['amount']):,}")
+                            col_u2.metric(f"Dust UTXOs (< {dust_threshold:g} KAS)",
+                                          f"{dust['dust_count']:,}", f"{dust['dust_share']:.1%} of UTXOs",
+                                          delta_color="off")
+                            col_u3.metric("Value in Dust", f"{dust['dust_kas']:,.8f} KAS")
+
+                            col_h1, col_h2 = st.columns(2)
+                            with col_h1:
+                                st.markdown("**UTXO Size Distribution**")
+                                sizes = size_histogram(utxos['amount'])
+                                st.plotly_chart(utxo_bar_chart(sizes, 'Size (KAS)'), use_container_width=True)
+                            with col_h2:
+                                st.markdown("**UTXO Age Distribution**")
+                                blockdag = make_api_request("/info/blockdag")
+                                virtual_daa_score = safe_get(blockdag, 'virtualDaaScore', default=None)
+                                if virtual_daa_score is not None:
+                                    ages = age_distribution(utxos['block_daa_score'], int(virtual_daa_score))
+                                    st.plotly_chart(utxo_bar_chart(ages, 'Age'), use_container_width=True)
+                                else:
+                                    st.warning("Could not load virtual DAA score")
+
+                            st.markdown(f"**Largest UTXOs** (top {UTXO_TABLE_LIMIT:,})")
+                            utxos_df = utxo_table(utxos, limit=UTXO_TABLE_LIMIT)
                             st.dataframe(utxos_df.style.format({'amount': '{:,.8f}'}))
                         else:
                             st.info("No UTXOs found for this address")
@@ -212,6 +278,31 @@ with tab3:
                 else:
                     st.error("Could not fetch block data")
 
+    if st.button("Drill Down All Transactions"):
+        if block_id:
+            with st.spinner("Resolving all transactions in block..."):
+                try:
+                    render_drill_down(drill_down_block(block_id))
+                except requests.exceptions.RequestException as e:
+                    st.error(f"API request failed: {str(e)}")
+
+    st.subheader("Blue Score Range Drill-Down")
+    col_r1, col_r2 = st.columns(2)
+    with col_r1:
+        start_blue_score = st.number_input("Start Blue Score", min_value=0, value=0, step=1)
+    with col_r2:
+        end_blue_score = st.number_input("End Blue Score", min_value=0, value=0, step=1)
+    st.caption(f"Up to {MAX_BLUE_SCORE_RANGE} blue scores per drill-down")
+
+    if st.button("Drill Down Range"):
+        with st.spinner("Resolving all transactions in range..."):
+            try:
+                render_drill_down(drill_down_blue_score_range(int(start_blue_score), int(end_blue_score)))
+            except ValueError as e:
+                st.error(str(e))
+            except requests.exceptions.RequestException as e:
+                st.error(f"API request failed: {str(e)}")
+
 with tab4:
     st.header("Transaction Information")
     
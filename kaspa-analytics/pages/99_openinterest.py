@@ -2,7 +2,6 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
-from sklearn.metrics import r2_score
 
 # Sample data
 data = {
@@ -36,7 +35,8 @@ def calculate_powerlaw(x_data, y_data):
     
     # Compute R^2 score
     y_pred = a * np.power(x_data, b)
-    r2 = r2_score(log_y, np.log10(y_pred))
+    residuals = log_y - np.log10(y_pred)
+    r2 = 1 - np.sum(residuals**2) / np.sum((log_y - np.mean(log_y))**2)
     
     return a, b, r2, x_data, y_data
 
@@ -1,171 +1,29 @@
 import streamlit as st
 import requests
 import pandas as pd
-from datetime import datetime
 import plotly.graph_objects as go
 import numpy as np
-from utils import load_price_data
+from data_registry import get_price_data
+from theme import use_stylesheet
+from kaspa_api import api_get
+from history_store import save_transactions
+from wallet_history import (
+    safe_get, extract_net_changes, compute_balance_from_current,
+    calculate_average_purchase_price_over_time, daily_balance_history
+)
 
-# Configuration
-API_BASE_URL = "https://api.kaspa.org"
 st.set_page_config(page_title="Kaspa Address History", page_icon="⛓️", layout="wide")
 
 # Custom CSS - matching the second page's style
-st.markdown("""
-<style>
-    .stApp { background-color: #0E1117; }
-    .st-emotion-cache-6qob1r, .sidebar-content { background-color: #262730 !important; }
-    .title-spacing { padding-left: 40px; margin-bottom: 15px; }
-    div[data-testid="stVerticalBlock"] > div[data-testid="stVerticalBlockBorderWrapper"] {
-        background-color: #262730 !important;
-        border-radius: 10px !important;
-        border: 1px solid #3A3C4A !important;
-        padding: 15px !important;
-    }
-    div[data-testid="stMetric"] {
-        background-color: #262730 !important;
-        border: 1px solid #3A3C4A !important;
-        border-radius: 8px !important;
-        padding: 15px 20px !important;
-    }
-    div[data-testid="stMetricValue"] > div {
-        font-size: 24px !important;
-        font-weight: 600 !important;
-        color: #00FFCC !important;
-    }
-    div[data-testid="stMetricLabel"] > div {
-        font-size: 14px !important;
-        opacity: 0.8 !important;
-        color: #e0e0e0 !important;
-    }
-    .stMetric { margin: 5px !important; height: 100% !important; }
-    h2 { color: #e0e0e0 !important; }
-    .hovertext text.hovertext { fill: #e0e0e0 !important; }
-    .range-slider .handle:after { background-color: #00FFCC !important; }
-    .metrics-container {
-        width: calc(100% - 40px) !important;
-        margin-left: 20px !important;
-        margin-right: 20px !important;
-        margin-top: 10px !important;
-        margin-bottom: 0px !important;
-    }
-    .control-label {
-        font-size: 11px !important;
-        color: #e0e0e0 !important;
-        margin-bottom: 2px !important;
-        white-space: nowrap;
-    }
-    .st-emotion-cache-1dp5vir {
-        border-top: 2px solid #3A3C4A !important;
-        margin-top: 1px !important;
-        margin-bottom: 2px !important;
-    }
-    [data-baseweb="select"] {
-        font-size: 12px !important;
-    }
-    [data-baseweb="select"] > div {
-        padding: 2px 6px !important;
-        border-radius: 4px !important;
-        border: 1px solid #3A3C4A !important;
-        background-color: #262730 !important;
-        transition: all 0.2s ease;
-    }
-    [data-baseweb="select"] > div:hover {
-        border-color: #00FFCC !important;
-    }
-    [data-baseweb="select"] > div[aria-expanded="true"],
-    [data-baseweb="select"] > div:focus-within {
-        border-color: #00FFCC !important;
-        box-shadow: 0 0 0 1px #00FFCC !important;
-    }
-    [role="option"] {
-        font-size: 12px !important;
-        padding: 8px 12px !important;
-    }
-    [role="option"]:hover {
-        background-color: #3A3C4A !important;
-    }
-    [aria-selected="true"] {
-        background-color: #00FFCC20 !important;
-        color: #00FFCC !important;
-    }
-    div[role="combobox"] > div {
-        font-size: 12px !important;
-        color: #e0e0e0 !important;
-    }
-    .stSelectbox [data-baseweb="select"] > div:has(> div[aria-selected="true"]) {
-        border-color: #00FFCC !important;
-        background-color: #00FFCC10 !important;
-    }
-    .stSelectbox [data-baseweb="select"] > div:has(> div[aria-selected="true"]) > div {
-        color: #00FFCC !important;
-    }
-    .stDataFrame {
-        background-color: #262730 !important;
-        border: 1px solid #3A3C4A !important;
-        border-radius: 8px !important;
-    }
-    .stDataFrame th {
-        background-color: #3A3C4A !important;
-        color: #e0e0e0 !important;
-    }
-    .stDataFrame td {
-        background-color: #262730 !important;
-        color: #e0e0e0 !important;
-    }
-    .stButton button {
-        background-color: #262730 !important;
-        color: #e0e0e0 !important;
-        border: 1px solid #3A3C4A !important;
-        border-radius: 4px !important;
-        transition: all 0.2s ease;
-    }
-    .stButton button:hover {
-        border-color: #00FFCC !important;
-        color: #00FFCC !important;
-    }
-    .stTextInput input {
-        background-color: #262730 !important;
-        color: #e0e0e0 !important;
-        border: 1px solid #3A3C4A !important;
-        border-radius: 4px !important;
-    }
-    .stNumberInput input {
-        background-color: #262730 !important;
-        color: #e0e0e0 !important;
-        border: 1px solid #3A3C4A !important;
-        border-radius: 4px !important;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-def safe_get(data, *keys, default=None):
-    for key in keys:
-        try:
-            data = data[key]
-        except (KeyError, TypeError, IndexError):
-            return default
-    return data
+use_stylesheet('wallet_tracker')
 
 def make_api_request(endpoint, params=None):
     try:
-        response = requests.get(f"{API_BASE_URL}{endpoint}", params=params)
-        response.raise_for_status()
-        return response.json()
+        return api_get(endpoint, params=params)
     except requests.exceptions.RequestException as e:
         st.error(f"API request failed: {str(e)}")
         return None
 
-def format_timestamp(timestamp_ms):
-    try:
-        if isinstance(timestamp_ms, (int, float, str)):
-            if isinstance(timestamp_ms, str) and timestamp_ms.isdigit():
-                timestamp_ms = int(timestamp_ms)
-            return datetime.fromtimestamp(int(timestamp_ms)/1000).strftime('%Y-%m-%d %H:%M:%S')
-        return "N/A"
-    except:
-        return "N/A"
-
 def fetch_transactions_page(address, limit=500, before=None):
     endpoint = f"/addresses/{address}/full-transactions-page"
     params = {
@@ -177,48 +35,6 @@ def fetch_transactions_page(address, limit=500, before=None):
         params["before"] = before
     return make_api_request(endpoint, params=params)
 
-def extract_net_changes(transactions, address):
-    history = []
-    for tx in transactions:
-        inputs = safe_get(tx, 'inputs', default=[])
-        outputs = safe_get(tx, 'outputs', default=[])
-        timestamp = safe_get(tx, 'block_time', default=None)
-        tx_id = safe_get(tx, 'transaction_id', default='')
-
-        if not timestamp:
-            continue
-
-        net_change = 0
-        for out in outputs:
-            out_address = safe_get(out, 'script_public_key_address', default='')
-            if out_address == address:
-                amount = float(safe_get(out, 'amount', default=0)) / 1e8
-                net_change += amount
-
-        for inp in inputs:
-            in_address = safe_get(inp, 'previous_outpoint_address', default='')
-            if in_address == address:
-                amount = float(safe_get(inp, 'previous_outpoint_amount', default=0)) / 1e8
-                net_change -= amount
-
-        history.append({
-            'timestamp': timestamp,
-            'datetime': format_timestamp(timestamp),
-            'net_change': net_change,
-            'transaction_id': tx_id,
-            'direction': 'in' if net_change > 0 else 'out'
-        })
-
-    return history
-
-def compute_balance_from_current(current_balance, history):
-    history = sorted(history, key=lambda x: x['timestamp'], reverse=True)
-    balance = current_balance
-    for tx in history:
-        tx['balance'] = balance
-        balance -= tx['net_change']
-    return history[::-1]
-
 def fetch_all_transactions(address):
     all_transactions = []
     seen_ids = set()
@@ -256,14 +72,8 @@ def fetch_all_transactions(address):
 def fetch_kaspa_price_history():
     """Fetch historical KAS price data from Google Sheets"""
     try:
-        # Use the existing price data loading mechanism
-        if 'price_df' not in st.session_state or 'price_genesis_date' not in st.session_state:
-            price_df, genesis_date = load_price_data()
-            st.session_state.price_df = price_df
-            st.session_state.price_genesis_date = genesis_date
-        else:
-            price_df = st.session_state.price_df
-            genesis_date = st.session_state.price_genesis_date
+        # Use the shared price data registry
+        price_df, genesis_date = get_price_data()
         
         # Convert to the format expected by the rest of the code
         price_history = []
@@ -281,51 +91,6 @@ def fetch_kaspa_price_history():
         st.error(f"Failed to fetch price history: {str(e)}")
         return None
 
-def calculate_average_purchase_price_over_time(transactions, price_history):
-    """Calculate average purchase price over time with each transaction"""
-    if not price_history or not transactions:
-        return None
-        
-    # Create a DataFrame with price history for easy lookup
-    price_df = pd.DataFrame(price_history)
-    price_df['date'] = pd.to_datetime(price_df['timestamp'], unit='ms')
-    
-    # Process transactions in chronological order
-    transactions_sorted = sorted(transactions, key=lambda x: x['timestamp'])
-    
-    total_kas = 0
-    total_cost = 0
-    avg_price_history = []
-    
-    for tx in transactions_sorted:
-        if tx['direction'] == 'in' and tx['net_change'] > 0:
-            tx_date = datetime.fromtimestamp(tx['timestamp']/1000)
-            
-            # Find the closest price date before the transaction
-            price_row = price_df[price_df['date'] <= tx_date].sort_values('date', ascending=False).head(1)
-            
-            if not price_row.empty:
-                price = price_row.iloc[0]['price']
-                kas_amount = tx['net_change']
-                total_kas += kas_amount
-                total_cost += kas_amount * price
-                
-                if total_kas > 0:
-                    current_avg = total_cost / total_kas
-                else:
-                    current_avg = 0
-                
-                avg_price_history.append({
-                    'timestamp': tx['timestamp'],
-                    'datetime': tx['datetime'],
-                    'avg_purchase_price': current_avg,
-                    'transaction_id': tx['transaction_id'],
-                    'kas_amount': kas_amount,
-                    'price_at_purchase': price
-                })
-    
-    return avg_price_history
-
 # UI Starts
 st.markdown('<div class="title-spacing"><h2>Kaspa Address History Explorer</h2></div>', unsafe_allow_html=True)
 st.divider()
@@ -401,26 +166,7 @@ def display_results(address, transactions):
         else:
             first_price_date = df['timestamp'].min().date()
             
-        min_date = first_price_date
-        max_date = df['timestamp'].max().date()
-        date_range = pd.date_range(start=min_date, end=max_date, freq='D')
-        
-        daily_balance = []
-        current_balance_val = 0
-        tx_idx = 0
-        
-        for date in date_range:
-            # Apply all transactions up to this date
-            while tx_idx < len(df) and df.iloc[tx_idx]['timestamp'].date() <= date.date():
-                current_balance_val = df.iloc[tx_idx]['balance']
-                tx_idx += 1
-            
-            daily_balance.append({
-                'date': date,
-                'balance': current_balance_val
-            })
-        
-        balance_df = pd.DataFrame(daily_balance)
+        balance_df = daily_balance_history(df, first_price_date)
         
         # Merge with price data if available
         if st.session_state.price_history:
@@ -639,6 +385,10 @@ if st.button("Fetch Full History"):
     with st.spinner("Fetching all transactions (this may take a while)..."):
         all_txs = fetch_all_transactions(address)
         if all_txs:
+            try:
+                save_transactions(address, all_txs)
+            except OSError as e:
+                st.warning(f"Could not store history for counterparty analysis: {str(e)}")
             st.session_state.history = all_txs
             st.session_state.avg_price_history = None  # Reset to force recalculation
             display_results(address, all_txs)
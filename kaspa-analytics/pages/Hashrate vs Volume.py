@@ -2,128 +2,31 @@ import streamlit as st
 import plotly.graph_objects as go
 import numpy as np
 import pandas as pd
-from utils import fit_power_law, load_data, load_volume_data
+from utils import fit_power_law, power_law_curve, fit_curve_x
+from data_registry import get_hashrate_data, get_volume_data
+from chart_render import plotly_chart
+from theme import use_stylesheet
+from timing import start_rerun, timing_panel
 from datetime import datetime, timedelta
 
 st.set_page_config(layout="wide")
+start_rerun('hashrate_volume')
 
 # Custom CSS - matching the style of your other pages
-st.markdown("""
-<style>
-    .stApp { background-color: #0E1117; }
-    .st-emotion-cache-6qob1r, .sidebar-content { background-color: #262730 !important; }
-    .title-spacing { padding-left: 40px; margin-bottom: 15px; }
-    div[data-testid="stVerticalBlock"] > div[data-testid="stVerticalBlockBorderWrapper"] {
-        background-color: #262730 !important;
-        border-radius: 10px !important;
-        border: 1px solid #3A3C4A !important;
-        padding: 15px !important;
-    }
-    div[data-testid="stMetric"] {
-        background-color: #262730 !important;
-        border: 1px solid #3A3C4A !important;
-        border-radius: 8px !important;
-        padding: 15px 20px !important;
-    }
-    div[data-testid="stMetricValue"] > div {
-        font-size: 24px !important;
-        font-weight: 600 !important;
-        color: #00FFCC !important;
-    }
-    div[data-testid="stMetricLabel"] > div {
-        font-size: 14px !important;
-        opacity: 0.8 !important;
-        color: #e0e0e0 !important;
-    }
-    .stMetric { margin: 5px !important; height: 100% !important; }
-    h2 { color: #e0e0e0 !important; }
-    .hovertext text.hovertext { fill: #e0e0e0 !important; }
-    .range-slider .handle:after { background-color: #00FFCC !important; }
-    .metrics-container {
-        width: calc(100% - 40px) !important;
-        margin-left: 20px !important;
-        margin-right: 20px !important;
-        margin-top: 10px !important;
-        margin-bottom: 0px !important;
-    }
-    .control-label {
-        font-size: 11px !important;
-        color: #e0e0e0 !important;
-        margin-bottom: 2px !important;
-        white-space: nowrap;
-    }
-    .st-emotion-cache-1dp5vir {
-        border-top: 2px solid #3A3C4A !important;
-        margin-top: 1px !important;
-        margin-bottom: 2px !important;
-    }
-    [data-baseweb="select"] {
-        font-size: 12px !important;
-    }
-    [data-baseweb="select"] > div {
-        padding: 2px 6px !important;
-        border-radius: 4px !important;
-        border: 1px solid #3A3C4A !important;
-        background-color: #262730 !important;
-        transition: all 0.2s ease;
-    }
-    [data-baseweb="select"] > div:hover {
-        border-color: #00FFCC !important;
-    }
-    [data-baseweb="select"] > div[aria-expanded="true"],
-    [data-baseweb="select"] > div:focus-within {
-        border-color: #00FFCC !important;
-        box-shadow: 0 0 0 1px #00FFCC !important;
-    }
-    [role="option"] {
-        font-size: 12px !important;
-        padding: 8px 12px !important;
-    }
-    [role="option"]:hover {
-        background-color: #3A3C4A !important;
-    }
-    [aria-selected="true"] {
-        background-color: #00FFCC20 !important;
-        color: #00FFCC !important;
-    }
-    div[role="combobox"] > div {
-        font-size: 12px !important;
-        color: #e0e0e0 !important;
-    }
-    .stSelectbox [data-baseweb="select"] > div:has(> div[aria-selected="true"]) {
-        border-color: #00FFCC !important;
-        background-color: #00FFCC10 !important;
-    }
-    .stSelectbox [data-baseweb="select"] > div:has(> div[aria-selected="true"]) > div {
-        color: #00FFCC !important;
-    }
-    .delta-positive {
-        color: #00FFCC !important;
-    }
-    .delta-negative {
-        color: #FF5252 !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+use_stylesheet('volume')
 
 # Data loading
-if 'df' not in st.session_state or 'genesis_date' not in st.session_state:
-    try:
-        st.session_state.df, st.session_state.genesis_date = load_data()
-    except Exception as e:
-        st.error(f"Failed to load hashrate data: {str(e)}")
-        st.stop()
-
-if 'volume_df' not in st.session_state:
-    try:
-        st.session_state.volume_df = load_volume_data()
-    except Exception as e:
-        st.error(f"Failed to load volume data: {str(e)}")
-        st.stop()
+try:
+    df, genesis_date = get_hashrate_data()
+except Exception as e:
+    st.error(f"Failed to load hashrate data: {str(e)}")
+    st.stop()
 
-df = st.session_state.df
-genesis_date = st.session_state.genesis_date
-volume_df = st.session_state.volume_df
+try:
+    volume_df = get_volume_data()
+except Exception as e:
+    st.error(f"Failed to load volume data: {str(e)}")
+    st.stop()
 
 # Merge data
 df['Date'] = pd.to_datetime(df['Date']).dt.normalize()
@@ -233,8 +136,8 @@ with st.container():
 
     if show_power_law == "Show":
         # Generate fitted values
-        x_fit = np.linspace(merged_df['Hashrate_PH'].min(), merged_df['Hashrate_PH'].max(), 100)
-        y_fit = a * np.power(x_fit, b)
+        x_fit, y_fit = power_law_curve(a, b, merged_df['Hashrate_PH'].min(), merged_df['Hashrate_PH'].max(),
+                                       log_x=x_scale_type == "Log")
         
         fig.add_trace(go.Scatter(
             x=x_fit,
@@ -315,7 +218,7 @@ with st.container():
         )
     )
 
-    st.plotly_chart(fig, use_container_width=True)
+    plotly_chart(fig, use_container_width=True)
 
     # ====== RATIO CHART ======
     st.markdown('<div class="title-spacing"><h4>Volume/Hashrate Ratio</h4></div>', unsafe_allow_html=True)
@@ -378,11 +281,8 @@ with st.container():
     if show_power_law == "Show":
         # Generate fitted values for ratio chart
         if time_scale == "Log":
-            x_fit_ratio = np.logspace(
-                np.log10(merged_df['Days_Since_Genesis'].min()), 
-                np.log10(merged_df['Days_Since_Genesis'].max()), 
-                100
-            )
+            x_fit_ratio = fit_curve_x(merged_df['Days_Since_Genesis'].min(),
+                                      merged_df['Days_Since_Genesis'].max(), log_x=True)
             y_fit_ratio = a_ratio_time * np.power(x_fit_ratio, b_ratio_time)
             
             ratio_fig.add_trace(go.Scatter(
@@ -395,7 +295,7 @@ with st.container():
         else:
             # For linear time scale, use date numeric values but display as dates
             date_numeric = (merged_df['Date'] - merged_df['Date'].min()).dt.days + 1
-            x_fit_ratio = np.linspace(1, date_numeric.max(), 100)
+            x_fit_ratio = fit_curve_x(1, date_numeric.max())
             y_fit_ratio = a_ratio_time * np.power(x_fit_ratio, b_ratio_time)
             
             # Convert numeric days back to dates
@@ -449,7 +349,7 @@ with st.container():
         )
     )
     
-    st.plotly_chart(ratio_fig, use_container_width=True)
+    plotly_chart(ratio_fig, use_container_width=True)
 
 # Stats
 st.markdown('<div class="metrics-container">', unsafe_allow_html=True)
@@ -465,3 +365,5 @@ with cols[3]:
 with cols[4]:
     st.metric("Current Ratio", f"${merged_df['Volume_Hashrate_Ratio'].iloc[-1]:.2f}/PH/s")
 st.markdown('</div>', unsafe_allow_html=True)
+
+timing_panel()
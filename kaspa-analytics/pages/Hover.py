@@ -6,7 +6,7 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'components'))
 
 from shared_components import render_hover_tabs_sidebar, render_basic_css, render_simple_page_header
-from utils import load_data
+from data_registry import get_hashrate_data
 import plotly.graph_objects as go
 import pandas as pd
 
@@ -50,7 +50,7 @@ render_simple_page_header("💎 Price Analysis", "Advanced Kaspa price analytics
 
 # Your existing price analysis content goes here
 try:
-    df, genesis_date = load_data()
+    df, genesis_date = get_hashrate_data()
     
     # Example content - replace with your actual price analysis
     col1, col2, col3 = st.columns(3)
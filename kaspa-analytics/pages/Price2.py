@@ -1,114 +1,30 @@
 import streamlit as st
 import plotly.graph_objects as go
-import numpy as np
 import pandas as pd
-from utils import fit_power_law, load_price_data
+from utils import power_law_curve, days_to_dates
+from data_registry import get_price_data, get_power_law_fit
+from downsample import downsample_frame
+from chart_render import apply_render_mode
+from theme import use_stylesheet
 from datetime import datetime, timedelta
 
 st.set_page_config(layout="wide")
 
 # Data loading and processing
-if 'price_df' not in st.session_state or 'price_genesis_date' not in st.session_state:
-    try:
-        st.session_state.price_df, st.session_state.price_genesis_date = load_price_data()
-    except Exception as e:
-        st.error(f"Failed to load price data: {str(e)}")
-        st.stop()
-
-price_df = st.session_state.price_df
-genesis_date = st.session_state.price_genesis_date
+try:
+    price_df, genesis_date = get_price_data()
+except Exception as e:
+    st.error(f"Failed to load price data: {str(e)}")
+    st.stop()
 
 try:
-    a_price, b_price, r2_price = fit_power_law(price_df, y_col='Price')
+    a_price, b_price, r2_price = get_power_law_fit('price', 'Price')
 except Exception as e:
     st.error(f"Failed to calculate price power law: {str(e)}")
     st.stop()
 
 # Custom CSS with top padding adjustment
-st.markdown("""
-<style>
-    /* Reset all margins and padding */
-    html, body, .stApp, .main, .block-container, .stPlotlyChart {
-        margin: 0 !important;
-        padding: 0 !important;
-    }
-    
-    .stApp { 
-        background-color: #1A1D26;
-        overflow: hidden;
-        padding-top: 100px !important;
-    }
-    
-    /* Main container adjustments */
-    .main .block-container {
-        padding-left: 0px !important;
-        padding-right: 0px !important;
-        max-width: 100% !important;
-    }
-    
-    /* Chart container */
-    .stPlotlyChart {
-        width: 100% !important;
-        padding-left: 0 !important;
-        padding-right: 0 !important;
-        margin-left: 0 !important;
-        margin-right: 0 !important;
-    }
-    
-    /* Remove all borders and spacing */
-    .element-container, 
-    .st-emotion-cache-1v0mbdj, 
-    .st-emotion-cache-1wrcr25,
-    .st-emotion-cache-1kyxreq {
-        padding: 0 !important;
-        margin: 0 !important;
-        border: none !important;
-    }
-    
-    /* Force full width for all elements */
-    div[data-testid="stVerticalBlock"] > div[data-testid="stVerticalBlockBorderWrapper"] {
-        padding: 0 !important;
-        margin: 0 !important;
-        border: none !important;
-    }
-    
-    /* Title spacing */
-    .title-spacing { 
-        padding-top: 50px !important;
-        padding-left: 60px !important; 
-        margin-bottom: 10px !important;
-    }
-    
-    /* Metrics styling */
-    div[data-testid="stMetric"] {
-        background-color: #1A1D26 !important;
-        border: 1px solid #3A3C4A !important;
-        border-radius: 8px !important;
-        padding: 15px 20px !important;
-    }
-    
-    /* Make modebar always visible */
-    .modebar {
-        opacity: 1 !important;
-        visibility: visible !important;
-        background-color: rgba(26, 29, 38, 0.8) !important;
-    }
-    
-    /* Additional aggressive resets */
-    .st-emotion-cache-1kyxreq, 
-    .st-emotion-cache-1wrcr25,
-    .st-emotion-cache-1v0mbdj {
-        padding: 0 !important;
-        margin: 0 !important;
-    }
-    
-    /* Remove any remaining Streamlit container padding */
-    .st-emotion-cache-1n76uvr {
-        padding-left: 0 !important;
-        padding-right: 0 !important;
-    }
-</style>
-""", unsafe_allow_html=True)
+use_stylesheet('price2')
 
 # ====== MAIN CHART CONTAINER ======
 with st.container():
@@ -161,7 +77,7 @@ with st.container():
     else:
         start_date = price_df['Date'].iloc[0]
 
-    filtered_df = price_df[price_df['Date'] >= start_date]
+    filtered_df = downsample_frame(price_df[price_df['Date'] >= start_date], ['Price'])
 
     fig = go.Figure()
 
@@ -189,9 +105,9 @@ with st.container():
     ))
 
     if show_power_law == "Show":
-        x_fit = filtered_df['days_from_genesis']
-        y_fit = a_price * np.power(x_fit, b_price)
-        fit_x = x_fit if x_scale_type == "Log" else filtered_df['Date']
+        x_fit, y_fit = power_law_curve(a_price, b_price, filtered_df['days_from_genesis'].min(),
+                                       filtered_df['days_from_genesis'].max(), log_x=x_scale_type == "Log")
+        fit_x = x_fit if x_scale_type == "Log" else days_to_dates(x_fit)
 
         fig.add_trace(go.Scatter(
             x=fit_x,
@@ -288,6 +204,7 @@ with st.container():
     )
 
     # Display the chart
+    fig = apply_render_mode(fig)
     st.plotly_chart(fig, use_container_width=True, config={
         'displayModeBar': True,
         'displaylogo': False,
@@ -1,8 +1,11 @@
 import streamlit as st
 import plotly.graph_objects as go
-import numpy as np
 import pandas as pd
-from utils import fit_power_law, load_price_data
+from utils import fit_power_law, power_law_curve, days_to_dates
+from data_registry import get_price_data, get_power_law_fit
+from downsample import downsample_frame
+from chart_render import apply_render_mode
+from theme import use_stylesheet
 from datetime import datetime, timedelta
 
 st.set_page_config(
@@ -13,369 +16,20 @@ st.set_page_config(
 )
 
 # Data loading and processing
-if 'price_df' not in st.session_state or 'price_genesis_date' not in st.session_state:
-    try:
-        st.session_state.price_df, st.session_state.price_genesis_date = load_price_data()
-    except Exception as e:
-        st.error(f"Failed to load price data: {str(e)}")
-        st.stop()
-
-price_df = st.session_state.price_df
-genesis_date = st.session_state.price_genesis_date
+try:
+    price_df, genesis_date = get_price_data()
+except Exception as e:
+    st.error(f"Failed to load price data: {str(e)}")
+    st.stop()
 
 try:
-    a_price, b_price, r2_price = fit_power_law(price_df, y_col='Price')
+    a_price, b_price, r2_price = get_power_law_fit('price', 'Price')
 except Exception as e:
     st.error(f"Failed to calculate price power law: {str(e)}")
     st.stop()
 
 # Enhanced Custom CSS with Modern Design
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
-    
-    /* Global Reset and Base Styles */
-    * {
-        margin: 0;
-        padding: 0;
-        box-sizing: border-box;
-    }
-    
-    html, body, .stApp {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-        background: linear-gradient(135deg, #0a0e1a 0%, #1a1f2e 50%, #0f1419 100%);
-        color: #e2e8f0;
-        overflow-x: hidden;
-    }
-    
-    .stApp {
-        background-attachment: fixed;
-    }
-    
-    /* Remove Streamlit defaults */
-    .main .block-container {
-        padding: 0 !important;
-        max-width: 100% !important;
-    }
-    
-    /* Animated Background Pattern */
-    .stApp::before {
-        content: '';
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background-image: 
-            radial-gradient(circle at 20% 80%, rgba(120, 119, 198, 0.1) 0%, transparent 50%),
-            radial-gradient(circle at 80% 20%, rgba(255, 119, 198, 0.1) 0%, transparent 50%),
-            radial-gradient(circle at 40% 40%, rgba(120, 219, 255, 0.1) 0%, transparent 50%);
-        pointer-events: none;
-        z-index: -1;
-    }
-    
-    /* Header Section */
-    .header-container {
-        background: rgba(15, 20, 25, 0.8);
-        backdrop-filter: blur(20px);
-        border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        padding: 20px 40px;
-        position: sticky;
-        top: 0;
-        z-index: 100;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
-    }
-    
-    .header-content {
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        max-width: 1400px;
-        margin: 0 auto;
-    }
-    
-    .brand {
-        display: flex;
-        align-items: center;
-        gap: 12px;
-    }
-    
-    .brand h1 {
-        font-size: 28px;
-        font-weight: 800;
-        background: linear-gradient(135deg, #00d4ff 0%, #ff00a8 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin: 0;
-    }
-    
-    .brand-subtitle {
-        font-size: 12px;
-        color: #64748b;
-        font-weight: 500;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-    }
-    
-    .header-stats {
-        display: flex;
-        gap: 30px;
-        align-items: center;
-    }
-    
-    .header-stat {
-        text-align: center;
-    }
-    
-    .header-stat-value {
-        font-size: 18px;
-        font-weight: 700;
-        color: #00d4ff;
-        display: block;
-    }
-    
-    .header-stat-label {
-        font-size: 11px;
-        color: #64748b;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        margin-top: 2px;
-    }
-    
-    /* Control Panel */
-    .control-panel {
-        background: rgba(15, 20, 25, 0.6);
-        backdrop-filter: blur(15px);
-        border: 1px solid rgba(255, 255, 255, 0.1);
-        border-radius: 16px;
-        padding: 24px 32px;
-        margin: 24px 40px;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.2);
-    }
-    
-    .control-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
-        gap: 24px;
-        align-items: end;
-    }
-    
-    .control-group {
-        display: flex;
-        flex-direction: column;
-        gap: 8px;
-    }
-    
-    .control-label {
-        font-size: 12px;
-        font-weight: 600;
-        color: #94a3b8;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        margin-bottom: 4px;
-    }
-    
-    /* Enhanced Selectbox Styling */
-    .stSelectbox > div > div {
-        background: rgba(30, 41, 59, 0.8) !important;
-        border: 1px solid rgba(100, 116, 139, 0.3) !important;
-        border-radius: 12px !important;
-        backdrop-filter: blur(10px) !important;
-        transition: all 0.3s ease !important;
-    }
-    
-    .stSelectbox > div > div:hover {
-        border-color: #00d4ff !important;
-        box-shadow: 0 0 0 3px rgba(0, 212, 255, 0.1) !important;
-    }
-    
-    .stSelectbox > div > div > div {
-        color: #e2e8f0 !important;
-        font-weight: 500 !important;
-    }
-    
-    /* Chart Container */
-    .chart-section {
-        margin: 0 40px 40px 40px;
-        background: rgba(15, 20, 25, 0.4);
-        backdrop-filter: blur(20px);
-        border: 1px solid rgba(255, 255, 255, 0.1);
-        border-radius: 20px;
-        padding: 32px;
-        box-shadow: 0 12px 48px rgba(0, 0, 0, 0.3);
-    }
-    
-    .chart-header {
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        margin-bottom: 24px;
-        padding-bottom: 16px;
-        border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-    }
-    
-    .chart-title {
-        font-size: 24px;
-        font-weight: 700;
-        color: #f1f5f9;
-        margin: 0;
-    }
-    
-    .chart-subtitle {
-        font-size: 14px;
-        color: #64748b;
-        margin-top: 4px;
-    }
-    
-    /* Enhanced Metrics Grid */
-    .metrics-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-        gap: 24px;
-        margin: 32px 40px;
-    }
-    
-    .metric-card {
-        background: rgba(15, 20, 25, 0.6);
-        backdrop-filter: blur(20px);
-        border: 1px solid rgba(255, 255, 255, 0.1);
-        border-radius: 16px;
-        padding: 24px;
-        position: relative;
-        overflow: hidden;
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        cursor: pointer;
-    }
-    
-    .metric-card::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 2px;
-        background: linear-gradient(90deg, #00d4ff, #ff00a8, #00ff88);
-        opacity: 0;
-        transition: opacity 0.3s ease;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-4px);
-        border-color: rgba(0, 212, 255, 0.3);
-        box-shadow: 0 20px 60px rgba(0, 0, 0, 0.4), 0 0 0 1px rgba(0, 212, 255, 0.1);
-    }
-    
-    .metric-card:hover::before {
-        opacity: 1;
-    }
-    
-    /* Streamlit Metric Overrides */
-    div[data-testid="stMetric"] {
-        background: transparent !important;
-        border: none !important;
-        padding: 0 !important;
-        box-shadow: none !important;
-    }
-    
-    div[data-testid="stMetric"] label {
-        color: #94a3b8 !important;
-        font-size: 12px !important;
-        font-weight: 600 !important;
-        text-transform: uppercase !important;
-        letter-spacing: 1px !important;
-        margin-bottom: 8px !important;
-    }
-    
-    div[data-testid="stMetric"] div[data-testid="metric-container"] > div:first-child {
-        color: #f1f5f9 !important;
-        font-size: 32px !important;
-        font-weight: 800 !important;
-        line-height: 1.2 !important;
-        margin-bottom: 4px !important;
-    }
-    
-    div[data-testid="stMetric"] div[data-testid="metric-container"] div[data-testid="metric-delta"] {
-        color: #00ff88 !important;
-        font-size: 14px !important;
-        font-weight: 600 !important;
-    }
-    
-    /* Plotly Chart Styling */
-    .stPlotlyChart {
-        border-radius: 12px;
-        overflow: hidden;
-    }
-    
-    /* Custom scrollbar */
-    ::-webkit-scrollbar {
-        width: 8px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: rgba(30, 41, 59, 0.3);
-        border-radius: 4px;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: rgba(100, 116, 139, 0.5);
-        border-radius: 4px;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: rgba(100, 116, 139, 0.7);
-    }
-    
-    /* Responsive Design */
-    @media (max-width: 768px) {
-        .header-container {
-            padding: 16px 20px;
-        }
-        
-        .control-panel, .chart-section {
-            margin: 16px 20px;
-            padding: 20px;
-        }
-        
-        .metrics-grid {
-            margin: 24px 20px;
-            grid-template-columns: 1fr;
-        }
-        
-        .brand h1 {
-            font-size: 24px;
-        }
-        
-        .header-stats {
-            display: none;
-        }
-    }
-    
-    /* Loading Animation */
-    @keyframes pulse {
-        0%, 100% { opacity: 1; }
-        50% { opacity: 0.5; }
-    }
-    
-    .loading {
-        animation: pulse 2s infinite;
-    }
-    
-    /* Success/Error States */
-    .success-indicator {
-        color: #00ff88;
-    }
-    
-    .error-indicator {
-        color: #ff4757;
-    }
-    
-    /* Hide Streamlit Elements */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    .stDeployButton {display: none;}
-</style>
-""", unsafe_allow_html=True)
+use_stylesheet('price4')
 
 # Calculate current metrics for header
 current_price = price_df['Price'].iloc[-1]
@@ -482,7 +136,7 @@ elif time_range == "1Y":
 else:
     start_date = price_df['Date'].iloc[0]
 
-filtered_df = price_df[price_df['Date'] >= start_date]
+filtered_df = downsample_frame(price_df[price_df['Date'] >= start_date], ['Price'])
 
 # Create the chart
 fig = go.Figure()
@@ -510,7 +164,7 @@ fig.add_trace(go.Scatter(
                   'Date: %{text}<br>' +
                   'Price: $%{y:.6f}<br>' +
                   '<extra></extra>',
-    text=[d.strftime('%Y-%m-%d') for d in filtered_df['Date']],
+    text=filtered_df['Date'].dt.strftime('%Y-%m-%d'),
     showlegend=True,
     fill='tonexty' if len(fig.data) > 0 else None,
     fillcolor='rgba(0, 212, 255, 0.1)'
@@ -518,9 +172,9 @@ fig.add_trace(go.Scatter(
 
 # Add power law if enabled
 if show_power_law == "Show":
-    x_fit = filtered_df['days_from_genesis']
-    y_fit = a_price * np.power(x_fit, b_price)
-    fit_x = x_fit if x_scale_type == "Log" else filtered_df['Date']
+    x_fit, y_fit = power_law_curve(a_price, b_price, filtered_df['days_from_genesis'].min(),
+                                   filtered_df['days_from_genesis'].max(), log_x=x_scale_type == "Log")
+    fit_x = x_fit if x_scale_type == "Log" else days_to_dates(x_fit)
 
     # Main power law line
     fig.add_trace(go.Scatter(
@@ -620,6 +274,7 @@ fig.update_layout(
 
 # Display chart with container
 with st.container():
+    fig = apply_render_mode(fig)
     st.plotly_chart(fig, use_container_width=True, config={
         'displayModeBar': True,
         'displaylogo': False,
@@ -1,8 +1,11 @@
 import streamlit as st
 import plotly.graph_objects as go
-import numpy as np
 import pandas as pd
-from utils import fit_power_law, load_price_data
+from utils import fit_power_law, power_law_curve, days_to_dates
+from data_registry import get_price_data, get_power_law_fit
+from downsample import downsample_frame
+from chart_render import apply_render_mode
+from theme import use_stylesheet
 from datetime import datetime, timedelta
 
 st.set_page_config(
@@ -13,572 +16,20 @@ st.set_page_config(
 )
 
 # Data loading and processing
-if 'price_df' not in st.session_state or 'price_genesis_date' not in st.session_state:
-    try:
-        st.session_state.price_df, st.session_state.price_genesis_date = load_price_data()
-    except Exception as e:
-        st.error(f"Failed to load price data: {str(e)}")
-        st.stop()
-
-price_df = st.session_state.price_df
-genesis_date = st.session_state.price_genesis_date
+try:
+    price_df, genesis_date = get_price_data()
+except Exception as e:
+    st.error(f"Failed to load price data: {str(e)}")
+    st.stop()
 
 try:
-    a_price, b_price, r2_price = fit_power_law(price_df, y_col='Price')
+    a_price, b_price, r2_price = get_power_law_fit('price', 'Price')
 except Exception as e:
     st.error(f"Failed to calculate price power law: {str(e)}")
     st.stop()
 
 # Enhanced Custom CSS with Modern Design
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
-    
-    /* Global Reset and Base Styles */
-    * {
-        margin: 0;
-        padding: 0;
-        box-sizing: border-box;
-    }
-    
-    html, body, .stApp {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-        background: linear-gradient(135deg, #0a0e1a 0%, #1a1f2e 50%, #0f1419 100%);
-        color: #e2e8f0;
-        overflow-x: hidden;
-    }
-    
-    .stApp {
-        background-attachment: fixed;
-    }
-    
-    /* Remove Streamlit defaults */
-    .main .block-container {
-        padding: 0 !important;
-        max-width: 100% !important;
-    }
-    
-    /* Animated Background Pattern */
-    .stApp::before {
-        content: '';
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background-image: 
-            radial-gradient(circle at 20% 80%, rgba(120, 119, 198, 0.15) 0%, transparent 50%),
-            radial-gradient(circle at 80% 20%, rgba(255, 119, 198, 0.15) 0%, transparent 50%),
-            radial-gradient(circle at 40% 40%, rgba(120, 219, 255, 0.15) 0%, transparent 50%);
-        pointer-events: none;
-        z-index: -1;
-        animation: backgroundShift 20s ease-in-out infinite;
-    }
-    
-    @keyframes backgroundShift {
-        0%, 100% { opacity: 1; transform: translateX(0px) translateY(0px); }
-        50% { opacity: 0.8; transform: translateX(20px) translateY(-20px); }
-    }
-    
-    /* Header Section */
-    .header-container {
-        background: rgba(15, 20, 25, 0.9);
-        backdrop-filter: blur(25px);
-        border-bottom: 1px solid rgba(0, 212, 255, 0.2);
-        padding: 24px 40px;
-        position: sticky;
-        top: 0;
-        z-index: 100;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.4);
-    }
-    
-    .header-content {
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        max-width: 1400px;
-        margin: 0 auto;
-    }
-    
-    .brand {
-        display: flex;
-        align-items: center;
-        gap: 16px;
-    }
-    
-    .brand-icon {
-        width: 48px;
-        height: 48px;
-        background: linear-gradient(135deg, #00d4ff 0%, #ff00a8 100%);
-        border-radius: 12px;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-size: 24px;
-        box-shadow: 0 4px 20px rgba(0, 212, 255, 0.3);
-    }
-    
-    .brand h1 {
-        font-size: 32px;
-        font-weight: 800;
-        background: linear-gradient(135deg, #00d4ff 0%, #ff00a8 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin: 0;
-        text-shadow: 0 0 30px rgba(0, 212, 255, 0.3);
-    }
-    
-    .brand-subtitle {
-        font-size: 13px;
-        color: #64748b;
-        font-weight: 500;
-        text-transform: uppercase;
-        letter-spacing: 1.2px;
-        margin-top: 2px;
-    }
-    
-    .header-stats {
-        display: flex;
-        gap: 40px;
-        align-items: center;
-    }
-    
-    .header-stat {
-        text-align: center;
-        position: relative;
-    }
-    
-    .header-stat::after {
-        content: '';
-        position: absolute;
-        bottom: -8px;
-        left: 50%;
-        transform: translateX(-50%);
-        width: 0;
-        height: 2px;
-        background: linear-gradient(90deg, #00d4ff, #ff00a8);
-        transition: width 0.3s ease;
-    }
-    
-    .header-stat:hover::after {
-        width: 100%;
-    }
-    
-    .header-stat-value {
-        font-size: 20px;
-        font-weight: 700;
-        color: #00d4ff;
-        display: block;
-        text-shadow: 0 0 20px rgba(0, 212, 255, 0.4);
-    }
-    
-    .header-stat-label {
-        font-size: 11px;
-        color: #64748b;
-        text-transform: uppercase;
-        letter-spacing: 0.8px;
-        margin-top: 4px;
-    }
-    
-    /* Enhanced Control Panel - Now part of chart */
-    .chart-section {
-        margin: 32px 40px 40px 40px;
-        background: rgba(15, 20, 25, 0.6);
-        backdrop-filter: blur(25px);
-        border: 1px solid rgba(255, 255, 255, 0.15);
-        border-radius: 24px;
-        overflow: hidden;
-        box-shadow: 0 16px 64px rgba(0, 0, 0, 0.4);
-        position: relative;
-    }
-    
-    .chart-section::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        height: 1px;
-        background: linear-gradient(90deg, transparent, #00d4ff, #ff00a8, transparent);
-        opacity: 0.6;
-    }
-    
-    .control-panel {
-        background: rgba(30, 41, 59, 0.4);
-        backdrop-filter: blur(15px);
-        border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-        padding: 28px 32px;
-        position: relative;
-    }
-    
-    .control-header {
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        margin-bottom: 24px;
-    }
-    
-    .control-title {
-        font-size: 18px;
-        font-weight: 700;
-        color: #f1f5f9;
-        margin: 0;
-    }
-    
-    .control-subtitle {
-        font-size: 13px;
-        color: #64748b;
-        margin-top: 2px;
-    }
-    
-    .control-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-        gap: 32px;
-        align-items: end;
-    }
-    
-    .control-group {
-        display: flex;
-        flex-direction: column;
-        gap: 10px;
-        position: relative;
-    }
-    
-    .control-label {
-        font-size: 12px;
-        font-weight: 600;
-        color: #94a3b8;
-        text-transform: uppercase;
-        letter-spacing: 1.2px;
-        margin-bottom: 6px;
-        position: relative;
-    }
-    
-    .control-label::after {
-        content: '';
-        position: absolute;
-        bottom: -3px;
-        left: 0;
-        width: 20px;
-        height: 2px;
-        background: linear-gradient(90deg, #00d4ff, #ff00a8);
-        border-radius: 1px;
-    }
-    
-    /* Revolutionary Selectbox Styling */
-    .stSelectbox {
-        position: relative;
-    }
-    
-    .stSelectbox > div {
-        position: relative;
-    }
-    
-    .stSelectbox > div > div {
-        background: linear-gradient(135deg, rgba(30, 41, 59, 0.9) 0%, rgba(15, 23, 42, 0.9) 100%) !important;
-        border: 2px solid rgba(100, 116, 139, 0.3) !important;
-        border-radius: 16px !important;
-        backdrop-filter: blur(15px) !important;
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.2) !important;
-        position: relative;
-        overflow: hidden;
-    }
-    
-    .stSelectbox > div > div::before {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: -100%;
-        width: 100%;
-        height: 100%;
-        background: linear-gradient(90deg, transparent, rgba(0, 212, 255, 0.1), transparent);
-        transition: left 0.5s ease;
-        pointer-events: none;
-    }
-    
-    .stSelectbox > div > div:hover {
-        border-color: #00d4ff !important;
-        box-shadow: 0 8px 32px rgba(0, 212, 255, 0.2), 0 0 0 1px rgba(0, 212, 255, 0.3) !important;
-        transform: translateY(-2px);
-    }
-    
-    .stSelectbox > div > div:hover::before {
-        left: 100%;
-    }
-    
-    .stSelectbox > div > div > div {
-        color: #f1f5f9 !important;
-        font-weight: 600 !important;
-        font-size: 14px !important;
-        padding: 12px 16px !important;
-    }
-    
-    /* Selectbox dropdown styling */
-    .stSelectbox [data-baseweb="popover"] {
-        background: rgba(15, 23, 42, 0.95) !important;
-        backdrop-filter: blur(20px) !important;
-        border: 1px solid rgba(0, 212, 255, 0.3) !important;
-        border-radius: 16px !important;
-        box-shadow: 0 20px 60px rgba(0, 0, 0, 0.5) !important;
-    }
-    
-    .stSelectbox [role="option"] {
-        background: transparent !important;
-        color: #e2e8f0 !important;
-        transition: all 0.2s ease !important;
-        border-radius: 8px !important;
-        margin: 4px !important;
-    }
-    
-    .stSelectbox [role="option"]:hover {
-        background: rgba(0, 212, 255, 0.15) !important;
-        color: #00d4ff !important;
-    }
-    
-    .stSelectbox [aria-selected="true"] {
-        background: rgba(0, 212, 255, 0.2) !important;
-        color: #00d4ff !important;
-    }
-    
-    /* Chart Container */
-    .chart-content {
-        padding: 32px;
-        position: relative;
-    }
-    
-    .chart-header {
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        margin-bottom: 28px;
-        padding-bottom: 20px;
-        border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-    }
-    
-    .chart-title {
-        font-size: 28px;
-        font-weight: 800;
-        background: linear-gradient(135deg, #f1f5f9 0%, #cbd5e1 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        margin: 0;
-    }
-    
-    .chart-subtitle {
-        font-size: 14px;
-        color: #64748b;
-        margin-top: 6px;
-        font-weight: 400;
-    }
-    
-    .live-indicator {
-        display: flex;
-        align-items: center;
-        gap: 8px;
-        font-size: 13px;
-        color: #00ff88;
-        font-weight: 600;
-    }
-    
-    .live-dot {
-        width: 8px;
-        height: 8px;
-        background: #00ff88;
-        border-radius: 50%;
-        animation: pulse 2s infinite;
-        box-shadow: 0 0 10px #00ff88;
-    }
-    
-    /* Enhanced Metrics Grid */
-    .metrics-grid {
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-        gap: 28px;
-        margin: 40px 40px;
-    }
-    
-    .metric-card {
-        background: rgba(15, 20, 25, 0.7);
-        backdrop-filter: blur(25px);
-        border: 1px solid rgba(255, 255, 255, 0.1);
-        border-radius: 20px;
-        padding: 28px;
-        position: relative;
-        overflow: hidden;
-        transition: all 0.5s cubic-bezier(0.4, 0, 0.2, 1);
-        cursor: pointer;
-    }
-    
-    .metric-card::before {
-        content: '';
-        position: absolute;
-        top: -2px;
-        left: -2px;
-        right: -2px;
-        bottom: -2px;
-        background: linear-gradient(135deg, #00d4ff, #ff00a8, #00ff88, #00d4ff);
-        border-radius: 22px;
-        opacity: 0;
-        z-index: -1;
-        transition: opacity 0.3s ease;
-    }
-    
-    .metric-card::after {
-        content: '';
-        position: absolute;
-        top: 0;
-        left: 0;
-        right: 0;
-        bottom: 0;
-        background: rgba(15, 20, 25, 0.9);
-        border-radius: 20px;
-        z-index: -1;
-    }
-    
-    .metric-card:hover {
-        transform: translateY(-8px) scale(1.02);
-        box-shadow: 0 25px 80px rgba(0, 0, 0, 0.5);
-    }
-    
-    .metric-card:hover::before {
-        opacity: 1;
-    }
-    
-    /* Streamlit Metric Overrides */
-    div[data-testid="stMetric"] {
-        background: transparent !important;
-        border: none !important;
-        padding: 0 !important;
-        box-shadow: none !important;
-    }
-    
-    div[data-testid="stMetric"] label {
-        color: #94a3b8 !important;
-        font-size: 13px !important;
-        font-weight: 600 !important;
-        text-transform: uppercase !important;
-        letter-spacing: 1.2px !important;
-        margin-bottom: 12px !important;
-    }
-    
-    div[data-testid="stMetric"] div[data-testid="metric-container"] > div:first-child {
-        color: #f1f5f9 !important;
-        font-size: 36px !important;
-        font-weight: 800 !important;
-        line-height: 1.1 !important;
-        margin-bottom: 6px !important;
-        text-shadow: 0 0 20px rgba(255, 255, 255, 0.1);
-    }
-    
-    div[data-testid="stMetric"] div[data-testid="metric-container"] div[data-testid="metric-delta"] {
-        color: #00ff88 !important;
-        font-size: 15px !important;
-        font-weight: 700 !important;
-    }
-    
-    /* Plotly Chart Styling */
-    .stPlotlyChart {
-        border-radius: 16px;
-        overflow: hidden;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
-    }
-    
-    /* Custom scrollbar */
-    ::-webkit-scrollbar {
-        width: 10px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: rgba(30, 41, 59, 0.4);
-        border-radius: 5px;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: linear-gradient(135deg, #00d4ff, #ff00a8);
-        border-radius: 5px;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: linear-gradient(135deg, #ff00a8, #00d4ff);
-    }
-    
-    /* Responsive Design */
-    @media (max-width: 768px) {
-        .header-container {
-            padding: 20px;
-        }
-        
-        .chart-section {
-            margin: 20px;
-        }
-        
-        .control-panel, .chart-content {
-            padding: 24px;
-        }
-        
-        .metrics-grid {
-            margin: 24px 20px;
-            grid-template-columns: 1fr;
-        }
-        
-        .brand h1 {
-            font-size: 28px;
-        }
-        
-        .header-stats {
-            display: none;
-        }
-        
-        .control-grid {
-            grid-template-columns: 1fr;
-            gap: 20px;
-        }
-    }
-    
-    /* Loading Animation */
-    @keyframes pulse {
-        0%, 100% { opacity: 1; transform: scale(1); }
-        50% { opacity: 0.7; transform: scale(1.05); }
-    }
-    
-    .loading {
-        animation: pulse 2s infinite;
-    }
-    
-    /* Success/Error States */
-    .success-indicator {
-        color: #00ff88;
-    }
-    
-    .error-indicator {
-        color: #ff4757;
-    }
-    
-    /* Hide Streamlit Elements */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    .stDeployButton {display: none;}
-    
-    /* Status Badge */
-    .status-badge {
-        display: inline-flex;
-        align-items: center;
-        gap: 6px;
-        background: rgba(0, 255, 136, 0.1);
-        border: 1px solid rgba(0, 255, 136, 0.3);
-        border-radius: 20px;
-        padding: 6px 12px;
-        font-size: 11px;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.5px;
-        color: #00ff88;
-    }
-</style>
-""", unsafe_allow_html=True)
+use_stylesheet('price5')
 
 # Calculate current metrics for header
 current_price = price_df['Price'].iloc[-1]
@@ -707,7 +158,8 @@ elif time_range == "1Y":
 else:
     start_date = price_df['Date'].iloc[0]
 
-filtered_df = price_df[price_df['Date'] >= start_date]
+period_df = price_df[price_df['Date'] >= start_date]
+filtered_df = downsample_frame(period_df, ['Price'])
 
 # Create the enhanced chart
 fig = go.Figure()
@@ -745,7 +197,7 @@ fig.add_trace(go.Scatter(
                   'Date: %{text}<br>' +
                   'Price: $%{y:.6f}<br>' +
                   '<extra></extra>',
-    text=[d.strftime('%Y-%m-%d') for d in filtered_df['Date']],
+    text=filtered_df['Date'].dt.strftime('%Y-%m-%d'),
     showlegend=True,
     fill='tonexty' if len(fig.data) > 0 else None,
     fillcolor=f'rgba({",".join(map(str, [int(line_color[1:3], 16), int(line_color[3:5], 16), int(line_color[5:7], 16)]))}, 0.1)'
@@ -753,9 +205,9 @@ fig.add_trace(go.Scatter(
 
 # Add power law if enabled with enhanced features
 if show_power_law == "Show":
-    x_fit = filtered_df['days_from_genesis']
-    y_fit = a_price * np.power(x_fit, b_price)
-    fit_x = x_fit if x_scale_type == "Log" else filtered_df['Date']
+    x_fit, y_fit = power_law_curve(a_price, b_price, filtered_df['days_from_genesis'].min(),
+                                   filtered_df['days_from_genesis'].max(), log_x=x_scale_type == "Log")
+    fit_x = x_fit if x_scale_type == "Log" else days_to_dates(x_fit)
 
     # Main power law line
     fig.add_trace(go.Scatter(
@@ -918,6 +370,7 @@ fig.update_layout(
 
 # Display chart with container
 with st.container():
+    fig = apply_render_mode(fig)
     st.plotly_chart(fig, use_container_width=True, config={
         'displayModeBar': True,
         'displaylogo': False,
@@ -952,9 +405,9 @@ else:
     r2_pct_change = 0
 
 # Calculate additional metrics
-volatility_30d = filtered_df['Price'].pct_change().rolling(30).std().iloc[-1] * 100 if len(filtered_df) > 30 else 0
-max_price = filtered_df['Price'].max()
-min_price = filtered_df['Price'].min()
+volatility_30d = period_df['Price'].pct_change().rolling(30).std().iloc[-1] * 100 if len(period_df) > 30 else 0
+max_price = period_df['Price'].max()
+min_price = period_df['Price'].min()
 price_range_pct = ((max_price - min_price) / min_price) * 100
 
 # Enhanced Metrics Section
@@ -1069,7 +522,7 @@ st.markdown(f"""
         </p>
         <div style="display: flex; justify-content: center; gap: 40px; margin-bottom: 20px; flex-wrap: wrap;">
             <div style="text-align: center;">
-                <div style="color: #00d4ff; font-weight: 700; font-size: 16px;">{len(filtered_df):,}</div>
+                <div style="color: #00d4ff; font-weight: 700; font-size: 16px;">{len(period_df):,}</div>
                 <div style="color: #64748b; font-size: 12px; text-transform: uppercase;">Data Points</div>
             </div>
             <div style="text-align: center;">
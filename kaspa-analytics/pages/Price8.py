@@ -1,8 +1,11 @@
 import streamlit as st
 import plotly.graph_objects as go
-import numpy as np
 import pandas as pd
-from utils import fit_power_law, load_price_data
+from utils import fit_power_law, power_law_curve, days_to_dates
+from data_registry import get_price_data, get_power_law_fit
+from downsample import downsample_frame
+from chart_render import apply_render_mode
+from theme import use_stylesheet
 from datetime import datetime, timedelta
 
 st.set_page_config(
@@ -13,301 +16,20 @@ st.set_page_config(
 )
 
 # Data loading and processing
-if 'price_df' not in st.session_state or 'price_genesis_date' not in st.session_state:
-    try:
-        st.session_state.price_df, st.session_state.price_genesis_date = load_price_data()
-    except Exception as e:
-        st.error(f"Failed to load price data: {str(e)}")
-        st.stop()
-
-price_df = st.session_state.price_df
-genesis_date = st.session_state.price_genesis_date
+try:
+    price_df, genesis_date = get_price_data()
+except Exception as e:
+    st.error(f"Failed to load price data: {str(e)}")
+    st.stop()
 
 try:
-    a_price, b_price, r2_price = fit_power_law(price_df, y_col='Price')
+    a_price, b_price, r2_price = get_power_law_fit('price', 'Price')
 except Exception as e:
     st.error(f"Failed to calculate price power law: {str(e)}")
     st.stop()
 
 # Enhanced Custom CSS with Modern Design and Animated Title
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&display=swap');
-    
-    html, body, .stApp {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-        background: linear-gradient(135deg, #0a0e1a 0%, #1a1f2e 50%, #0f1419 100%);
-        color: #e2e8f0;
-        overflow-x: hidden;
-    }
-    
-    .stApp {
-        background-attachment: fixed;
-    }
-    
-    .main .block-container {
-        padding: 0 !important;
-        max-width: 100% !important;
-    }
-    
-    .stApp::before {
-        content: '';
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background-image: 
-            radial-gradient(circle at 20% 80%, rgba(120, 119, 198, 0.15) 0%, transparent 50%),
-            radial-gradient(circle at 80% 20%, rgba(255, 119, 198, 0.15) 0%, transparent 50%),
-            radial-gradient(circle at 40% 40%, rgba(120, 219, 255, 0.15) 0%, transparent 50%);
-        pointer-events: none;
-        z-index: -1;
-        animation: backgroundShift 20s ease-in-out infinite;
-    }
-    
-    @keyframes backgroundShift {
-        0%, 100% { opacity: 1; transform: translateX(0px) translateY(0px); }
-        50% { opacity: 0.8; transform: translateX(20px) translateY(-20px); }
-    }
-    
-    @keyframes shimmer {
-        0% {
-            background-position: -200% center;
-            text-shadow: 0 0 10px rgba(241, 245, 249, 0.3);
-        }
-        50% {
-            text-shadow: 
-                0 0 20px rgba(0, 212, 255, 0.6),
-                0 0 30px rgba(0, 212, 255, 0.4),
-                0 0 40px rgba(0, 212, 255, 0.2);
-        }
-        100% {
-            background-position: 200% center;
-            text-shadow: 0 0 10px rgba(241, 245, 249, 0.3);
-        }
-    }
-    
-    @keyframes glow {
-        0%, 100% {
-            text-shadow: 
-                0 0 10px rgba(241, 245, 249, 0.3),
-                0 0 20px rgba(0, 212, 255, 0.2),
-                0 0 30px rgba(0, 212, 255, 0.1);
-        }
-        50% {
-            text-shadow: 
-                0 0 20px rgba(241, 245, 249, 0.5),
-                0 0 30px rgba(0, 212, 255, 0.4),
-                0 0 40px rgba(0, 212, 255, 0.3),
-                0 0 50px rgba(0, 212, 255, 0.2);
-        }
-    }
-    
-    .chart-section {
-        margin: 12px 40px 28px 40px;
-        background: rgba(30, 41, 59, 0.4);
-        backdrop-filter: blur(25px);
-        border: none;
-        border-radius: 16px;
-        overflow: hidden;
-        box-shadow: 0 8px 32px rgba(0, 0, 0, 0.25);
-        position: relative;
-        transition: all 0.3s ease;
-    }
-    
-    /* Tightened header section with minimal vertical spacing */
-    .header-section {
-        padding: 15px 40px 15px 40px;  /* Consistent padding top/bottom */
-        background: transparent;
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        flex-wrap: wrap;
-        gap: 15px;
-        margin-bottom: 20px;  /* Added some margin for spacing */
-    }
-    
-    .title-container {
-        flex: 0 0 auto;
-    }
-    
-    .main-title {
-        font-size: 16px;
-        font-weight: 700;
-        color: #ffffff;
-        margin: 0;
-        letter-spacing: 0.5px;
-        text-align: left;
-        text-shadow: 0 0 8px rgba(255, 255, 255, 0.3);
-        position: relative;
-        white-space: nowrap;
-        line-height: 1.2;
-    }
-    
-    .controls-container {
-        display: flex;
-        gap: 20px;
-        align-items: center;
-        flex-wrap: wrap;
-        flex: 1;
-        justify-content: flex-end;
-    }
-    
-    .control-group {
-        display: flex;
-        flex-direction: column;
-        gap: 3px;
-        min-width: 120px;
-    }
-    
-    .control-label {
-        font-size: 11px;
-        font-weight: 600;
-        color: #94a3b8;
-        text-transform: uppercase;
-        letter-spacing: 1px;
-        margin-bottom: 0;
-        white-space: nowrap;
-        line-height: 1;
-    }
-    
-    .stSelectbox > div > div {
-        background: linear-gradient(135deg, rgba(30, 41, 59, 0.9) 0%, rgba(15, 23, 42, 0.9) 100%) !important;
-        border: 2px solid rgba(100, 116, 139, 0.3) !important;
-        border-radius: 12px !important;
-        backdrop-filter: blur(15px) !important;
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        box-shadow: 0 4px 16px rgba(0, 0, 0, 0.2) !important;
-        min-height: 26px !important;
-        width: 150px !important;
-        max-width: 250px !important;
-        min-width: 100px !important;
-    }
-    
-    .stSelectbox > div > div:hover {
-        border-color: #00d4ff !important;
-        box-shadow: 0 8px 32px rgba(0, 212, 255, 0.2), 0 0 0 1px rgba(0, 212, 255, 0.3) !important;
-        transform: translateY(-2px);
-    }
-    
-    .stSelectbox > div > div > div {
-        color: #f1f5f9 !important;
-        font-weight: 600 !important;
-        font-size: 13px !important;
-        padding: 8px 16px !important;
-    }
-    
-    .chart-content {
-        padding: 8px 28px;
-        position: relative;
-    }
-    
-    .metric-card {
-        background: rgba(30, 41, 59, 0.4) !important;
-        backdrop-filter: blur(25px) !important;
-        border: 1px solid rgba(255, 255, 255, 0.15) !important;
-        border-radius: 16px !important;
-        padding: 24px !important;
-        position: relative !important;
-        overflow: hidden !important;
-        transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1) !important;
-        cursor: pointer !important;
-        margin-bottom: 16px !important;
-        width: 100% !important;
-        box-sizing: border-box !important;
-        box-shadow: 0 4px 20px rgba(0, 0, 0, 0.2) !important;
-    }
-    
-    .metric-card:hover {
-        border-color: rgba(0, 212, 255, 0.4) !important;
-        box-shadow: 0 8px 32px rgba(0, 212, 255, 0.15), 0 0 0 1px rgba(0, 212, 255, 0.2) !important;
-        transform: translateY(-3px) !important;
-        background: rgba(30, 41, 59, 0.6) !important;
-    }
-    
-    .metric-label {
-        color: #94a3b8 !important;
-        font-size: 12px !important;
-        font-weight: 600 !important;
-        text-transform: uppercase !important;
-        letter-spacing: 1px !important;
-        margin-bottom: 10px !important;
-    }
-    
-    .metric-value {
-        color: #f1f5f9 !important;
-        font-size: 28px !important;
-        font-weight: 800 !important;
-        line-height: 1.1 !important;
-        margin-bottom: 6px !important;
-        text-shadow: 0 0 15px rgba(255, 255, 255, 0.1);
-    }
-    
-    .metric-delta {
-        font-size: 14px !important;
-        font-weight: 700 !important;
-        margin-bottom: 8px;
-    }
-    
-    .metric-delta.positive {
-        color: #00ff88 !important;
-    }
-    
-    .metric-delta.negative {
-        color: #ff4757 !important;
-    }
-    
-    .stPlotlyChart {
-        border-radius: 12px;
-        overflow: hidden;
-        box-shadow: 0 6px 24px rgba(0, 0, 0, 0.2);
-    }
-    
-    .stPlotlyChart .modebar {
-        background: transparent !important;
-        transform: translateY(10px) !important;
-    }
-    
-    .stPlotlyChart .modebar-group {
-        background: transparent !important;
-    }
-    
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    .stDeployButton {display: none;}
-    
-    /* Responsive design for smaller screens */
-    @media (max-width: 1200px) {
-        .header-section {
-            flex-direction: column;
-            align-items: flex-start;
-            gap: 12px;
-        }
-        
-        .controls-container {
-            width: 100%;
-            justify-content: flex-start;
-            gap: 16px;
-        }
-        
-        .control-group {
-            min-width: 100px;
-        }
-    }
-    
-    @media (max-width: 768px) {
-        .controls-container {
-            gap: 12px;
-        }
-        
-        .control-group {
-            min-width: 90px;
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
+use_stylesheet('price6')
 
 # Calculate current metrics for later use
 current_price = price_df['Price'].iloc[-1]
@@ -381,7 +103,7 @@ elif time_range == "1Y":
 else:
     start_date = price_df['Date'].iloc[0]
 
-filtered_df = price_df[price_df['Date'] >= start_date]
+filtered_df = downsample_frame(price_df[price_df['Date'] >= start_date], ['Price'])
 
 # Create the enhanced chart
 fig = go.Figure()
@@ -454,16 +176,16 @@ fig.add_trace(go.Scatter(
     name='Kaspa Price (USD)',
     line=dict(color='#00d4ff', width=3, shape='spline', smoothing=0.3),
     hovertemplate='<b>%{fullData.name}</b><br>Date: %{text}<br>Price: $%{y:.6f}<br><extra></extra>',
-    text=[d.strftime('%Y-%m-%d') for d in filtered_df['Date']],
+    text=filtered_df['Date'].dt.strftime('%Y-%m-%d'),
     showlegend=True,
     fillcolor='rgba(0, 212, 255, 0.1)'
 ))
 
 # Add power law if enabled - now with orange color and white dotted bands
 if show_power_law == "Show":
-    x_fit = filtered_df['days_from_genesis']
-    y_fit = a_price * np.power(x_fit, b_price)
-    fit_x = x_fit if x_scale_type == "Log" else filtered_df['Date']
+    x_fit, y_fit = power_law_curve(a_price, b_price, filtered_df['days_from_genesis'].min(),
+                                   filtered_df['days_from_genesis'].max(), log_x=x_scale_type == "Log")
+    fit_x = x_fit if x_scale_type == "Log" else days_to_dates(x_fit)
 
     fig.add_trace(go.Scatter(
         x=fit_x,
@@ -593,6 +315,7 @@ fig.update_layout(
 
 # Display chart
 with st.container():
+    fig = apply_render_mode(fig)
     st.plotly_chart(fig, use_container_width=True, config={
         'displayModeBar': True,
         'displaylogo': False,
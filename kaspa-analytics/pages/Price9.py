@@ -1,7 +1,8 @@
 import streamlit as st
 import plotly.graph_objects as go
-import numpy as np
 import pandas as pd
+from downsample import downsample_frame
+from chart_render import apply_render_mode
 from datetime import datetime, timedelta
 import sys
 import os
@@ -32,7 +33,8 @@ except ImportError:
         st.stop()
 
 try:
-    from utils import fit_power_law, load_price_data
+    from utils import fit_power_law, power_law_curve, days_to_dates
+    from data_registry import get_price_data, get_power_law_fit
 except ImportError:
     st.error("Cannot import utils. Please ensure utils.py is available.")
     st.stop()
@@ -51,18 +53,14 @@ render_clean_header()
 render_beautiful_sidebar(current_page="Price")
 
 # Data loading and processing
-if 'price_df' not in st.session_state or 'price_genesis_date' not in st.session_state:
-    try:
-        st.session_state.price_df, st.session_state.price_genesis_date = load_price_data()
-    except Exception as e:
-        st.error(f"Failed to load price data: {str(e)}")
-        st.stop()
-
-price_df = st.session_state.price_df
-genesis_date = st.session_state.price_genesis_date
+try:
+    price_df, genesis_date = get_price_data()
+except Exception as e:
+    st.error(f"Failed to load price data: {str(e)}")
+    st.stop()
 
 try:
-    a_price, b_price, r2_price = fit_power_law(price_df, y_col='Price')
+    a_price, b_price, r2_price = get_power_law_fit('price', 'Price')
 except Exception as e:
     st.error(f"Failed to calculate price power law: {str(e)}")
     st.stop()
@@ -272,7 +270,7 @@ elif time_range == "1Y":
 else:
     start_date = price_df['Date'].iloc[0]
 
-filtered_df = price_df[price_df['Date'] >= start_date]
+filtered_df = downsample_frame(price_df[price_df['Date'] >= start_date], ['Price'])
 
 # Create the enhanced chart
 fig = go.Figure()
@@ -345,16 +343,16 @@ fig.add_trace(go.Scatter(
     name='Kaspa Price (USD)',
     line=dict(color='#00d4ff', width=3, shape='spline', smoothing=0.3),
     hovertemplate='<b>%{fullData.name}</b><br>Date: %{text}<br>Price: $%{y:.6f}<br><extra></extra>',
-    text=[d.strftime('%Y-%m-%d') for d in filtered_df['Date']],
+    text=filtered_df['Date'].dt.strftime('%Y-%m-%d'),
     showlegend=True,
     fillcolor='rgba(0, 212, 255, 0.1)'
 ))
 
 # Add power law if enabled - now with orange color and white dotted bands
 if show_power_law == "Show":
-    x_fit = filtered_df['days_from_genesis']
-    y_fit = a_price * np.power(x_fit, b_price)
-    fit_x = x_fit if x_scale_type == "Log" else filtered_df['Date']
+    x_fit, y_fit = power_law_curve(a_price, b_price, filtered_df['days_from_genesis'].min(),
+                                   filtered_df['days_from_genesis'].max(), log_x=x_scale_type == "Log")
+    fit_x = x_fit if x_scale_type == "Log" else days_to_dates(x_fit)
 
     fig.add_trace(go.Scatter(
         x=fit_x,
@@ -483,6 +481,7 @@ fig.update_layout(
 
 # Display chart
 with st.container():
+    fig = apply_render_mode(fig)
     st.plotly_chart(fig, use_container_width=True, config={
         'displayModeBar': True,
         'displaylogo': False,
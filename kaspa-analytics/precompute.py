@@ -0,0 +1,63 @@
+"""
+Offline precompute job: every derived analytic the pages show, as a versioned artifact generation
+
+Probes and loads each series from the configured data source into the series
+store (reusing a stored copy under the same probe signature, as the servers
+do), then computes the price/hashrate merge, every power-law fit the pages
+use, the ratio deviation oscillator, the price residuals, the daily slope
+history and the chart aggregation levels, and writes them to the artifact
+store (KASPA_ARTIFACT_DIR). Servers serving the same series versions read the
+artifacts instead of computing; other versions are still computed on first use.
+
+Does nothing when the current artifacts were built from the series as they
+are now, so it can run from cron as often as the sheets change:
+
+    */15 * * * * cd /app && python precompute.py
+"""
+import argparse
+import logging
+import sys
+import time
+
+from data_registry import SERIES_LOADERS, SERIES_PROBES
+from analytics import build_artifacts
+from artifact_store import matching_manifest, write_artifacts, artifact_usage
+
+def probe_all():
+    """Current probe signature of every series"""
+    signatures = {}
+    for series, probe in SERIES_PROBES.items():
+        signatures[series] = probe()
+        if signatures[series] is None:
+            raise RuntimeError(f"no change signature for {series}; artifacts couldn't be matched to its version")
+    return signatures
+
+def run(force=False):
+    start = time.perf_counter()
+    signatures = probe_all()
+    current = matching_manifest(signatures)
+    if current is not None and not force:
+        print(f"Artifacts are current (generation {current['generation']}), nothing to do")
+        return None
+
+    series = {name: load(signatures[name]) for name, load in SERIES_LOADERS.items()}
+    loaded = time.perf_counter()
+    frames, fits = build_artifacts(series)
+    computed = time.perf_counter()
+    write_artifacts(frames, fits, signatures)
+    usage = artifact_usage()
+    print(f"Wrote generation {usage['generation']}: {usage['frames']} frames, {usage['fits']} fits, "
+          f"{usage['bytes'] / 1e6:.1f} MB")
+    print(f"load {loaded - start:.2f}s, compute {computed - loaded:.2f}s, write {time.perf_counter() - computed:.2f}s")
+    return usage
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--force', action='store_true', help='rebuild even when the series are unchanged')
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+    try:
+        run(args.force)
+    except Exception as e:
+        print(f"Precompute failed: {e}", file=sys.stderr)
+        sys.exit(1)
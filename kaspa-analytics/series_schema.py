@@ -0,0 +1,164 @@
+import logging
+import os
+import time
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+GENESIS_DATE = pd.Timestamp('2021-11-07', tz='UTC')
+NS_PER_DAY = 86_400 * 10**9
+
+# source: sheet header; name: output column; divisor: unit scaling applied after parsing
+Column = namedtuple('Column', ['source', 'name', 'dtype', 'divisor'], defaults=['float64', 1.0])
+
+# date_format is a strptime pattern, 'ISO8601', or None to infer the format
+# from the first date as pd.to_datetime does. The price, volume and market cap
+# sheets were read with inference before the schema and their live layout
+# isn't pinned down anywhere, so they keep it; only the hashrate sheet's
+# format was ever explicit.
+SeriesSchema = namedtuple('SeriesSchema', ['date_column', 'date_format', 'columns', 'sort'])
+
+SCHEMAS = {
+    'hashrate': SeriesSchema('Date', '%d %b %Y', [
+        Column('Hashrate (H/s)', 'Hashrate (H/s)'),
+        Column('Hashrate (H/s)', 'Hashrate_PH', divisor=1e15),
+    ], sort=False),
+    'price': SeriesSchema('Date', None, [
+        Column('Price', 'Price'),
+    ], sort=False),
+    'volume': SeriesSchema('date', None, [
+        Column('price', 'Price'),
+        Column('total_volume', 'Volume_USD'),
+    ], sort=True),
+    'marketcap': SeriesSchema('Date', None, [
+        Column('MarketCap', 'MarketCap'),
+        Column('MarketCap', 'MarketCap_B', divisor=1e9),
+    ], sort=False),
+}
+
+# A sheet losing more than this fraction of its non-blank rows to unparseable
+# or empty cells fails to load instead of serving what's left (the refresher
+# then keeps serving the previous copy): a wrong date format or a changed
+# column would otherwise quietly cut the history down
+MAX_REJECTED_FRACTION = float(os.environ.get("KASPA_MAX_REJECTED_FRACTION", 0.05))
+
+# invalid: non-empty cells that failed to parse; missing: empty cells
+IngestReport = namedtuple('IngestReport', [
+    'series', 'rows_read', 'rows_kept', 'invalid', 'missing', 'before_genesis', 'seconds'
+])
+
+# Last report per series, for the data registry readout
+last_reports = {}
+
+def _cells(body, position):
+    return np.array([row[position] if position < len(row) else '' for row in body], dtype=object)
+
+TIME_DIRECTIVES = ('%H', '%I', '%M', '%S', '%f', '%p', '%z', '%X', '%c')
+
+def _to_dates(cells, date_format):
+    if date_format not in (None, 'ISO8601') and not any(d in date_format for d in TIME_DIRECTIVES):
+        # Day-only dates repeat whenever a sheet has several rows per day:
+        # parse each distinct string once and broadcast back
+        codes, uniques = pd.factorize(cells)
+        dates = pd.to_datetime(uniques, format=date_format, utc=True, errors='coerce')
+        return np.asarray(dates.tz_localize(None), dtype='datetime64[ns]')[codes]
+    dates = pd.to_datetime(cells, format=date_format, utc=True, errors='coerce')
+    return np.asarray(dates.tz_localize(None), dtype='datetime64[ns]')
+
+def _to_float(cells):
+    try:
+        # C-level conversion; raises on the first empty or malformed cell
+        return cells.astype('float64')
+    except ValueError:
+        return pd.to_numeric(cells, errors='coerce').astype('float64')
+
+def ingest(series, rows, schema=None):
+    """
+    Parses sheet-layout rows (header row plus rows of strings) into a typed frame
+
+    Dates are parsed with the schema's format into UTC, values straight
+    into float arrays. Rows with an unparseable or empty date or value, and
+    rows before genesis, are dropped and counted in the returned
+    IngestReport; more than MAX_REJECTED_FRACTION of the non-blank rows
+    dropped that way raises ValueError.
+
+    Returns:
+        (df, report): df has Date, the schema columns and days_from_genesis
+    """
+    start = time.perf_counter()
+    schema = schema or SCHEMAS[series]
+    header, body = rows[0], rows[1:]
+    positions = {name: i for i, name in enumerate(header)}
+    sources = [schema.date_column] + [column.source for column in schema.columns]
+    missing_columns = [name for name in dict.fromkeys(sources) if name not in positions]
+    if missing_columns:
+        raise KeyError(f"{series} sheet is missing columns {missing_columns}")
+
+    invalid, missing = {}, {}
+    raw = {source: _cells(body, positions[source]) for source in dict.fromkeys(sources)}
+    empty = {source: (cells == '') for source, cells in raw.items()}
+    blank_rows = int(np.logical_and.reduce(list(empty.values())).sum()) if body else 0
+
+    dates = _to_dates(raw[schema.date_column], schema.date_format)
+    bad_date = np.isnat(dates)
+    invalid[schema.date_column] = int((bad_date & ~empty[schema.date_column]).sum())
+    missing[schema.date_column] = int(empty[schema.date_column].sum())
+    keep = ~bad_date
+
+    parsed = {}
+    for source in dict.fromkeys(column.source for column in schema.columns):
+        values = _to_float(raw[source])
+        bad = np.isnan(values)
+        invalid[source] = int((bad & ~empty[source]).sum())
+        missing[source] = int(empty[source].sum())
+        parsed[source] = values
+        keep &= ~bad
+
+    days = (dates - np.datetime64(GENESIS_DATE.tz_localize(None), 'ns')).astype('int64') // NS_PER_DAY
+    after_genesis = days >= 0
+    before_genesis = int((keep & ~after_genesis).sum())
+    keep &= after_genesis
+
+    data = {'Date': dates[keep]}
+    for column in schema.columns:
+        values = parsed[column.source][keep]
+        data[column.name] = (values / column.divisor if column.divisor != 1.0 else values).astype(column.dtype, copy=False)
+    data['days_from_genesis'] = days[keep]
+    if schema.sort:
+        order = np.argsort(data['Date'], kind='stable')
+        data = {name: values[order] for name, values in data.items()}
+
+    df = pd.DataFrame(data)
+    df['Date'] = df['Date'].dt.tz_localize('UTC')
+
+    report = IngestReport(series, len(body), len(df), invalid, missing, before_genesis,
+                          time.perf_counter() - start)
+    last_reports[series] = report
+    dropped = report.rows_read - report.rows_kept - before_genesis
+    if dropped:
+        details = (f"invalid {({k: v for k, v in invalid.items() if v})}, "
+                   f"missing {({k: v for k, v in missing.items() if v})}, {blank_rows} blank rows")
+        rejected = dropped - blank_rows
+        if rejected > MAX_REJECTED_FRACTION * (report.rows_read - blank_rows):
+            raise ValueError(f"{series}: {rejected} of {report.rows_read - blank_rows} rows failed to parse "
+                             f"({details}); check the sheet's columns and date format")
+        logger.warning("%s: dropped %d of %d rows (%s)", series, dropped, report.rows_read, details)
+    return df, report
+
+def ingest_reports():
+    """One row per ingested series: rows read and kept, per-column parse errors and parse time"""
+    rows = []
+    for series, report in last_reports.items():
+        rows.append({
+            'series': series,
+            'rows_read': report.rows_read,
+            'rows_kept': report.rows_kept,
+            'invalid': sum(report.invalid.values()),
+            'missing': sum(report.missing.values()),
+            'before_genesis': report.before_genesis,
+            'parse_s': round(report.seconds, 3),
+        })
+    return pd.DataFrame(rows, columns=['series', 'rows_read', 'rows_kept', 'invalid', 'missing',
+                                       'before_genesis', 'parse_s'])
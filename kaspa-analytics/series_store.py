@@ -0,0 +1,156 @@
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from series_schema import SCHEMAS, GENESIS_DATE, NS_PER_DAY
+
+# ===== COMPACT SERIES STORE =====
+# Each series is stored once on disk as plain .npy arrays: int32 day offsets
+# from genesis (plus int32 seconds into the day when a series is intraday) and
+# one array per distinct sheet column. Derived columns such as Hashrate_PH,
+# MarketCap_B and days_from_genesis are not stored. Arrays are opened
+# memory-mapped, so every server process on the machine shares one copy
+# through the OS page cache.
+#
+# <dir>/<series>/manifest.json names the current generation directory; a new
+# generation is written beside it and the manifest swapped atomically, so
+# readers that already mapped the old files keep a consistent copy.
+
+SERIES_STORE_DIR = Path(os.environ.get("KASPA_SERIES_DIR", Path(__file__).parent / ".cache" / "series"))
+KEEP_GENERATIONS = 2
+# Bumped when the file layout changes; other generations read as missing and get rewritten
+STORE_FORMAT = 3
+
+_write_lock = threading.Lock()
+
+def _series_dir(series):
+    return SERIES_STORE_DIR / series
+
+def _signature_key(signature):
+    return json.dumps(signature, default=str)
+
+def _sources(series):
+    """Distinct sheet columns of a series, each with the first schema Column read from it"""
+    sources = {}
+    for column in SCHEMAS[series].columns:
+        sources.setdefault(column.source, column)
+    return sources
+
+def write_series(series, df, signature=None):
+    """
+    Stores an ingested frame (Date plus the schema columns) as a new generation
+
+    signature is the change probe result the data was loaded under; open_series
+    only reuses a stored copy whose signature matches.
+    """
+    offsets = (df['Date'].dt.tz_convert('UTC').dt.tz_localize(None).to_numpy('datetime64[ns]')
+               - np.datetime64(GENESIS_DATE.tz_localize(None), 'ns')).astype('int64')
+    days = offsets // NS_PER_DAY
+    seconds = (offsets - days * NS_PER_DAY) // 10**9
+    arrays = {'days': days.astype('int32')}
+    if seconds.any():
+        arrays['seconds'] = seconds.astype('int32')
+
+    columns = {}
+    for i, (source, column) in enumerate(_sources(series).items()):
+        if column.name not in df:
+            raise KeyError(f"{series} frame is missing column {column.name!r}")
+        name = f"value_{i}"
+        values = df[column.name].to_numpy(column.dtype)
+        # stored in the sheet's unit; views divide again
+        arrays[name] = values * column.divisor if column.divisor != 1.0 else values
+        columns[source] = name
+
+    with _write_lock:
+        series_dir = _series_dir(series)
+        generation = f"{int(time.time())}-{uuid.uuid4().hex[:8]}"
+        tmp_dir = series_dir / f".{generation}.tmp"
+        tmp_dir.mkdir(parents=True)
+        for name, values in arrays.items():
+            np.save(tmp_dir / f"{name}.npy", values)
+        os.replace(tmp_dir, series_dir / generation)
+
+        manifest = {
+            'format': STORE_FORMAT,
+            'generation': generation,
+            'signature': _signature_key(signature),
+            'written_at': time.time(),
+            'rows': len(days),
+            'columns': columns,
+            'intraday': 'seconds' in arrays,
+        }
+        manifest_tmp = series_dir / "manifest.json.tmp"
+        manifest_tmp.write_text(json.dumps(manifest))
+        os.replace(manifest_tmp, series_dir / "manifest.json")
+        _prune(series_dir, generation)
+    return manifest
+
+def _prune(series_dir, current):
+    # Files still mapped by other processes stay readable after unlinking
+    generations = sorted(p for p in series_dir.iterdir() if p.is_dir() and not p.name.startswith('.'))
+    for path in generations:
+        if path.name != current and generations.index(path) < len(generations) - KEEP_GENERATIONS:
+            shutil.rmtree(path, ignore_errors=True)
+
+def _map(path):
+    # plain ndarray over the mapping, so results of arithmetic on it are ordinary arrays
+    return np.load(path, mmap_mode='r').view(np.ndarray)
+
+def read_manifest(series):
+    path = _series_dir(series) / "manifest.json"
+    return json.loads(path.read_text()) if path.exists() else None
+
+def open_series(series, signature=None, max_age=None):
+    """
+    Read-only DataFrame view over the stored copy of a series, or None if there
+    is none, its signature differs from `signature` (when given) or it is older
+    than max_age seconds
+
+    Value columns are the memory-mapped arrays themselves; Date, days_from_genesis
+    and unit-scaled columns are computed per view.
+    """
+    manifest = read_manifest(series)
+    if manifest is None or manifest.get('format') != STORE_FORMAT:
+        return None
+    if signature is not None and manifest['signature'] != _signature_key(signature):
+        return None
+    if max_age is not None and time.time() - manifest['written_at'] > max_age:
+        return None
+
+    generation_dir = _series_dir(series) / manifest['generation']
+    try:
+        days = _map(generation_dir / "days.npy")
+        stored = {source: _map(generation_dir / f"{name}.npy") for source, name in manifest['columns'].items()}
+        seconds = _map(generation_dir / "seconds.npy") if manifest['intraday'] else None
+    except FileNotFoundError:
+        return None  # pruned between reading the manifest and opening
+
+    offsets = days.astype('int64') * NS_PER_DAY
+    if seconds is not None:
+        offsets += seconds.astype('int64') * 10**9
+    dates = pd.DatetimeIndex(np.datetime64(GENESIS_DATE.tz_localize(None), 'ns') + offsets.astype('timedelta64[ns]'))
+
+    data = {'Date': dates.tz_localize('UTC')}
+    for column in SCHEMAS[series].columns:
+        values = stored[column.source]
+        data[column.name] = values / column.divisor if column.divisor != 1.0 else values
+    data['days_from_genesis'] = days
+    return pd.DataFrame(data, copy=False)
+
+def store_usage():
+    """Rows and on-disk bytes of the current generation of every stored series"""
+    rows = []
+    for series in SCHEMAS:
+        manifest = read_manifest(series)
+        if manifest is None:
+            continue
+        generation_dir = _series_dir(series) / manifest['generation']
+        nbytes = sum(p.stat().st_size for p in generation_dir.glob("*.npy")) if generation_dir.exists() else 0
+        rows.append({'series': series, 'rows': manifest['rows'], 'bytes': nbytes,
+                     'age_s': round(time.time() - manifest['written_at'])})
+    return pd.DataFrame(rows, columns=['series', 'rows', 'bytes', 'age_s'])
@@ -0,0 +1,91 @@
+"""
+Synthetic Kaspa metric histories for offline runs and scale testing
+
+Writes hashrate, price, volume and market cap files in the sheet layout read by
+data_sources.LocalFileSource. --scale multiplies today's row count by putting
+that many rows in each day since genesis, so 1000x still ends today.
+
+    python synthetic_history.py --scale 100
+    KASPA_DATA_SOURCE=local streamlit run app.py
+"""
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from data_sources import LOCAL_DATA_DIR, SHEET_COLUMNS
+
+GENESIS_DATE = pd.Timestamp('2021-11-07')
+MAX_SUPPLY = 28.7e9
+
+# Roughly the growth the real series have shown since genesis
+HASHRATE_START, HASHRATE_END = 2e12, 8e17   # H/s
+PRICE_START, PRICE_END = 2e-4, 0.1          # USD
+
+def synthetic_series(scale=1, end_date=None, seed=0):
+    """Returns {series: DataFrame of sheet-layout strings} with `scale` rows per day since genesis"""
+    rng = np.random.default_rng(seed)
+    end_date = pd.Timestamp(end_date or pd.Timestamp.now().normalize())
+    days = (end_date - GENESIS_DATE).days
+    n = days * scale
+
+    dates = GENESIS_DATE + pd.Timedelta(days=1) + pd.to_timedelta(np.arange(n) * (86400 / scale), unit='s')
+    t = np.linspace(0, 1, n)
+
+    # Power-law-ish trends with a random walk on top, in log space
+    step_sd = 0.04 / np.sqrt(scale)
+    hashrate = np.exp(np.log(HASHRATE_START) + np.log(HASHRATE_END / HASHRATE_START) * t ** 0.6
+                      + np.cumsum(rng.normal(0, step_sd, n)) * 0.5)
+    price = np.exp(np.log(PRICE_START) + np.log(PRICE_END / PRICE_START) * t ** 0.5
+                   + np.cumsum(rng.normal(0, step_sd * 1.5, n)))
+    volume = price * np.exp(rng.normal(np.log(2e9), 0.6, n))
+    supply = MAX_SUPPLY * (1 - np.exp(-3 * (t + 0.05)))
+    marketcap = price * supply
+
+    # Hashrate dates keep the sheet's day-only format, so above 1x a day repeats
+    daily_format = '%d %b %Y'
+    iso_format = '%Y-%m-%d' if scale == 1 else '%Y-%m-%d %H:%M:%S'
+    iso_dates = dates.strftime(iso_format)
+
+    frames = {
+        'hashrate': [dates.strftime(daily_format), hashrate],
+        'price': [iso_dates, price],
+        'volume': [iso_dates, price, volume],
+        'marketcap': [iso_dates, marketcap],
+    }
+    return {
+        series: pd.DataFrame({
+            column: values if column.lower() == 'date' else np.char.mod('%.10g', values)
+            for column, values in zip(SHEET_COLUMNS[series], columns)
+        })
+        for series, columns in frames.items()
+    }
+
+def write_synthetic_history(directory=LOCAL_DATA_DIR, scale=1, file_format='csv', end_date=None, seed=0):
+    """Writes every series to <directory>/<series>.<file_format> and returns the paths"""
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = {}
+    for series, df in synthetic_series(scale, end_date, seed).items():
+        path = directory / f"{series}.{file_format}"
+        if file_format == 'parquet':
+            df.to_parquet(path, index=False)
+        else:
+            df.to_csv(path, index=False)
+        paths[series] = path
+    return paths
+
+if __name__ == '__main__':
+    from pathlib import Path
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', type=int, default=1, help="rows per day since genesis (10-1000 for scale tests)")
+    parser.add_argument('--out', type=Path, default=LOCAL_DATA_DIR, help="output directory")
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv')
+    parser.add_argument('--end-date', default=None, help="last day of the history (default: today)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    paths = write_synthetic_history(args.out, args.scale, args.format, args.end_date, args.seed)
+    for series, path in paths.items():
+        print(f"{series:10s} {path}  {path.stat().st_size / 1e6:.1f} MB")
+    print(f"done in {time.perf_counter() - start:.1f}s")
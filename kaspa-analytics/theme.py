@@ -0,0 +1,85 @@
+import hashlib
+import logging
+from pathlib import Path
+import streamlit as st
+
+logger = logging.getLogger(__name__)
+
+# ===== STYLESHEETS =====
+# Page CSS lives in static/css and is served by Streamlit's static file serving
+# (server.enableStaticServing) under app/static. Pages attach it with
+# use_stylesheet, which emits a <link> per sheet: every rerun sends a line of
+# HTML instead of the whole sheet, and the browser downloads each sheet once.
+# The ?v= content hash makes an edited sheet load on the next rerun.
+#
+# Streamlit reads .streamlit/config.toml from the working directory, so both
+# kaspa-analytics/.streamlit and the repo root's .streamlit turn static serving
+# on, for `streamlit run app.py` and `streamlit run kaspa-analytics/app.py`.
+STATIC_DIR = Path(__file__).resolve().parent / 'static'
+STATIC_URL = 'app/static'
+
+# Vendored third-party sheets by name: local files, and the CDN copy used when
+# the app's static files can't be linked
+VENDOR_STYLESHEETS = {
+    'fontawesome': (
+        ['vendor/fontawesome/css/fontawesome.min.css', 'vendor/fontawesome/css/solid.min.css'],
+        'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.6.0/css/all.min.css',
+    ),
+}
+
+def _serves_css():
+    """
+    Whether app/static answers .css files as text/css. Streamlit's Tornado
+    server sends extensions outside its allow-list as text/plain with nosniff,
+    which browsers refuse to apply as a stylesheet.
+    """
+    try:
+        from streamlit.web.server.app_static_file_handler import SAFE_APP_STATIC_FILE_EXTENSIONS
+    except ImportError:
+        return True
+    return '.css' in SAFE_APP_STATIC_FILE_EXTENSIONS
+
+_warned = False
+
+def can_link_stylesheets():
+    global _warned
+    linked = bool(st.get_option('server.enableStaticServing')) and _serves_css()
+    if not linked and not _warned:
+        _warned = True
+        logger.warning("static serving is off or can't serve .css: page stylesheets are inlined on every "
+                       "rerun and Font Awesome loads from its CDN (set server.enableStaticServing)")
+    return linked
+
+@st.cache_data(show_spinner=False)
+def _read_stylesheet(path, mtime_ns):
+    css = (STATIC_DIR / path).read_text(encoding='utf-8')
+    return css, hashlib.md5(css.encode('utf-8')).hexdigest()[:10]
+
+def stylesheet_html(*names, linked=None):
+    """
+    HTML attaching stylesheets by name: static/css/<name>.css or a
+    VENDOR_STYLESHEETS entry. Without linkable static files, own sheets are
+    inlined as <style> and vendor sheets come from their CDN.
+    """
+    if linked is None:
+        linked = can_link_stylesheets()
+    tags = []
+    for name in names:
+        if name in VENDOR_STYLESHEETS:
+            paths, cdn_url = VENDOR_STYLESHEETS[name]
+            if not linked:
+                tags.append(f'<link rel="stylesheet" href="{cdn_url}">')
+                continue
+        else:
+            paths = [f'css/{name}.css']
+        for path in paths:
+            css, version = _read_stylesheet(path, (STATIC_DIR / path).stat().st_mtime_ns)
+            if linked:
+                tags.append(f'<link rel="stylesheet" href="{STATIC_URL}/{path}?v={version}">')
+            else:
+                tags.append(f'<style>\n{css}</style>')
+    return '\n'.join(tags)
+
+def use_stylesheet(*names):
+    """Attaches the named stylesheets to the page"""
+    st.markdown(stylesheet_html(*names), unsafe_allow_html=True)
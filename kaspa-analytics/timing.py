@@ -0,0 +1,169 @@
+import contextlib
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque, namedtuple
+import plotly.graph_objects as go
+import streamlit as st
+from metrics import record_rerun
+
+try:
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+except ImportError:
+    get_script_run_ctx = lambda: None
+
+# ===== TIMING SPANS =====
+# span() times a block and timed() a function. Every finished span is kept in
+# its thread's recent spans, which timing_panel turns into a waterfall of the
+# rerun, and with KASPA_TIMING_LOG set it is also logged as one JSON line for
+# aggregation. Streamlit starts a new script thread for every rerun, so a run
+# that stops before timing_panel (e.g. on an exception) drops its spans with
+# its thread; only the JSON log keeps them.
+#
+#   with span('parse', series='price'):
+#       ...
+#
+# Spans inside a cached function only run on a miss; on a hit the enclosing
+# span shows the cache lookup instead.
+
+TIMING_LOG = os.environ.get("KASPA_TIMING_LOG", "") not in ("", "0")
+TIMING_PANEL = os.environ.get("KASPA_TIMING_PANEL", "") not in ("", "0")
+MAX_SPANS = 500
+
+logger = logging.getLogger(__name__)
+if TIMING_LOG and not logger.handlers:
+    # Bare JSON lines, so log shippers can parse them as is
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+# start and end are perf_counter seconds; depth is 0 for outermost spans
+Span = namedtuple('Span', ['name', 'start', 'end', 'depth', 'fields'])
+
+_local = threading.local()
+
+def _thread_spans():
+    if not hasattr(_local, 'spans'):
+        _local.spans = deque(maxlen=MAX_SPANS)
+        _local.depth = 0
+    return _local
+
+def _log_span(finished):
+    ctx = get_script_run_ctx()
+    record = {
+        'ts': round(time.time(), 3),
+        'span': finished.name,
+        'ms': round((finished.end - finished.start) * 1000, 2),
+        'depth': finished.depth,
+        'session': getattr(ctx, 'session_id', None),
+        'page': getattr(ctx, 'page_script_hash', None),
+        'thread': threading.current_thread().name,
+    }
+    record.update(finished.fields)
+    logger.info(json.dumps(record, default=str))
+
+@contextlib.contextmanager
+def span(name, **fields):
+    """
+    Times the enclosed block as `name`; fields (e.g. series='price') are
+    logged with it, and the block may add more to the yielded dict
+    """
+    state = _thread_spans()
+    depth = state.depth
+    state.depth += 1
+    start = time.perf_counter()
+    try:
+        yield fields
+    finally:
+        state.depth = depth
+        finished = Span(name, start, time.perf_counter(), depth, fields)
+        state.spans.append(finished)
+        if TIMING_LOG:
+            _log_span(finished)
+
+def timed(name=None):
+    """Decorator timing each call as a span named `name` (the function's name by default)"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name or func.__name__):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def start_rerun(page):
+    """
+    Marks the start of a full rerun of `page`; timing_panel, called last on
+    the page, records it as a 'rerun' span and in the rerun metrics
+    """
+    _thread_spans().rerun = (page, time.perf_counter())
+
+def _finish_rerun():
+    state = _thread_spans()
+    page, start = getattr(state, 'rerun', None) or (None, None)
+    state.rerun = None
+    if page is None:
+        return
+    finished = Span('rerun', start, time.perf_counter(), 0, {'page': page})
+    record_rerun(page, finished.end - finished.start)
+    if TIMING_LOG:
+        _log_span(finished)
+
+def take_spans():
+    """Spans this thread finished since the last call, in start order"""
+    state = _thread_spans()
+    spans = sorted(state.spans, key=lambda s: s.start)
+    state.spans.clear()
+    return spans
+
+# ===== TIMING PANEL =====
+def timing_panel_enabled():
+    # st.query_params is newer than the oldest Streamlit the app supports
+    return TIMING_PANEL or getattr(st, 'query_params', {}).get('timing') not in (None, '', '0')
+
+def waterfall_figure(spans):
+    """Horizontal bars of each span's offset and duration from the first span's start"""
+    origin = spans[0].start
+    labels = [f"{'· ' * s.depth}{s.name} {' '.join(str(v) for v in s.fields.values())}".rstrip() for s in spans]
+    fig = go.Figure(go.Bar(
+        y=list(range(len(spans))),
+        x=[(s.end - s.start) * 1000 for s in spans],
+        base=[(s.start - origin) * 1000 for s in spans],
+        orientation='h',
+        marker_color=['#00FFCC' if s.depth == 0 else '#FFA726' for s in spans],
+        hovertext=[f"{label}: {(s.end - s.start) * 1000:.1f} ms" for label, s in zip(labels, spans)],
+        hoverinfo='text',
+    ))
+    fig.update_layout(
+        plot_bgcolor='#262730',
+        paper_bgcolor='#262730',
+        font_color='#e0e0e0',
+        height=max(160, 22 * len(spans) + 60),
+        margin=dict(l=10, r=10, t=10, b=30),
+        xaxis=dict(title='ms', gridcolor='#3A3C4A'),
+        yaxis=dict(tickvals=list(range(len(spans))), ticktext=labels, autorange='reversed'),
+        showlegend=False,
+    )
+    return fig
+
+def timing_panel():
+    """
+    Sidebar waterfall of the spans recorded since the previous panel, i.e.
+    this rerun; opt in with KASPA_TIMING_PANEL=1 or ?timing=1. Call it last
+    on the page.
+    """
+    _finish_rerun()
+    spans = take_spans()
+    if not timing_panel_enabled():
+        return
+    if not spans:
+        st.sidebar.caption("Rerun timings: nothing timed ran, everything came from caches")
+        return
+    total_ms = (max(s.end for s in spans) - spans[0].start) * 1000
+    with st.sidebar.expander(f"Rerun timings ({total_ms:.0f} ms)", expanded=True):
+        st.plotly_chart(waterfall_figure(spans), use_container_width=True)
@@ -1,108 +1,51 @@
 import pandas as pd
 import numpy as np
-import gspread
-from google.oauth2 import service_account
-from scipy.stats import linregress
-import streamlit as st
-
-# Shared authentication function
-def get_gspread_client():
-    credentials = service_account.Credentials.from_service_account_info(
-        st.secrets["gcp_service_account"],
-        scopes=["https://www.googleapis.com/auth/spreadsheets"],
-    )
-    return gspread.authorize(credentials)
+from data_sources import get_data_source
+from series_schema import ingest, GENESIS_DATE
+from timing import span, timed
+from metrics import sheet_request
 
 # ===== DATA LOADING FUNCTIONS =====
-@st.cache_data(ttl=3600)
-def load_data():
-    gc = get_gspread_client()
-    sheet_id = "1NPwQh2FQKVES7OYUzKQLKwuOrRuIivGhOtQWZZ-Sp80"
-    worksheet = gc.open_by_key(sheet_id).worksheet("kaspa_daily_hashrate (3)")
-    data = worksheet.get_all_values()
-    
-    df = pd.DataFrame(data[1:], columns=data[0])
-    df = df[['Date', 'Hashrate (H/s)']]
-    
-    df['Date'] = pd.to_datetime(df['Date'], format='%d %b %Y', utc=True)
-    df['Hashrate (H/s)'] = df['Hashrate (H/s)'].astype(float)
-    
-    genesis_date = pd.to_datetime('2021-11-07', utc=True)
-    df['days_from_genesis'] = (df['Date'] - genesis_date).dt.days
-    df = df[df['days_from_genesis'] >= 0]
-    df['Hashrate_PH'] = df['Hashrate (H/s)'] / 1e15
-    
-    return df, genesis_date
-
-@st.cache_data(ttl=3600)
-def load_price_data():
-    gc = get_gspread_client()
-    price_sheet_id = "1rMBuWn0CscUZkcKy2gleH85rXSO6U4YOSk3Sz2KuR_s"
-    price_worksheet_name = "kaspa_daily_price"
-    worksheet = gc.open_by_key(price_sheet_id).worksheet(price_worksheet_name)
-    data = worksheet.get_all_values()
-    
-    df = pd.DataFrame(data[1:], columns=data[0])
-    df = df[['Date', 'Price']]
-    
-    df['Date'] = pd.to_datetime(df['Date'], utc=True)
-    df['Price'] = df['Price'].astype(float)
-    
-    genesis_date = pd.to_datetime('2021-11-07', utc=True)
-    df['days_from_genesis'] = (df['Date'] - genesis_date).dt.days
-    df = df[df['days_from_genesis'] >= 0]
-    
-    return df, genesis_date
-
-@st.cache_data(ttl=3600)
-def load_volume_data():
-    gc = get_gspread_client()
-    volume_sheet_id = "1IdAmETrtZ8_lCuSQwEyDLtMIGiQbJFOyGGpMa9_hxZc"
-    volume_worksheet_name = "KAS_VOLUME_ETC"
-    worksheet = gc.open_by_key(volume_sheet_id).worksheet(volume_worksheet_name)
-    data = worksheet.get_all_values()
-    
-    df = pd.DataFrame(data[1:], columns=data[0])
-    df = df[['date', 'price', 'total_volume']]
-    df = df.rename(columns={
-        'date': 'Date',
-        'price': 'Price',
-        'total_volume': 'Volume_USD'
-    })
-    
-    df['Date'] = pd.to_datetime(df['Date'], utc=True)
-    df['Price'] = pd.to_numeric(df['Price'], errors='coerce')
-    df['Volume_USD'] = pd.to_numeric(df['Volume_USD'], errors='coerce')
-    df = df.dropna()
-    
-    genesis_date = pd.to_datetime('2021-11-07', utc=True)
-    df['days_from_genesis'] = (df['Date'] - genesis_date).dt.days
-    df = df[df['days_from_genesis'] >= 0]
-    
-    return df.sort_values('Date').reset_index(drop=True)
-
-@st.cache_data(ttl=3600)
-def load_marketcap_data():
-    gc = get_gspread_client()
-    marketcap_sheet_id = "15BZcsswJPZZF2MQ6S_m9CtbHPtVJVcET_VjZ9_aJ8nY"
-    marketcap_worksheet_name = "kaspa_market_cap"
-    worksheet = gc.open_by_key(marketcap_sheet_id).worksheet(marketcap_worksheet_name)
-    data = worksheet.get_all_values()
-    
-    df = pd.DataFrame(data[1:], columns=data[0])
-    df = df[['Date', 'MarketCap']]
-    
-    df['Date'] = pd.to_datetime(df['Date'], utc=True)
-    df['MarketCap'] = df['MarketCap'].astype(float)
-    
-    genesis_date = pd.to_datetime('2021-11-07', utc=True)
-    df['days_from_genesis'] = (df['Date'] - genesis_date).dt.days
-    df = df[df['days_from_genesis'] >= 0]
-    df['MarketCap_B'] = df['MarketCap'] / 1e9
-    
-    return df, genesis_date
+# Each fetch_* reads its series in sheet layout from the configured data source
+# and parses it with the declarative schema in series_schema
+def _read_series(series):
+    with span('fetch', series=series), sheet_request(series, 'read'):
+        rows = get_data_source().read(series)
+    with span('parse', series=series):
+        df, _ = ingest(series, rows)
+    return df
+
+def fetch_data():
+    return _read_series('hashrate'), GENESIS_DATE
+
+def fetch_price_data():
+    return _read_series('price'), GENESIS_DATE
+
+def fetch_volume_data():
+    return _read_series('volume')
+
+def fetch_marketcap_data():
+    return _read_series('marketcap'), GENESIS_DATE
+
+# ===== CHANGE PROBES =====
+def _probe_series(series):
+    with sheet_request(series, 'probe'):
+        return get_data_source().probe(series)
+
+def probe_data():
+    return _probe_series('hashrate')
+
+def probe_price_data():
+    return _probe_series('price')
+
+def probe_volume_data():
+    return _probe_series('volume')
+
+def probe_marketcap_data():
+    return _probe_series('marketcap')
 
 # ===== ANALYSIS FUNCTIONS =====
+@timed()
 def fit_power_law(df, y_col='Hashrate_PH', x_col=None):
     """
     Fits a power law y = a*x^b to the data
@@ -123,18 +66,80 @@ def fit_power_law(df, y_col='Hashrate_PH', x_col=None):
     if len(valid_data) < 2:
         raise ValueError("Not enough valid data points for power law fitting")
     
-    # Perform linear regression on log-transformed data
-    slope, intercept, r_value, _, _ = linregress(
-        np.log(valid_data[x_col]),
-        np.log(valid_data[y_col]))
+    # Least-squares line through the log-transformed data (what
+    # scipy.stats.linregress computes, without importing scipy.stats)
+    log_x = np.log(valid_data[x_col].to_numpy(dtype='float64'))
+    log_y = np.log(valid_data[y_col].to_numpy(dtype='float64'))
+    dx = log_x - log_x.mean()
+    dy = log_y - log_y.mean()
+    sxy, sxx, syy = dx @ dy, dx @ dx, dy @ dy
+    if sxx == 0:
+        raise ValueError("Cannot fit a power law when all x values are identical")
+    slope = sxy / sxx
+    intercept = log_y.mean() - slope * log_x.mean()
     
     # Convert back to power law coefficients
     a = np.exp(intercept)
     b = slope
-    r2 = r_value**2
+    r2 = sxy * sxy / (sxx * syy) if syy > 0 else 0.0
     
     return a, b, r2
 
+# ===== FIT CURVES =====
+# A fitted power law is smooth, so overlays are drawn from a few hundred
+# samples instead of being evaluated at every data point
+FIT_CURVE_POINTS = 200
+FIT_POINTS_PER_DECADE = 60
+MIN_FIT_POINTS = 20
+
+def fit_curve_x(x_min, x_max, log_x=False, max_points=FIT_CURVE_POINTS):
+    """
+    x positions for drawing a fitted curve between x_min and x_max
+
+    Log-spaced with a fixed density per decade on log axes (starting at 1 when
+    the range reaches 0, which a log axis can't show), evenly spaced otherwise.
+    """
+    x_min, x_max = float(x_min), float(x_max)
+    if not log_x:
+        return np.linspace(x_min, x_max, max_points)
+    if x_min <= 0:
+        x_min = 1.0
+    x_max = max(x_max, x_min)
+    decades = np.log10(x_max / x_min)
+    n_points = int(np.clip(np.ceil(decades * FIT_POINTS_PER_DECADE), MIN_FIT_POINTS, max_points))
+    return np.logspace(np.log10(x_min), np.log10(x_max), n_points)
+
+def power_law_curve(a, b, x_min, x_max, log_x=False, max_points=FIT_CURVE_POINTS):
+    """(x, y) samples of y = a*x^b for plotting a fit and its deviation bands"""
+    x = fit_curve_x(x_min, x_max, log_x, max_points)
+    return x, a * np.power(x, b)
+
+def days_to_dates(days, origin=GENESIS_DATE):
+    """Dates for (possibly fractional) day offsets, to put fit curves on a date axis"""
+    # A Series of whole seconds, like the data columns: plotly serializes a
+    # DatetimeIndex or sub-second timestamps element by element
+    seconds = np.round(np.asarray(days, dtype='float64') * 86_400)
+    return pd.Series(origin + pd.to_timedelta(seconds, unit='s'))
+
+@timed()
+def calculate_daily_power_law(df, y_col='Volume_USD', date_col='Date'):
+    """Fits the power law on every expanding window ending at each date, giving the slope/R² history"""
+    results = []
+    # One span for the whole history rather than one per window
+    fit = fit_power_law.__wrapped__
+    for date in df[date_col].unique():
+        daily_df = df[df[date_col] <= date]
+        try:
+            a, b, r2 = fit(daily_df, y_col=y_col)
+            results.append({
+                'Date': date,
+                'Slope': b,
+                'R2': r2
+            })
+        except:
+            continue
+    return pd.DataFrame(results)
+
 def calculate_growth_metrics(df, value_col='Price', date_col='Date'):
     """Calculate periodic growth rates and volatility"""
     df = df.sort_values(date_col).copy()
@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+
+SOMPI_PER_KAS = 100_000_000
+
+# Post-Crescendo the network produces 10 blocks (DAA score units) per second
+DAA_SCORE_PER_SECOND = 10
+
+# Size buckets in KAS, one decade per bucket
+SIZE_BUCKET_EDGES_KAS = np.array([0, 0.001, 0.01, 0.1, 1, 10, 100, 1_000, 10_000, 100_000, 1_000_000, np.inf])
+
+# Age buckets in days, DAA score distances are converted to days on use
+AGE_BUCKET_EDGES_DAYS = np.array([0, 1, 7, 30, 90, 180, 365, 730, np.inf])
+
+DEFAULT_DUST_THRESHOLD_KAS = 0.1
+
+
+def _scalar(value):
+    """The API has returned amounts both as plain strings and as one-element lists"""
+    if isinstance(value, list):
+        return value[0] if value else 0
+    return value if value is not None else 0
+
+
+def parse_utxos(utxos_data):
+    """
+    Parses the /addresses/{address}/utxos response into column arrays
+
+    Args:
+        utxos_data: List of UTXO dicts as returned by the API
+
+    Returns:
+        dict with int64 'amount' (sompi) and 'block_daa_score' arrays, a bool
+        'is_coinbase' array and object arrays for 'transaction_id' and 'index'
+    """
+    entries = [utxo for utxo in utxos_data if isinstance(utxo, dict) and isinstance(utxo.get('utxoEntry'), dict)]
+    count = len(entries)
+
+    amount = np.fromiter(
+        (int(_scalar(utxo['utxoEntry'].get('amount'))) for utxo in entries),
+        dtype=np.int64, count=count)
+    block_daa_score = np.fromiter(
+        (int(_scalar(utxo['utxoEntry'].get('blockDaaScore'))) for utxo in entries),
+        dtype=np.int64, count=count)
+    is_coinbase = np.fromiter(
+        (bool(utxo['utxoEntry'].get('isCoinbase', False)) for utxo in entries),
+        dtype=bool, count=count)
+    transaction_id = np.array(
+        [(utxo.get('outpoint') or {}).get('transactionId', '') for utxo in entries], dtype=object)
+    index = np.array(
+        [(utxo.get('outpoint') or {}).get('index', '') for utxo in entries], dtype=object)
+
+    return {
+        'amount': amount,
+        'block_daa_score': block_daa_score,
+        'is_coinbase': is_coinbase,
+        'transaction_id': transaction_id,
+        'index': index,
+    }
+
+
+def _bucket_labels(edges, unit, fmt):
+    labels = []
+    for low, high in zip(edges[:-1], edges[1:]):
+        if np.isinf(high):
+            labels.append(f"≥ {fmt(low)} {unit}")
+        else:
+            labels.append(f"{fmt(low)} – {fmt(high)} {unit}")
+    return labels
+
+
+def size_histogram(amount, edges_kas=SIZE_BUCKET_EDGES_KAS):
+    """Counts UTXOs and sums their value per size bucket"""
+    amount_kas = amount / SOMPI_PER_KAS
+    bucket = np.digitize(amount_kas, edges_kas[1:-1])
+    n_buckets = len(edges_kas) - 1
+    counts = np.bincount(bucket, minlength=n_buckets)
+    totals = np.bincount(bucket, weights=amount_kas, minlength=n_buckets)
+
+    return pd.DataFrame({
+        'bucket': _bucket_labels(edges_kas, 'KAS', lambda v: f"{v:,.0f}" if v >= 1 else f"{v:g}"),
+        'utxos': counts,
+        'total_kas': totals,
+    })
+
+
+def age_distribution(block_daa_score, virtual_daa_score, edges_days=AGE_BUCKET_EDGES_DAYS):
+    """
+    Buckets UTXOs by age, measured as the DAA score distance to the virtual tip
+
+    Ages are reported in days assuming DAA_SCORE_PER_SECOND.
+    """
+    age_days = np.clip(virtual_daa_score - block_daa_score, 0, None) / (DAA_SCORE_PER_SECOND * 86_400)
+    bucket = np.digitize(age_days, edges_days[1:-1])
+    counts = np.bincount(bucket, minlength=len(edges_days) - 1)
+
+    return pd.DataFrame({
+        'bucket': _bucket_labels(edges_days, 'days', lambda v: f"{v:g}"),
+        'utxos': counts,
+    })
+
+
+def dust_summary(amount, threshold_kas=DEFAULT_DUST_THRESHOLD_KAS):
+    """Counts UTXOs below the dust threshold and the value locked in them"""
+    is_dust = amount < int(threshold_kas * SOMPI_PER_KAS)
+    dust_count = int(np.count_nonzero(is_dust))
+
+    return {
+        'dust_count': dust_count,
+        'dust_share': dust_count / len(amount) if len(amount) else 0.0,
+        'dust_kas': float(amount[is_dust].sum()) / SOMPI_PER_KAS,
+    }
+
+
+def utxo_table(parsed, limit=None):
+    """Builds a display table, largest UTXOs first"""
+    order = np.argsort(parsed['amount'])[::-1]
+    if limit is not None:
+        order = order[:limit]
+
+    return pd.DataFrame({
+        'transaction_id': parsed['transaction_id'][order],
+        'index': parsed['index'][order],
+        'amount': parsed['amount'][order] / SOMPI_PER_KAS,
+        'block_daa_score': parsed['block_daa_score'][order],
+        'is_coinbase': parsed['is_coinbase'][order],
+    })
@@ -0,0 +1,138 @@
+import pandas as pd
+from datetime import datetime
+
+# ===== ADDRESS HISTORY =====
+# Turns full-transactions-page results into an address's balance history and
+# average purchase price, for the wallet tracker page
+
+def safe_get(data, *keys, default=None):
+    for key in keys:
+        try:
+            data = data[key]
+        except (KeyError, TypeError, IndexError):
+            return default
+    return data
+
+def format_timestamp(timestamp_ms):
+    try:
+        if isinstance(timestamp_ms, (int, float, str)):
+            if isinstance(timestamp_ms, str) and timestamp_ms.isdigit():
+                timestamp_ms = int(timestamp_ms)
+            return datetime.fromtimestamp(int(timestamp_ms)/1000).strftime('%Y-%m-%d %H:%M:%S')
+        return "N/A"
+    except:
+        return "N/A"
+
+def extract_net_changes(transactions, address):
+    history = []
+    for tx in transactions:
+        inputs = safe_get(tx, 'inputs', default=[])
+        outputs = safe_get(tx, 'outputs', default=[])
+        timestamp = safe_get(tx, 'block_time', default=None)
+        tx_id = safe_get(tx, 'transaction_id', default='')
+
+        if not timestamp:
+            continue
+
+        net_change = 0
+        for out in outputs:
+            out_address = safe_get(out, 'script_public_key_address', default='')
+            if out_address == address:
+                amount = float(safe_get(out, 'amount', default=0)) / 1e8
+                net_change += amount
+
+        for inp in inputs:
+            in_address = safe_get(inp, 'previous_outpoint_address', default='')
+            if in_address == address:
+                amount = float(safe_get(inp, 'previous_outpoint_amount', default=0)) / 1e8
+                net_change -= amount
+
+        history.append({
+            'timestamp': timestamp,
+            'datetime': format_timestamp(timestamp),
+            'net_change': net_change,
+            'transaction_id': tx_id,
+            'direction': 'in' if net_change > 0 else 'out'
+        })
+
+    return history
+
+def compute_balance_from_current(current_balance, history):
+    history = sorted(history, key=lambda x: x['timestamp'], reverse=True)
+    balance = current_balance
+    for tx in history:
+        tx['balance'] = balance
+        balance -= tx['net_change']
+    return history[::-1]
+
+def calculate_average_purchase_price_over_time(transactions, price_history):
+    """Calculate average purchase price over time with each transaction"""
+    if not price_history or not transactions:
+        return None
+        
+    # Create a DataFrame with price history for easy lookup
+    price_df = pd.DataFrame(price_history)
+    price_df['date'] = pd.to_datetime(price_df['timestamp'], unit='ms')
+    
+    # Process transactions in chronological order
+    transactions_sorted = sorted(transactions, key=lambda x: x['timestamp'])
+    
+    total_kas = 0
+    total_cost = 0
+    avg_price_history = []
+    
+    for tx in transactions_sorted:
+        if tx['direction'] == 'in' and tx['net_change'] > 0:
+            tx_date = datetime.fromtimestamp(tx['timestamp']/1000)
+            
+            # Find the closest price date before the transaction
+            price_row = price_df[price_df['date'] <= tx_date].sort_values('date', ascending=False).head(1)
+            
+            if not price_row.empty:
+                price = price_row.iloc[0]['price']
+                kas_amount = tx['net_change']
+                total_kas += kas_amount
+                total_cost += kas_amount * price
+                
+                if total_kas > 0:
+                    current_avg = total_cost / total_kas
+                else:
+                    current_avg = 0
+                
+                avg_price_history.append({
+                    'timestamp': tx['timestamp'],
+                    'datetime': tx['datetime'],
+                    'avg_purchase_price': current_avg,
+                    'transaction_id': tx['transaction_id'],
+                    'kas_amount': kas_amount,
+                    'price_at_purchase': price
+                })
+    
+    return avg_price_history
+
+def daily_balance_history(df, start_date):
+    """
+    Balance at the end of each day from start_date to the last transaction
+
+    df holds one row per transaction, sorted by 'timestamp', with the balance
+    after it in 'balance'; days before the first transaction have balance 0.
+    """
+    max_date = df['timestamp'].max().date()
+    date_range = pd.date_range(start=start_date, end=max_date, freq='D')
+    
+    daily_balance = []
+    current_balance_val = 0
+    tx_idx = 0
+    
+    for date in date_range:
+        # Apply all transactions up to this date
+        while tx_idx < len(df) and df.iloc[tx_idx]['timestamp'].date() <= date.date():
+            current_balance_val = df.iloc[tx_idx]['balance']
+            tx_idx += 1
+        
+        daily_balance.append({
+            'date': date,
+            'balance': current_balance_val
+        })
+    
+    return pd.DataFrame(daily_balance)